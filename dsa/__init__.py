@@ -0,0 +1 @@
+"""Data structures & algorithms solutions, grouped by topic (see dsa.arrays_and_hashing)."""
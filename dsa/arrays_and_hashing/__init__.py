@@ -0,0 +1,124 @@
+"""
+Arrays & hashing solutions as an importable package.
+
+The solution files live in hyphenated folders (two-sum/two-sum.py) so they
+read well as a study guide, but hyphens aren't valid module names. This
+package maps each file to a proper submodule and exports every public
+solution lazily:
+
+    from dsa.arrays_and_hashing import twoSumAuto          # loads two_sum only
+    import dsa.arrays_and_hashing.valid_sudoku as sudoku   # a whole submodule
+
+Nothing is loaded at `import dsa.arrays_and_hashing` time - no solution
+file, no NumPy, no heapq. The first access to a name imports just the file
+that defines it (module __getattr__, PEP 562). Names aren't copied into the
+package: every access reads the submodule's current attribute, so functions
+swapped by profiling.instrument_solutions() are seen here too.
+
+Submodules are named after their folders, except group-anagrams: its module
+is `group_anagrams_module`, so it can't shadow the group_anagrams function.
+"""
+
+import importlib
+import os
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# submodule name -> solution file, relative to this folder
+SOLUTION_MODULES = {
+    "contains_any_duplicate": "contains-any-duplicate/contains-duplicate.py",
+    "two_sum": "two-sum/two-sum.py",
+    "valid_anagram": "valid-anagram/valid-anagram.py",
+    "group_anagrams_module": "group-anagrams/group-anagrams.py",
+    "top_k_frequent_elements": "top-k-frequent-elements/top-k-frequent-element.py",
+    "longest_consecutive_sequence": "longest-consecutive-sequence/longest-consecutive-sequence.py",
+    "product_array_except_self": "product-array-except-self/product-array-except-self.py",
+    "valid_sudoku": "valid-sudoku/valid-sudoku.py",
+    "encode_and_decode_strings": "encode-and-decode-strings/encode-and-decode-strings.py",
+}
+
+# public name -> submodule that defines it
+_EXPORTS = {}
+for _module, _names in {
+    "contains_any_duplicate": [
+        "hasDuplicate", "hasDuplicateSort", "hasDuplicateHashSet", "hasDuplicateNumpy",
+        "hasDuplicateAuto", "hasDuplicateBitmap", "hasDuplicateExternalSort",
+        "BloomFilter", "StreamingDuplicateDetector", "firstDuplicateStream",
+    ],
+    "two_sum": [
+        "twoSumBruteForce", "twoSumMyOnePass", "twoSumPopularOnePass", "twoSumTwoPass",
+        "twoSumSorting", "twoSumNumpy", "twoSumAuto", "TwoSumIndex",
+    ],
+    "valid_anagram": [
+        "valid_anagram_bruteForce", "valid_anagram_sort", "valid_anagram_frequencyMap",
+        "valid_anagram_frequencyMap_array", "valid_anagram_unicode",
+        "find_anagrams", "find_anagrams_many", "find_anagrams_in_file",
+    ],
+    "group_anagrams_module": [
+        "group_anagrams_by_count", "group_anagrams_by_count_compact", "group_anagrams_by_sorting",
+        "group_anagrams", "group_anagrams_partial", "group_anagrams_parallel",
+        "sorted_key", "count_key", "signature_key", "prime_key",
+    ],
+    "top_k_frequent_elements": [
+        "topK_FrequentElement_sort", "topK_FrequentElement_heap", "topK_FrequentElement_bucket",
+        "topK_FrequentElement_numpy", "topK_FrequentElement", "topK_FrequentElement_parallel",
+        "topK_FrequentElement_spaceSaving", "TopKTracker", "SpaceSaving",
+    ],
+    "longest_consecutive_sequence": [
+        "longestConsecutive", "longestConsecutive_set", "longestConsecutive_numpy",
+        "longestConsecutive_auto", "longestConsecutive_bitmap", "ConsecutiveRuns",
+    ],
+    "product_array_except_self": [
+        "productExceptSelf", "productExceptSelf_numpy", "productExceptSelf_auto",
+        "productExceptSelf_bounded", "productExceptSelf_file",
+    ],
+    "valid_sudoku": [
+        "isValidSudoku", "isValidSudoku_alternative", "isValidSudoku_bitmask",
+        "isValidSudokuN", "boards_to_array", "validate_boards", "validate_boards_n",
+        "SudokuBoard", "solve_sudoku", "solve_many",
+    ],
+    "encode_and_decode_strings": [
+        "encode", "decode", "encode_to", "iter_decode", "encode_binary", "decode_binary",
+    ],
+}.items():
+    for _name in _names:
+        _EXPORTS[_name] = _module
+del _module, _names, _name
+
+__all__ = sorted(set(_EXPORTS) | set(SOLUTION_MODULES))
+
+
+class _SolutionFinder:
+    """Lets the import system find dsa.arrays_and_hashing.<name> in its hyphenated file."""
+
+    @staticmethod
+    def find_spec(fullname, path=None, target=None):
+        package, _, name = fullname.rpartition(".")
+        if package != __name__ or name not in SOLUTION_MODULES:
+            return None
+        import importlib.util    # pulls in contextlib/collections: only pay once a file loads
+        return importlib.util.spec_from_file_location(
+            fullname, os.path.join(_HERE, SOLUTION_MODULES[name]))
+
+
+if not any(isinstance(finder, _SolutionFinder) for finder in sys.meta_path):
+    sys.meta_path.append(_SolutionFinder())
+
+
+def _load(name: str):
+    full_name = f"{__name__}.{name}"
+    module = sys.modules.get(full_name)      # already loaded: skip the import machinery
+    return module if module is not None else importlib.import_module(full_name)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(_load(_EXPORTS[name]), name)
+    if name in SOLUTION_MODULES:
+        return _load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,28 @@
+"""
+Deferred imports for the optional dependencies of the solution files.
+
+    np = lazy_import("numpy")     # None if NumPy isn't installed
+
+The module is only really imported when a NumPy path first touches an
+attribute (np.asarray, ...), so importing a solution stays cheap.
+
+Solution files import this as `._lazy` when loaded through the package and
+as `_lazy` (from the folder above them) when run as scripts.
+"""
+
+import importlib.util
+import sys
+
+
+def lazy_import(name: str):
+    """The module, really imported on first attribute access; None if it isn't installed."""
+    if name in sys.modules:
+        return sys.modules[name]         # already imported, or blocked with None
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,1098 @@
+"""
+Benchmark harness for everything in dsa/arrays_and_hashing.
+
+Every solution file ships several competing implementations of the same
+problem. This script races them against each other on seeded inputs so we
+can pick a variant from data instead of from Big-O comments.
+
+For every (problem, distribution, size, variant) it records:
+- wall-clock seconds per call (best of --repeat, auto-ranged like timeit)
+- peak Python heap allocation during one call (via tracemalloc)
+
+Usage:
+    python3 dsa/arrays_and_hashing/benchmark.py
+    python3 dsa/arrays_and_hashing/benchmark.py --problem two-sum --sizes 10 1000 100000
+    python3 dsa/arrays_and_hashing/benchmark.py --full            # 10 .. 10^7
+    python3 dsa/arrays_and_hashing/benchmark.py --json out.json --csv out.csv
+    python3 dsa/arrays_and_hashing/benchmark.py --save-baseline baseline.json
+    python3 dsa/arrays_and_hashing/benchmark.py --baseline baseline.json --tolerance 0.25
+    python3 dsa/arrays_and_hashing/benchmark.py --import-time     # startup guard
+
+Exit code is 1 when --baseline is given and any measurement regressed by
+more than --tolerance (as a fraction, 0.25 = 25% slower / bigger), and when
+--import-time finds a lazy import that isn't lazy any more.
+"""
+import argparse
+import csv
+import gc
+import importlib
+import io
+import json
+import platform
+import random
+import string
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+HERE = Path(__file__).resolve().parent
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000]
+FULL_SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+# O(n^2) variants are skipped above this size - they would dominate the run
+QUADRATIC_CAP = 5_000
+# bignum productExceptSelf results need O(n^2) bits in total: 10^5 values of
+# 2..9 already take gigabytes, so exact variants stop here
+BIGNUM_CAP = 20_000
+
+
+# ============================================================
+# Loading the solution files
+# ============================================================
+#
+# The solutions live in hyphenated paths (two-sum/two-sum.py) so they can't be
+# imported with a normal `import`. The dsa.arrays_and_hashing package maps
+# each file to a real submodule (see __init__.py); importing through it keeps
+# one copy of every module and lets worker processes pickle their functions.
+
+REPO_ROOT = HERE.parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import dsa.arrays_and_hashing as solutions  # noqa: E402  (needs REPO_ROOT on sys.path)
+
+from dsa.arrays_and_hashing.memoize import memoize  # noqa: E402
+
+_MODULE_FOR_FILE = {path: name for name, path in solutions.SOLUTION_MODULES.items()}
+
+
+def load_solution(relative_path: str):
+    return importlib.import_module(f"{solutions.__name__}.{_MODULE_FOR_FILE[relative_path]}")
+
+
+# ============================================================
+# Problem / variant registry
+# ============================================================
+
+@dataclass
+class Variant:
+    name: str
+    func: Callable[..., Any]
+    max_size: Optional[int] = None   # skip sizes above this (quadratic variants)
+    min_size: Optional[int] = None   # skip sizes below this (process pool start-up)
+    copy_input: bool = False         # variant mutates its input (e.g. nums.sort())
+    # approximate (or different-answer, e.g. modular) variants are scored with
+    # Problem.accuracy instead of being checked for agreement
+    approximate: bool = False
+
+
+@dataclass
+class Problem:
+    name: str
+    # make_input(n, distribution, rng) -> tuple of positional args
+    make_input: Callable[[int, str, random.Random], Tuple[Any, ...]]
+    distributions: List[str]
+    variants: List[Variant] = field(default_factory=list)
+    # normalize(args, result) -> comparable value, used to check variants agree
+    normalize: Callable[[Tuple[Any, ...], Any], Any] = lambda args, result: result
+    # accuracy(args, result) -> 0.0 .. 1.0, only used for approximate variants
+    accuracy: Optional[Callable[[Tuple[Any, ...], Any], float]] = None
+
+
+def _copy_args(args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    return tuple(list(a) if isinstance(a, list) else a for a in args)
+
+
+# ---------- input generators ----------
+#
+# Every problem has at least one adversarial distribution: the one that makes
+# early-exit variants scan the whole input before they can answer.
+
+def make_contains_duplicate(n, distribution, rng):
+    if distribution == "unique":            # worst case: no duplicate at all
+        nums = rng.sample(range(n * 10), n)
+    elif distribution == "dup-at-end":      # only duplicate is the last element
+        nums = rng.sample(range(n * 10), n)
+        if n > 1:
+            nums[-1] = nums[0]
+    elif distribution == "dup-early":       # best case for early exit
+        nums = rng.sample(range(n * 10), n)
+        if n > 1:
+            nums[1] = nums[0]
+    else:
+        raise ValueError(distribution)
+    return (nums,)
+
+
+def make_two_sum(n, distribution, rng):
+    nums = rng.sample(range(1, n * 10 + 1), n)
+    if distribution == "pair-at-end":       # one-pass methods scan everything
+        target = nums[-1] + nums[-2]
+    elif distribution == "pair-at-ends":    # first and last element
+        target = nums[0] + nums[-1]
+    elif distribution == "random":
+        i, j = rng.sample(range(n), 2)
+        target = nums[i] + nums[j]
+    else:
+        raise ValueError(distribution)
+    return (nums, target)
+
+
+BATCH_TARGETS = 200
+
+
+def make_two_sum_batch(n, distribution, rng):
+    # the same array queried with many targets
+    nums = rng.sample(range(1, n * 10 + 1), max(n, 2))
+    targets = []
+    for _ in range(BATCH_TARGETS):
+        if distribution == "all-hit":
+            i, j = rng.sample(range(len(nums)), 2)
+            targets.append(nums[i] + nums[j])
+        elif distribution == "half-miss":           # misses scan everything
+            if rng.random() < 0.5:
+                i, j = rng.sample(range(len(nums)), 2)
+                targets.append(nums[i] + nums[j])
+            else:
+                targets.append(-rng.randrange(1, 1000))
+        else:
+            raise ValueError(distribution)
+    return (nums, targets)
+
+
+def make_valid_anagram(n, distribution, rng):
+    s = "".join(rng.choice(string.ascii_lowercase) for _ in range(n))
+    if distribution == "anagram":           # must count every character
+        t_list = list(s)
+        rng.shuffle(t_list)
+        t = "".join(t_list)
+    elif distribution == "mismatch-last":   # differs only in the last char
+        t = s[:-1] + ("a" if s[-1] != "a" else "b")
+    elif distribution == "single-char":     # degenerate alphabet
+        s = t = "a" * n
+    else:
+        raise ValueError(distribution)
+    return (s, t)
+
+
+UNICODE_ALPHABETS = {
+    "ascii-lowercase": string.ascii_lowercase,                 # 26-slot path
+    "ascii-mixed": string.ascii_letters + string.digits + " ,.!?",
+    "latin-1": string.ascii_lowercase + "àâçéèêëîïôûùüÿßñ",     # 256-slot path
+    "multilingual": "abcéñαβγδжзий日本語中文한국어😀👍",             # Counter path
+}
+
+
+def make_valid_anagram_unicode(n, distribution, rng):
+    alphabet = UNICODE_ALPHABETS[distribution]
+    s = "".join(rng.choice(alphabet) for _ in range(n))
+    t_list = list(s)
+    rng.shuffle(t_list)
+    return (s, "".join(t_list))
+
+
+SEARCH_PATTERN_LEN = 8
+
+
+def make_anagram_search(n, distribution, rng):
+    if distribution == "random-text":       # few matches
+        text = _random_word(rng, n)
+    elif distribution == "small-alphabet":  # many matches
+        text = "".join(rng.choice("ab") for _ in range(n))
+    else:
+        raise ValueError(distribution)
+    start = rng.randrange(max(1, n - SEARCH_PATTERN_LEN))
+    letters = list(text[start:start + SEARCH_PATTERN_LEN])
+    rng.shuffle(letters)
+    return (text, "".join(letters))
+
+
+def _random_word(rng, length):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+
+def make_group_anagrams(n, distribution, rng):
+    if distribution == "random-words":
+        words = [_random_word(rng, rng.randint(3, 8)) for _ in range(n)]
+    elif distribution == "few-groups":      # big groups, few keys
+        bases = [_random_word(rng, 6) for _ in range(10)]
+        words = []
+        for _ in range(n):
+            letters = list(rng.choice(bases))
+            rng.shuffle(letters)
+            words.append("".join(letters))
+    elif distribution == "long-words":      # sorting cost dominates
+        words = [_random_word(rng, 40) for _ in range(n)]
+    else:
+        raise ValueError(distribution)
+    return (words,)
+
+
+TOP_K = 10
+
+
+def make_top_k(n, distribution, rng):
+    if distribution == "uniform":
+        nums = [rng.randrange(max(1, n // 10)) for _ in range(n)]
+    elif distribution == "skewed":          # zipf-like: a few very hot keys
+        nums = [int(rng.paretovariate(1.2)) for _ in range(n)]
+    elif distribution == "all-distinct":    # adversarial: d == n
+        nums = list(range(n))
+        rng.shuffle(nums)
+    else:
+        raise ValueError(distribution)
+    return (nums, min(TOP_K, len(set(nums))))
+
+
+def make_longest_consecutive(n, distribution, rng):
+    if distribution == "one-run":           # the whole input is one sequence
+        nums = list(range(n))
+        rng.shuffle(nums)
+    elif distribution == "random":
+        nums = [rng.randrange(n * 2) for _ in range(n)]
+    elif distribution == "sparse":          # no two values adjacent
+        nums = [2 * i for i in range(n)]
+        rng.shuffle(nums)
+    else:
+        raise ValueError(distribution)
+    return (nums,)
+
+
+CHURN_EVENTS = 1_000
+
+
+def make_consecutive_churn(n, distribution, rng):
+    # ConsecutiveRuns: n numbers in, then CHURN_EVENTS discard/add pairs
+    if distribution == "random-churn":      # many short runs: each split is cheap
+        nums = rng.sample(range(n * 2), n)
+        events = [rng.choice(nums) for _ in range(CHURN_EVENTS)]
+    elif distribution == "mid-split":       # worst case: every discard halves the one run
+        nums = list(range(n))
+        events = [n // 2] * CHURN_EVENTS
+    else:
+        raise ValueError(distribution)
+    return (nums, events)
+
+
+def make_product_except_self(n, distribution, rng):
+    if distribution == "small-values":      # prefix/suffix become bignums
+        nums = [rng.randint(2, 9) for _ in range(n)]
+    elif distribution == "ones":            # no bignum growth at all
+        nums = [1] * n
+    elif distribution == "one-zero":
+        nums = [rng.randint(2, 9) for _ in range(n)]
+        nums[rng.randrange(n)] = 0
+    elif distribution == "two-zeros":       # every answer is 0
+        nums = [rng.randint(2, 9) for _ in range(n)]
+        for i in rng.sample(range(n), min(2, n)):
+            nums[i] = 0
+    else:
+        raise ValueError(distribution)
+    return (nums,)
+
+
+def _solved_board():
+    # classic shifted-pattern board: every row/col/box holds 1-9 once
+    return [[str((r * 3 + r // 3 + c) % 9 + 1) for c in range(9)] for r in range(9)]
+
+
+def make_sudoku(n, distribution, rng):
+    # n = number of boards validated per call
+    boards = []
+    for _ in range(n):
+        board = _solved_board()
+        if distribution == "valid-full":
+            pass
+        elif distribution == "conflict-last":   # duplicate in the very last cell
+            board[8][8] = board[8][0]
+        elif distribution == "sparse":
+            for r in range(9):
+                for c in range(9):
+                    if rng.random() < 0.7:
+                        board[r][c] = "."
+        else:
+            raise ValueError(distribution)
+        boards.append(board)
+    return (boards,)
+
+
+SUDOKU_BOX_SIZES = {"n=2": 2, "n=3": 3, "n=4": 4, "n=5": 5, "n=8": 8}
+
+
+def make_sudoku_n(n, distribution, rng):
+    # n = number of flat boards; the distribution picks the box size
+    box = SUDOKU_BOX_SIZES[distribution]
+    side = box * box
+    solved = [(box * (r % box) + r // box + c) % side + 1
+              for r in range(side) for c in range(side)]
+    boards = []
+    for _ in range(n):
+        board = solved[:]
+        if rng.random() < 0.5:                  # clash in the last cell
+            board[-1] = board[-2]
+        boards.append(board)
+    return (boards, box)
+
+
+def _every_flat_board(check):
+    def every_flat_board(boards, box):
+        return [check(board, box) for board in boards]
+    return every_flat_board
+
+
+HARD_SUDOKUS = [
+    "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..",
+    "..53.....8......2..7..1.5..4....53...1..7...6..32...8..6.5....9..4....3......97..",
+    "..............3.85..1.2.......5.7.....4...1...9.......5......73..2.1........4...9",
+    "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......",
+]
+SOLVER_CAP = 200                  # puzzles per call; hard ones take ~60 ms each
+
+
+def make_sudoku_solve(n, distribution, rng):
+    # n = number of puzzles per call; relabelling digits keeps the difficulty
+    puzzles = []
+    for _ in range(n):
+        if distribution == "hard":
+            puzzle = rng.choice(HARD_SUDOKUS)
+        elif distribution == "easy":            # 35 givens left on a solved grid
+            cells = [ch for row in _solved_board() for ch in row]
+            for i in rng.sample(range(81), 46):
+                cells[i] = "."
+            puzzle = "".join(cells)
+        else:
+            raise ValueError(distribution)
+        digits = list("123456789")
+        rng.shuffle(digits)
+        relabel = str.maketrans("123456789", "".join(digits))
+        puzzles.append(puzzle.translate(relabel))
+    return (puzzles,)
+
+
+def make_encode_decode(n, distribution, rng):
+    if distribution == "short":
+        strs = [_random_word(rng, rng.randint(0, 8)) for _ in range(n)]
+    elif distribution == "long":
+        strs = [_random_word(rng, 200) for _ in range(n)]
+    elif distribution == "delimiter-heavy":     # digits and '#' inside payloads
+        alphabet = "#0123456789"
+        strs = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+                for _ in range(n)]
+    else:
+        raise ValueError(distribution)
+    return (strs,)
+
+
+# ---------- result normalizers ----------
+
+def _normalize_two_sum(args, result):
+    nums, target = args
+    i, j = result
+    return i != j and nums[i] + nums[j] == target
+
+
+def _normalize_top_k(args, result):
+    # ties mean different variants may pick different keys with equal counts
+    nums, _k = args
+    counts: Dict[int, int] = {}
+    for num in nums:
+        counts[num] = counts.get(num, 0) + 1
+    return sorted(counts[num] for num in result)
+
+
+def _top_k_accuracy(args, result):
+    # fraction of returned keys that really belong in the top k (tie-aware)
+    nums, k = args
+    counts: Dict[int, int] = {}
+    for num in nums:
+        counts[num] = counts.get(num, 0) + 1
+    kth_count = sorted(counts.values(), reverse=True)[k - 1]
+    return sum(counts.get(num, 0) >= kth_count for num in result) / k
+
+
+def _normalize_two_sum_batch(args, result):
+    nums, targets = args
+    return [pair is not None and nums[pair[0]] + nums[pair[1]] == target
+            for target, pair in zip(targets, result)]
+
+
+def _normalize_groups(args, result):
+    return sorted(sorted(group) for group in result)
+
+
+def _if_numpy(module, *variants):
+    """NumPy is optional: only race NumPy variants when the module found it."""
+    return list(variants) if module.np is not None else []
+
+
+def _stream_round_trip(enc):
+    def round_trip(strs):
+        buffer = io.BytesIO()
+        enc.encode_to(strs, buffer)
+        buffer.seek(0)
+        return list(enc.iter_decode(buffer))
+    return round_trip
+
+
+PARALLEL_MIN_SIZE = 100_000
+
+
+def _parallel_top_k(topk, workers):
+    def parallel_top_k(nums, k):
+        shard_size = max(10_000, len(nums) // (workers * 4))
+        return topk.topK_FrequentElement_parallel(nums, k, workers=workers, shard_size=shard_size)
+    return parallel_top_k
+
+
+def _external_sort_duplicate(dup, workers):
+    def external_sort_duplicate(nums):
+        # ~8 runs per worker, so the merge phase is actually exercised
+        chunk_size = max(10_000, len(nums) // (workers * 8))
+        return dup.hasDuplicateExternalSort(nums, chunk_size=chunk_size, workers=workers)
+    return external_sort_duplicate
+
+
+def _parallel_group_anagrams(grp, workers):
+    def parallel_group_anagrams(strs):
+        chunk_size = max(10_000, len(strs) // (workers * 4))
+        return list(grp.group_anagrams_parallel(strs, workers=workers, chunk_size=chunk_size))
+    return parallel_group_anagrams
+
+
+def _check_every_window(valid_anagram):
+    def check_every_window(text, pattern):
+        m = len(pattern)
+        return [i for i in range(len(text) - m + 1) if valid_anagram(text[i:i + m], pattern)]
+    return check_every_window
+
+
+def _search_many(find_many):
+    def search_many(text, pattern):
+        return [offset for offset, _ in find_many(text, [pattern])]
+    return search_many
+
+
+def _two_sum_each_target(func):
+    def each_target(nums, targets):
+        results = []
+        for target in targets:
+            try:
+                results.append(func(nums, target))
+            except ValueError:
+                results.append(None)
+        return results
+    return each_target
+
+
+def _index_query_each(two):
+    def query_each(nums, targets):
+        index = two.TwoSumIndex(nums)       # built once, reused for every target
+        return _two_sum_each_target(lambda _nums, target: index.query(target))(nums, targets)
+    return query_each
+
+
+def _stream_has_duplicate(first_duplicate):
+    def stream_has_duplicate(nums):
+        # Bloom sized for the input, budget small enough to force spilling
+        return first_duplicate(iter(nums), memory_budget=max(1 << 16, len(nums) * 16),
+                               expected_items=max(len(nums), 1)) is not None
+    return stream_has_duplicate
+
+
+def _tracker_top_k(topk):
+    def tracker_top_k(nums, k):
+        tracker = topk.TopKTracker()
+        tracker.add_many(nums)
+        return tracker.topk(k)
+    return tracker_top_k
+
+
+def _runs_churn(lcs):
+    def runs_churn(nums, events):
+        runs = lcs.ConsecutiveRuns(nums)
+        longest = []
+        for num in events:
+            runs.discard(num)
+            longest.append(runs.longest())
+            runs.add(num)
+        return longest
+    return runs_churn
+
+
+def build_problems() -> Dict[str, Problem]:
+    dup = load_solution("contains-any-duplicate/contains-duplicate.py")
+    two = load_solution("two-sum/two-sum.py")
+    ana = load_solution("valid-anagram/valid-anagram.py")
+    grp = load_solution("group-anagrams/group-anagrams.py")
+    topk = load_solution("top-k-frequent-elements/top-k-frequent-element.py")
+    lcs = load_solution("longest-consecutive-sequence/longest-consecutive-sequence.py")
+    prod = load_solution("product-array-except-self/product-array-except-self.py")
+    sud = load_solution("valid-sudoku/valid-sudoku.py")
+    enc = load_solution("encode-and-decode-strings/encode-and-decode-strings.py")
+
+    def every_board(check):
+        return lambda boards: [check(board) for board in boards]
+
+    if topk.np is not None:
+        extra_top_k = [Variant("topK_FrequentElement_numpy", topk.topK_FrequentElement_numpy)]
+    else:
+        extra_top_k = []
+    # scaling sweep: only worth measuring once shards outnumber the workers
+    for workers in (1, 2, 4, 8):
+        extra_top_k.append(Variant(
+            f"topK_FrequentElement_parallel(workers={workers})",
+            _parallel_top_k(topk, workers),
+            min_size=PARALLEL_MIN_SIZE,
+        ))
+
+    extra_dup = [Variant("hasDuplicateExternalSort(workers=1)", _external_sort_duplicate(dup, 1))]
+    for workers in (2, 4):
+        extra_dup.append(Variant(
+            f"hasDuplicateExternalSort(workers={workers})",
+            _external_sort_duplicate(dup, workers),
+            min_size=PARALLEL_MIN_SIZE,
+        ))
+
+    extra_groups = _if_numpy(grp, Variant("group_anagrams(key='numpy')",
+                                          partial(grp.group_anagrams, key="numpy")))
+    for workers in (1, 2, 4, 8):
+        extra_groups.append(Variant(
+            f"group_anagrams_parallel(workers={workers})",
+            _parallel_group_anagrams(grp, workers),
+            min_size=PARALLEL_MIN_SIZE,
+        ))
+
+    problems = [
+        Problem(
+            "contains-duplicate", make_contains_duplicate,
+            ["unique", "dup-at-end", "dup-early"],
+            [
+                Variant("hasDuplicateHashSet", dup.hasDuplicateHashSet),
+                Variant("hasDuplicateSort", dup.hasDuplicateSort, copy_input=True),
+                Variant("hasDuplicate", dup.hasDuplicate, max_size=QUADRATIC_CAP),
+                Variant("hasDuplicateAuto", dup.hasDuplicateAuto),
+                Variant("hasDuplicateBitmap", dup.hasDuplicateBitmap),
+                Variant("firstDuplicateStream", _stream_has_duplicate(dup.firstDuplicateStream)),
+                Variant("hasDuplicateSort (memoized, warm)",
+                        memoize(dup.hasDuplicateSort, mutates_input=True)),
+            ] + extra_dup + _if_numpy(dup, Variant("hasDuplicateNumpy", dup.hasDuplicateNumpy)),
+        ),
+        Problem(
+            "two-sum", make_two_sum,
+            ["pair-at-end", "pair-at-ends", "random"],
+            [
+                Variant("twoSumMyOnePass", two.twoSumMyOnePass),
+                Variant("twoSumPopularOnePass", two.twoSumPopularOnePass),
+                Variant("twoSumTwoPass", two.twoSumTwoPass),
+                Variant("twoSumSorting", two.twoSumSorting),
+                Variant("twoSumBruteForce", two.twoSumBruteForce, max_size=QUADRATIC_CAP),
+                Variant("twoSumAuto", two.twoSumAuto),
+                Variant("twoSumPopularOnePass (memoized, warm)", memoize(two.twoSumPopularOnePass)),
+            ] + _if_numpy(two, Variant("twoSumNumpy", two.twoSumNumpy)),
+            _normalize_two_sum,
+        ),
+        Problem(
+            "two-sum-batch", make_two_sum_batch,
+            ["all-hit", "half-miss"],
+            [
+                Variant("twoSumPopularOnePass per target", _two_sum_each_target(two.twoSumPopularOnePass)),
+                Variant("TwoSumIndex.query per target", _index_query_each(two)),
+                Variant("TwoSumIndex.query_many",
+                        lambda nums, targets: two.TwoSumIndex(nums).query_many(targets)),
+            ],
+            _normalize_two_sum_batch,
+        ),
+        Problem(
+            "valid-anagram", make_valid_anagram,
+            ["anagram", "mismatch-last", "single-char"],
+            [
+                Variant("valid_anagram_sort", ana.valid_anagram_sort),
+                Variant("valid_anagram_frequencyMap", ana.valid_anagram_frequencyMap),
+                Variant("valid_anagram_frequencyMap_array", ana.valid_anagram_frequencyMap_array),
+                Variant("valid_anagram_bruteForce", ana.valid_anagram_bruteForce,
+                        max_size=QUADRATIC_CAP),
+                Variant("valid_anagram_unicode", ana.valid_anagram_unicode),
+            ],
+        ),
+        Problem(
+            "anagram-search", make_anagram_search,
+            ["random-text", "small-alphabet"],
+            [
+                Variant("find_anagrams", lambda text, pattern: list(ana.find_anagrams(text, pattern))),
+                Variant("find_anagrams_many", _search_many(ana.find_anagrams_many)),
+                Variant("valid_anagram_frequencyMap_array per window",
+                        _check_every_window(ana.valid_anagram_frequencyMap_array)),
+            ],
+        ),
+        Problem(
+            # one distribution per path, so a slow fast path shows up here
+            "valid-anagram-unicode", make_valid_anagram_unicode,
+            list(UNICODE_ALPHABETS),
+            [
+                Variant("valid_anagram_unicode", ana.valid_anagram_unicode),
+                Variant("valid_anagram_unicode(casefold=True)",
+                        partial(ana.valid_anagram_unicode, casefold=True)),
+                Variant("valid_anagram_frequencyMap", ana.valid_anagram_frequencyMap),
+                Variant("valid_anagram_sort", ana.valid_anagram_sort),
+            ],
+        ),
+        Problem(
+            "group-anagrams", make_group_anagrams,
+            ["random-words", "few-groups", "long-words"],
+            [
+                Variant("group_anagrams_by_count", grp.group_anagrams_by_count),
+                Variant("group_anagrams_by_count_compact", grp.group_anagrams_by_count_compact),
+                Variant("group_anagrams_by_sorting", grp.group_anagrams_by_sorting),
+            ] + [
+                Variant(f"group_anagrams(key={key!r})", partial(grp.group_anagrams, key=key))
+                for key in ("signature", "prime")
+            ] + [
+                Variant("group_anagrams (memoized, warm)", memoize(grp.group_anagrams)),
+            ] + extra_groups,
+            _normalize_groups,
+        ),
+        Problem(
+            "top-k-frequent", make_top_k,
+            ["uniform", "skewed", "all-distinct"],
+            [
+                Variant("topK_FrequentElement_sort", topk.topK_FrequentElement_sort),
+                Variant("topK_FrequentElement_heap", topk.topK_FrequentElement_heap),
+                Variant("topK_FrequentElement_heap (memoized, warm)",
+                        memoize(topk.topK_FrequentElement_heap)),
+                Variant("topK_FrequentElement_bucket", topk.topK_FrequentElement_bucket),
+                Variant("topK_FrequentElement (auto)", topk.topK_FrequentElement),
+                Variant("TopKTracker(add_many+topk)", _tracker_top_k(topk)),
+                Variant("topK_FrequentElement_spaceSaving(eps=0.01)",
+                        lambda nums, k: topk.topK_FrequentElement_spaceSaving(nums, k, 0.01),
+                        approximate=True),
+                Variant("topK_FrequentElement_spaceSaving(eps=0.001)",
+                        topk.topK_FrequentElement_spaceSaving, approximate=True),
+            ] + extra_top_k,
+            _normalize_top_k,
+            _top_k_accuracy,
+        ),
+        Problem(
+            "longest-consecutive", make_longest_consecutive,
+            ["one-run", "random", "sparse"],
+            [
+                Variant("longestConsecutive", lcs.longestConsecutive),
+                Variant("longestConsecutive_set", lcs.longestConsecutive_set),
+                Variant("longestConsecutive_auto", lcs.longestConsecutive_auto),
+                Variant("longestConsecutive_bitmap", lcs.longestConsecutive_bitmap),
+                Variant("ConsecutiveRuns(nums).longest", lambda nums: lcs.ConsecutiveRuns(nums).longest()),
+            ] + _if_numpy(lcs, Variant("longestConsecutive_numpy", lcs.longestConsecutive_numpy)),
+        ),
+        Problem(
+            # discard costs O(smaller half): mid-split grows with n, random-churn barely
+            "consecutive-runs-churn", make_consecutive_churn,
+            ["random-churn", "mid-split"],
+            [
+                Variant("ConsecutiveRuns discard+add", _runs_churn(lcs)),
+            ],
+        ),
+        Problem(
+            "product-except-self", make_product_except_self,
+            ["small-values", "ones", "one-zero", "two-zeros"],
+            [
+                Variant("productExceptSelf", prod.productExceptSelf, max_size=BIGNUM_CAP),
+                Variant("productExceptSelf_auto", prod.productExceptSelf_auto, max_size=BIGNUM_CAP),
+                Variant("productExceptSelf_bounded(exact)", prod.productExceptSelf_bounded,
+                        max_size=BIGNUM_CAP),
+                Variant("productExceptSelf_bounded(int64)",
+                        lambda nums: prod.productExceptSelf_bounded(nums, "int64")),
+                Variant("productExceptSelf_bounded(mod)",
+                        lambda nums: prod.productExceptSelf_bounded(nums, "mod", mod=1_000_000_007),
+                        approximate=True),
+                Variant("productExceptSelf_bounded(log)",
+                        lambda nums: prod.productExceptSelf_bounded(nums, "log"), approximate=True),
+            ] + _if_numpy(prod, Variant("productExceptSelf_numpy", prod.productExceptSelf_numpy,
+                                        max_size=BIGNUM_CAP)),
+        ),
+        Problem(
+            "valid-sudoku", make_sudoku,
+            ["valid-full", "conflict-last", "sparse"],
+            [
+                Variant("isValidSudoku", every_board(sud.isValidSudoku)),
+                Variant("isValidSudoku_alternative", every_board(sud.isValidSudoku_alternative)),
+                Variant("isValidSudoku_bitmask", every_board(sud.isValidSudoku_bitmask)),
+                Variant("isValidSudoku (memoized, warm)", every_board(memoize(sud.isValidSudoku))),
+            ] + _if_numpy(sud, Variant("validate_boards", sud.validate_boards)),
+            lambda args, result: [bool(valid) for valid in result],
+        ),
+        Problem(
+            # time per board grows with n^4 cells; watch the ratio between rows
+            "sudoku-n", make_sudoku_n,
+            list(SUDOKU_BOX_SIZES),
+            [
+                Variant("isValidSudokuN", _every_flat_board(sud.isValidSudokuN)),
+            ] + _if_numpy(sud, Variant(
+                "validate_boards_n",
+                lambda boards, box: sud.validate_boards_n(sud.np.array(boards, dtype=sud.np.uint8), box),
+            )),
+            lambda args, result: [bool(valid) for valid in result],
+        ),
+        Problem(
+            # puzzles per second = size / time
+            "sudoku-solve", make_sudoku_solve,
+            ["easy", "hard"],
+            [
+                Variant(f"solve_many(workers={workers})",
+                        partial(sud.solve_many, workers=workers),
+                        max_size=SOLVER_CAP, min_size=1 if workers == 1 else 100)
+                for workers in (1, 2, 4)
+            ],
+        ),
+        Problem(
+            "encode-decode", make_encode_decode,
+            ["short", "long", "delimiter-heavy"],
+            [
+                Variant("encode+decode", lambda strs: enc.decode(enc.encode(strs))),
+                Variant("encode+iter_decode", lambda strs: list(enc.iter_decode(enc.encode(strs)))),
+                Variant("encode_to+iter_decode(bytes)", _stream_round_trip(enc)),
+                Variant("encode_binary+decode_binary(row)",
+                        lambda strs: enc.decode_binary(enc.encode_binary(strs, "row"))),
+                Variant("encode_binary+decode_binary(columnar)",
+                        lambda strs: enc.decode_binary(enc.encode_binary(strs, "columnar"))),
+            ],
+        ),
+    ]
+    return {problem.name: problem for problem in problems}
+
+
+# ============================================================
+# Measurement
+# ============================================================
+
+def _run_batch(func, args, copy_input: bool, number: int) -> float:
+    # fresh copies are built BEFORE the clock starts so copying isn't timed
+    batch = [_copy_args(args) if copy_input else args for _ in range(number)]
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for call_args in batch:
+            func(*call_args)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def time_call(func, args, copy_input: bool, repeat: int, min_time: float = 0.05) -> float:
+    """Best seconds-per-call, auto-ranging the loop count like timeit does."""
+    number = 1
+    while True:
+        elapsed = _run_batch(func, args, copy_input, number)
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10
+
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        best = min(best, _run_batch(func, args, copy_input, number) / number)
+    return best
+
+
+def peak_memory(func, args, copy_input: bool) -> int:
+    """Peak bytes allocated (above the starting point) during a single call."""
+    call_args = _copy_args(args) if copy_input else args
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        func(*call_args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - start)
+
+
+def run(problems: List[Problem], sizes: List[int], seed: int, repeat: int,
+        measure_memory: bool, distributions: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+
+    for problem in problems:
+        for distribution in problem.distributions:
+            if distributions and distribution not in distributions:
+                continue
+            for n in sizes:
+                # seeded per cell so adding a problem doesn't shift other inputs
+                rng = random.Random(f"{seed}:{problem.name}:{distribution}:{n}")
+                args = problem.make_input(n, distribution, rng)
+                expected = None
+
+                for variant in problem.variants:
+                    if variant.max_size is not None and n > variant.max_size:
+                        continue
+                    if variant.min_size is not None and n < variant.min_size:
+                        continue
+
+                    row = {
+                        "problem": problem.name,
+                        "variant": variant.name,
+                        "distribution": distribution,
+                        "size": n,
+                        "seconds": None,
+                        "peak_bytes": None,
+                        "agrees": True,
+                        "accuracy": None,
+                        "error": None,
+                    }
+                    try:
+                        result = variant.func(*(_copy_args(args) if variant.copy_input else args))
+                    except OverflowError as exc:
+                        # bounded modes refuse inputs they can't represent - report, don't crash
+                        row["error"] = f"{type(exc).__name__}: {exc}"
+                        rows.append(row)
+                        _print_row(row)
+                        continue
+
+                    accuracy = None
+                    if variant.approximate:
+                        agrees = True
+                        if problem.accuracy:
+                            accuracy = problem.accuracy(args, result)
+                    else:
+                        normalized = problem.normalize(args, result)
+                        if expected is None:
+                            expected = normalized
+                        agrees = normalized == expected
+
+                    seconds = time_call(variant.func, args, variant.copy_input, repeat)
+                    peak = peak_memory(variant.func, args, variant.copy_input) if measure_memory else None
+
+                    row.update(seconds=seconds, peak_bytes=peak, agrees=agrees, accuracy=accuracy)
+                    rows.append(row)
+                    _print_row(row)
+    return rows
+
+
+# ============================================================
+# Import-time guard
+# ============================================================
+#
+# `import dsa.arrays_and_hashing` must stay free: no solution file, no NumPy.
+# Importing a solution may load that one file, but never NumPy - the files
+# import it lazily, on the first call that takes a NumPy path.
+# Each check runs in a fresh interpreter under `python -X importtime`, which
+# logs every module imported and its cumulative microseconds on stderr. We
+# subtract what a bare `python -c pass` already imports, then check which new
+# modules showed up and how long the statement took.
+
+# (statement, solution submodules it may load, budget ms)
+IMPORT_CHECKS = [
+    ("import dsa.arrays_and_hashing", set(), 10.0),
+    ("from dsa.arrays_and_hashing import valid_anagram_sort", {"valid_anagram"}, 60.0),
+    ("from dsa.arrays_and_hashing import isValidSudoku", {"valid_sudoku", "_lazy"}, 50.0),
+    ("from dsa.arrays_and_hashing import twoSumAuto", {"two_sum", "_lazy"}, 60.0),
+]
+
+
+def _imported_modules(statement: str) -> Dict[str, int]:
+    """{module: cumulative us} for everything `statement` imports in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    modules = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def check_import_time(repeat: int = 3, budget_scale: float = 1.0) -> List[str]:
+    """Run IMPORT_CHECKS; returns one line per violation (empty = all good)."""
+    baseline = set(_imported_modules("pass"))
+    prefix = solutions.__name__ + "."
+    violations = []
+    for statement, allowed, budget_ms in IMPORT_CHECKS:
+        best_ms, new = float("inf"), set()
+        for _ in range(repeat):
+            modules = _imported_modules(statement)
+            new = set(modules) - baseline
+            # top-level entries' cumulative times add up to the whole statement
+            best_ms = min(best_ms, sum(modules[name] for name in new if "." not in name) / 1000)
+        print(f"  {best_ms:8.2f} ms  {len(new):4d} modules  {statement}")
+
+        loaded = {name[len(prefix):] for name in new if name.startswith(prefix)}
+        for name in sorted(loaded - allowed):
+            violations.append(f"{statement!r} loaded solution module {name}")
+        if any(name == "numpy" or name.startswith("numpy.") for name in new):
+            violations.append(f"{statement!r} loaded numpy")
+        if best_ms > budget_ms * budget_scale:
+            violations.append(f"{statement!r} took {best_ms:.1f} ms "
+                              f"(budget {budget_ms * budget_scale:.0f} ms)")
+    return violations
+
+
+# ============================================================
+# Reporting + baseline regression check
+# ============================================================
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def _format_bytes(num_bytes: Optional[int]) -> str:
+    if num_bytes is None:
+        return "-"
+    for unit, scale in (("GB", 1 << 30), ("MB", 1 << 20), ("KB", 1 << 10)):
+        if num_bytes >= scale:
+            return f"{num_bytes / scale:.1f} {unit}"
+    return f"{num_bytes} B"
+
+
+def _print_row(row: Dict[str, Any]) -> None:
+    flag = "" if row["agrees"] else "  <-- DISAGREES with first variant"
+    if row.get("accuracy") is not None:
+        flag += f"  accuracy {row['accuracy']:.1%}"
+    if row.get("error"):
+        timing = f"{'-':>11} {'-':>10}  {row['error']}"
+    else:
+        timing = f"{_format_seconds(row['seconds'])} {_format_bytes(row['peak_bytes']):>10}"
+    print(
+        f"{row['problem']:<20} {row['distribution']:<16} n={row['size']:<10} "
+        f"{row['variant']:<44} {timing}{flag}"
+    )
+
+
+def write_json(path: str, rows: List[Dict[str, Any]], seed: int) -> None:
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+        },
+        "results": rows,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def write_csv(path: str, rows: List[Dict[str, Any]]) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(
+            f, fieldnames=["problem", "variant", "distribution", "size",
+                           "seconds", "peak_bytes", "agrees", "accuracy", "error"]
+        )
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _row_key(row: Dict[str, Any]) -> Tuple[str, str, str, int]:
+    return (row["problem"], row["variant"], row["distribution"], row["size"])
+
+
+def compare_to_baseline(rows: List[Dict[str, Any]], baseline_path: str,
+                        tolerance: float) -> List[str]:
+    """Return a human readable line for every measurement that regressed."""
+    with open(baseline_path) as f:
+        baseline = {_row_key(row): row for row in json.load(f)["results"]}
+
+    regressions = []
+    for row in rows:
+        old = baseline.get(_row_key(row))
+        if old is None or row["seconds"] is None or old.get("seconds") is None:
+            continue
+        label = "/".join(str(part) for part in _row_key(row))
+
+        if row["seconds"] > old["seconds"] * (1 + tolerance):
+            regressions.append(
+                f"{label}: time {_format_seconds(old['seconds']).strip()} -> "
+                f"{_format_seconds(row['seconds']).strip()}"
+            )
+        if (row["peak_bytes"] is not None and old.get("peak_bytes")
+                and row["peak_bytes"] > old["peak_bytes"] * (1 + tolerance)):
+            regressions.append(
+                f"{label}: memory {_format_bytes(old['peak_bytes'])} -> "
+                f"{_format_bytes(row['peak_bytes'])}"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--problem", action="append",
+                        help="problem name to run (repeatable); default: all")
+    parser.add_argument("--distribution", action="append",
+                        help="only run this input distribution (repeatable)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=None,
+                        help=f"input sizes (default: {DEFAULT_SIZES})")
+    parser.add_argument("--full", action="store_true",
+                        help=f"use the full size sweep {FULL_SIZES}")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc pass (much faster on big sizes)")
+    parser.add_argument("--json", help="write a JSON report here")
+    parser.add_argument("--csv", help="write a CSV report here")
+    parser.add_argument("--save-baseline", help="write the JSON report as a new baseline")
+    parser.add_argument("--baseline", help="compare against this JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown before flagging a regression (0.25 = 25%%)")
+    parser.add_argument("--import-time", action="store_true",
+                        help="only run the package import-time guard (see IMPORT_CHECKS)")
+    parser.add_argument("--import-budget-scale", type=float, default=1.0,
+                        help="multiply every import-time budget (slow CI machines)")
+    args = parser.parse_args(argv)
+
+    if args.import_time:
+        violations = check_import_time(args.repeat, args.import_budget_scale)
+        if violations:
+            print(f"\n✗ {len(violations)} import-time violation(s):")
+            for line in violations:
+                print(f"  {line}")
+            return 1
+        print("\n✓ Package imports stay lazy and within budget")
+        return 0
+
+    all_problems = build_problems()
+    if args.problem:
+        unknown = set(args.problem) - set(all_problems)
+        if unknown:
+            parser.error(f"unknown problem(s): {', '.join(sorted(unknown))}; "
+                         f"choose from {', '.join(all_problems)}")
+        problems = [all_problems[name] for name in args.problem]
+    else:
+        problems = list(all_problems.values())
+
+    sizes = args.sizes or (FULL_SIZES if args.full else DEFAULT_SIZES)
+    rows = run(problems, sizes, args.seed, args.repeat,
+               measure_memory=not args.no_memory, distributions=args.distribution)
+
+    if args.json:
+        write_json(args.json, rows, args.seed)
+    if args.save_baseline:
+        write_json(args.save_baseline, rows, args.seed)
+    if args.csv:
+        write_csv(args.csv, rows)
+
+    if any(not row["agrees"] for row in rows):
+        print("\n✗ Some variants disagree with each other - check the rows marked above")
+        return 1
+
+    if args.baseline:
+        regressions = compare_to_baseline(rows, args.baseline, args.tolerance)
+        if regressions:
+            print(f"\n✗ {len(regressions)} regression(s) vs {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\n✓ No regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,25 @@
-from typing import List 
+import bisect
+import heapq
+import math
+import mmap
+import operator
+import os
+import sys
+import tempfile
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Hashable, Iterable, List, Optional, Tuple
+
+
+if __package__:
+    from ._lazy import lazy_import
+else:  # run as a script: the helper is one folder up
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from _lazy import lazy_import
+
+# NumPy is optional - hasDuplicateAuto falls back to the set version.
+np = lazy_import("numpy")
 
 # Most efficient: using hash set
 def hasDuplicateHashSet(nums: List[int]) -> bool:
@@ -24,6 +45,385 @@ def hasDuplicate(nums: List[int]) -> bool:
             if nums[i]==nums[j]:
                 return True
     return False
+# NumPy implementation: sort + compare neighbours
+# np.sort returns a COPY, so unlike hasDuplicateSort the caller's list is untouched.
+# After sorting, duplicates sit next to each other: [3, 1, 3] -> [1, 3, 3]
+#                                                          equal ^  ^
+def hasDuplicateNumpy(nums) -> bool:
+    if np is None:
+        raise ImportError("hasDuplicateNumpy needs NumPy installed")
+    arr = np.asarray(nums)
+    if arr.size < 2:
+        return False
+    exact_kinds = "iufb" if isinstance(nums, np.ndarray) else "iub"
+    if arr.dtype.kind not in exact_kinds:
+        # huge ints (object dtype), strings, ... -> let the set version handle them.
+        # A list that became float64 may have mixed ints and floats, or ints past
+        # int64, which casting rounds: [2**53, 2**53 + 1] would compare equal.
+        return hasDuplicateHashSet(list(nums))
+    ordered = np.sort(arr, axis=None)
+    return bool(np.any(ordered[1:] == ordered[:-1]))
+
+
+# below this, converting a list to an array costs more than the set loop
+NUMPY_MIN_SIZE = 2_000
+
+
+# Dispatcher: NumPy for arrays and big inputs, the hash set otherwise
+def hasDuplicateAuto(nums) -> bool:
+    if np is not None and (isinstance(nums, np.ndarray) or len(nums) >= NUMPY_MIN_SIZE):
+        return hasDuplicateNumpy(nums)
+    return hasDuplicateHashSet(nums)
+
+
+# Bitmap implementation for DENSE integer ranges (e.g. ID sets)
+# A set stores a full hash entry per number (~50-100 bytes). If every value
+# lies in [lo, hi] and that range isn't much bigger than n, one BIT per
+# possible value is enough: bit (num - lo) says "seen it".
+#   test-and-set:  byte = offset >> 3, mask = 1 << (offset & 7)
+#                  bitmap[byte] & mask -> duplicate, else bitmap[byte] |= mask
+# Too sparse (range > DENSE_MAX_RANGE_PER_ITEM * n) -> the set is smaller, use it.
+DENSE_MAX_RANGE_PER_ITEM = 32     # bitmap <= 4 bytes per element
+
+
+def hasDuplicateBitmap(nums: List[int]) -> bool:
+    if len(nums) < 2:
+        return False
+    lo, hi = min(nums), max(nums)
+    if hi - lo + 1 > DENSE_MAX_RANGE_PER_ITEM * len(nums):
+        return hasDuplicateHashSet(nums)
+
+    bitmap = bytearray(((hi - lo) >> 3) + 1)
+    for num in nums:
+        offset = num - lo
+        byte = offset >> 3
+        mask = 1 << (offset & 7)
+        if bitmap[byte] & mask:
+            return True
+        bitmap[byte] |= mask
+    return False
+
+
+# ============================================================
+# Streaming version: iterator in, first duplicate out
+# ============================================================
+# For feeds that never fit in memory we can't hold a set of everything.
+#   1. Bloom filter (a few bits per item) answers "DEFINITELY new" for most
+#      items -> no exact lookup needed at all.
+#   2. "Maybe seen" -> confirm exactly: first the in-memory set of recent
+#      items, then the sorted runs on disk (binary search each one).
+#   3. When the set outgrows the memory budget it's written to disk as one
+#      sorted int64 run and cleared. Runs are tiered like an LSM tree: new
+#      runs go to level 0, and MAX_RUNS runs on one level are merged
+#      (heapq.merge) into a single run one level up. Each value is rewritten
+#      once per level - O(n log n) I/O overall, not a full rewrite per spill -
+#      and a lookup searches < MAX_RUNS runs per level, O(log n) levels.
+# Spilling needs int64 values (IDs); anything hashable works until the first spill.
+
+SET_BYTES_PER_ITEM = 64           # rough set slot + int object cost
+MAX_RUNS = 8
+MERGE_BLOCK = 1 << 16             # int64s read per run while merging
+_MASK64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """
+    m bits, k hash positions per item. No false negatives; false positive
+    rate ~ error_rate once `capacity` items are in.
+    
+    Sizing (standard formulas):  m = -n * ln(p) / ln(2)^2,  k = m / n * ln(2)
+    Positions via double hashing: (h1 + i * h2) % m for i in 0..k-1
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and 0 < error_rate < 1")
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) >> 3)
+
+    def _positions(self, item: Hashable):
+        # hash(int) is nearly the identity, so scramble it before using it
+        h = hash(item) & _MASK64
+        h1 = (h * 0x9E3779B97F4A7C15) & _MASK64
+        h2 = (((h ^ (h >> 31)) * 0xBF58476D1CE4E5B9) & _MASK64) | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: Hashable) -> bool:
+        """Add item; return True if it was (maybe) already present."""
+        present = True
+        bits = self.bits
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                present = False
+                bits[pos >> 3] |= mask
+        return present
+
+    def __contains__(self, item: Hashable) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class _SortedRun:
+    # one sorted int64 file, searched in place through mmap
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._values = memoryview(self._mm).cast("q")
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect.bisect_left(self._values, value)
+        return i < len(self._values) and self._values[i] == value
+
+    def __iter__(self):
+        # block reads, so merging doesn't touch the mmap one int at a time
+        for start in range(0, len(self._values), MERGE_BLOCK):
+            yield from self._values[start:start + MERGE_BLOCK].tolist()
+
+    def close(self) -> None:
+        self._values.release()
+        self._mm.close()
+        os.remove(self.path)
+
+
+class StreamingDuplicateDetector:
+    """
+    Feed items one at a time with add(); it returns True the first time it
+    sees a value again. `first_duplicate` is then (position, value).
+    
+    detector = StreamingDuplicateDetector(memory_budget=64 << 20)
+    for item in feed:
+        if detector.add(item):
+            break
+    detector.close()
+    
+    memory_budget (bytes) bounds the exact set; the Bloom filter adds about
+    1.2 bytes per expected item at 1% error.
+    """
+
+    def __init__(self, memory_budget: int = 256 << 20, expected_items: int = 10_000_000,
+                 error_rate: float = 0.01, tmp_dir: Optional[str] = None):
+        self.bloom = BloomFilter(expected_items, error_rate)
+        self.max_set_items = max(1, memory_budget // SET_BYTES_PER_ITEM)
+        self.tmp_dir = tmp_dir
+        self.position = 0
+        self.first_duplicate: Optional[Tuple[int, Hashable]] = None
+        self.exact_lookups = 0              # Bloom "maybe"s that needed checking
+        self.merged_values = 0              # values rewritten by run merges
+        self._recent = set()
+        self._levels: List[List[_SortedRun]] = []   # level -> runs of ~MAX_RUNS^level spills
+        self._workdir: Optional[tempfile.TemporaryDirectory] = None
+        self._run_counter = 0
+
+    def add(self, item: Hashable) -> bool:
+        position = self.position
+        self.position += 1
+        if self.bloom.add(item):
+            self.exact_lookups += 1
+            if item in self._recent or any(item in run for level in self._levels for run in level):
+                if self.first_duplicate is None:
+                    self.first_duplicate = (position, item)
+                return True
+        self._recent.add(item)
+        if len(self._recent) >= self.max_set_items:
+            self._spill()
+        return False
+
+    def _new_run_path(self) -> str:
+        if self._workdir is None:
+            self._workdir = tempfile.TemporaryDirectory(prefix="dupruns-", dir=self.tmp_dir)
+        self._run_counter += 1
+        return os.path.join(self._workdir.name, f"run-{self._run_counter}.bin")
+
+    def _spill(self) -> None:
+        # TypeError / OverflowError here means the values aren't int64 IDs
+        values = array("q", sorted(self._recent))
+        path = self._new_run_path()
+        with open(path, "wb") as f:
+            values.tofile(f)
+        self._recent.clear()
+        self._add_run(0, _SortedRun(path))
+
+    def _add_run(self, level: int, run: _SortedRun) -> None:
+        if level == len(self._levels):
+            self._levels.append([])
+        self._levels[level].append(run)
+        if len(self._levels[level]) >= MAX_RUNS:
+            # a full level becomes one run on the next level (may cascade)
+            runs, self._levels[level] = self._levels[level], []
+            self._add_run(level + 1, self._merge_runs(runs))
+
+    def _merge_runs(self, runs: List[_SortedRun]) -> _SortedRun:
+        # runs never share a value (we stop at the first duplicate), so the
+        # merged run is just the k-way merge of all of them
+        path = self._new_run_path()
+        buffer = array("q")
+        with open(path, "wb") as f:
+            for value in heapq.merge(*runs):
+                buffer.append(value)
+                if len(buffer) >= MERGE_BLOCK:
+                    buffer.tofile(f)
+                    buffer = array("q")
+            buffer.tofile(f)
+        for run in runs:
+            self.merged_values += len(run)
+            run.close()
+        return _SortedRun(path)
+
+    @property
+    def spilled_runs(self) -> int:
+        return sum(map(len, self._levels))
+
+    def close(self) -> None:
+        for level in self._levels:
+            for run in level:
+                run.close()
+        self._levels = []
+        self._recent.clear()
+        if self._workdir is not None:
+            self._workdir.cleanup()
+            self._workdir = None
+
+    def __enter__(self) -> "StreamingDuplicateDetector":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def firstDuplicateStream(items: Iterable[Hashable], memory_budget: int = 256 << 20,
+                         expected_items: int = 10_000_000, error_rate: float = 0.01,
+                         tmp_dir: Optional[str] = None) -> Optional[Tuple[int, Hashable]]:
+    """
+    (position, value) of the first item that repeats an earlier one, or None.
+    Stops pulling from `items` as soon as the duplicate is found.
+    
+    firstDuplicateStream(iter([4, 7, 1, 7, 4]))  ->  (3, 7)
+    """
+    with StreamingDuplicateDetector(memory_budget, expected_items, error_rate, tmp_dir) as detector:
+        for item in items:
+            if detector.add(item):
+                return detector.first_duplicate
+    return None
+
+
+# ============================================================
+# External merge sort: hasDuplicateSort for data bigger than RAM
+# ============================================================
+# hasDuplicateSort sorts the caller's list IN PLACE and needs it all in memory.
+# Same idea, out of core and without touching the input:
+#   1. cut the input into chunks, sort each chunk (in a process pool) and
+#      write it as a binary run of int64s - a chunk with two equal
+#      neighbours already answers True
+#   2. k-way merge the runs with heapq.merge: the merged stream is the whole
+#      input in sorted order, so a duplicate = two equal consecutive values
+# Input: list, NumPy array, or PATH to a file of raw little-endian int64s.
+# At most 2 * workers chunks are in flight, so memory ~ chunk_size * workers.
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+INT64_BYTES = 8
+
+
+def _has_equal_neighbours(ordered) -> bool:
+    return any(map(operator.eq, ordered, islice(ordered, 1, None)))
+
+
+def _sort_chunk_to_run(chunk, path: str) -> bool:
+    """Sort chunk into an int64 run file at path; True if the chunk has a duplicate."""
+    if np is not None and isinstance(chunk, np.ndarray):
+        ordered = np.sort(chunk.astype(np.int64, copy=False))
+        if ordered.size > 1 and bool(np.any(ordered[1:] == ordered[:-1])):
+            return True
+        ordered.tofile(path)
+        return False
+    run = array("q", sorted(chunk))           # sorted() copies - chunk is untouched
+    if _has_equal_neighbours(run):
+        return True
+    with open(path, "wb") as f:
+        run.tofile(f)
+    return False
+
+
+def _sort_file_chunk_to_run(src: str, start: int, stop: int, path: str) -> bool:
+    """Same as _sort_chunk_to_run for values [start, stop) of an int64 file."""
+    chunk = array("q")
+    with open(src, "rb") as f:
+        f.seek(start * INT64_BYTES)
+        chunk.fromfile(f, stop - start)
+    if sys.byteorder != "little":
+        chunk.byteswap()
+    return _sort_chunk_to_run(chunk, path)
+
+
+def _chunk_tasks(source, chunk_size: int, workdir: str):
+    """Yield (function, *args) that sort each chunk of source into its own run."""
+    if isinstance(source, (str, os.PathLike)):
+        total = os.path.getsize(source) // INT64_BYTES
+        starts = range(0, total, chunk_size)
+        for n, start in enumerate(starts):
+            yield (_sort_file_chunk_to_run, os.fspath(source), start,
+                   min(start + chunk_size, total), os.path.join(workdir, f"run-{n}.bin"))
+    else:
+        for n, start in enumerate(range(0, len(source), chunk_size)):
+            yield (_sort_chunk_to_run, source[start:start + chunk_size],
+                   os.path.join(workdir, f"run-{n}.bin"))
+
+
+def hasDuplicateExternalSort(source, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                             workers: int = 1, tmp_dir: Optional[str] = None) -> bool:
+    """
+    Sort-based duplicate check that never mutates the input and never holds
+    more than ~2 * workers chunks in memory.
+    Time:  O(n log chunk_size / workers + n log runs)
+    Space: O(workers * chunk_size) memory + n int64s on disk
+    Runs hold int64s, so a NumPy source must have a dtype that casts to int64
+    without loss: float or uint64 arrays raise TypeError instead of truncating.
+    """
+    if np is not None and isinstance(source, np.ndarray) and not np.can_cast(source.dtype, np.int64):
+        raise TypeError(f"hasDuplicateExternalSort needs an integer array, got {source.dtype}")
+    with tempfile.TemporaryDirectory(prefix="dupsort-", dir=tmp_dir) as workdir:
+        runs = []
+        if workers == 1:
+            for func, *args in _chunk_tasks(source, chunk_size, workdir):
+                if func(*args):
+                    return True
+                runs.append(args[-1])
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = {}
+                for func, *args in _chunk_tasks(source, chunk_size, workdir):
+                    pending[pool.submit(func, *args)] = args[-1]
+                    if len(pending) >= 2 * workers:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            if future.result():
+                                for other in pending:
+                                    other.cancel()
+                                return True
+                            runs.append(pending.pop(future))
+                for future, path in pending.items():
+                    if future.result():
+                        return True
+                    runs.append(path)
+
+        readers = [_SortedRun(path) for path in runs]
+        try:
+            previous = object()
+            for value in heapq.merge(*readers):
+                if value == previous:
+                    return True
+                previous = value
+            return False
+        finally:
+            for reader in readers:
+                reader.close()
+
+
 if __name__ == "__main__":
     # Test all three implementations
     
@@ -47,7 +447,97 @@ if __name__ == "__main__":
         # Test hash set
         result_hash = hasDuplicateHashSet(nums)
         assert result_hash == expected, f"Hash set failed for {nums}"
+
+        # Test NumPy + dispatcher (and that neither mutates the input)
+        before = list(nums)
+        if np is not None:
+            assert hasDuplicateNumpy(nums) == expected, f"NumPy failed for {nums}"
+        assert hasDuplicateAuto(nums) == expected, f"Auto failed for {nums}"
+        assert hasDuplicateBitmap(nums) == expected, f"Bitmap failed for {nums}"
+        assert nums == before, f"input was mutated for {nums}"
         
         print(f"✓ All methods passed for {nums} → {expected}")
     
+    assert hasDuplicateBitmap([-5, 10**12, 3]) is False        # sparse -> set fallback
+    assert hasDuplicateBitmap(list(range(-100, 100)) + [-100]) is True
+    print("✓ Bitmap passed for dense / sparse / negative inputs")
+
+    if np is not None:
+        big = list(range(NUMPY_MIN_SIZE * 2))
+        assert hasDuplicateAuto(big) is False
+        assert hasDuplicateAuto(big + [7]) is True
+        assert hasDuplicateNumpy([2**70, 1, 2**70]) is True     # object dtype fallback
+        assert hasDuplicateNumpy([2**53, 2**53 + 1, 0.5]) is False  # float64 would round
+        assert hasDuplicateNumpy([2**63, -1, 2**63]) is True    # past int64 -> set path
+        assert hasDuplicateNumpy(np.array([0.5, 1.5, 0.5])) is True
+        print("✓ NumPy dispatcher passed for large / overflowing inputs")
+
+    # Streaming detector: first duplicate position/value, early exit, spilling
+    assert firstDuplicateStream(iter([4, 7, 1, 7, 4])) == (3, 7)
+    assert firstDuplicateStream(iter(range(1000))) is None
+    assert firstDuplicateStream([]) is None
+
+    consumed = []
+    def feed():
+        for x in [1, 2, 1, 3, 4]:
+            consumed.append(x)
+            yield x
+    assert firstDuplicateStream(feed()) == (2, 1)
+    assert consumed == [1, 2, 1], "stream was not abandoned at the duplicate"
+
+    import random
+    rng = random.Random(14)
+    for _ in range(20):
+        values = rng.sample(range(-10**12, 10**12), 3000)
+        dup_at = rng.randrange(1000, 3000)
+        values.insert(dup_at, values[rng.randrange(dup_at)])
+        # budget of ~100 set items -> ~30 spills and several run merges
+        with StreamingDuplicateDetector(memory_budget=100 * SET_BYTES_PER_ITEM,
+                                        expected_items=500) as detector:
+            found = next((i for i, v in enumerate(values) if detector.add(v)), None)
+            assert found == dup_at and detector.first_duplicate == (dup_at, values[dup_at])
+            assert 1 <= detector.spilled_runs < 2 * MAX_RUNS
+    # long stream: tiered merges rewrite each value once per level, not once per spill
+    with StreamingDuplicateDetector(memory_budget=50 * SET_BYTES_PER_ITEM,
+                                    expected_items=1000) as detector:
+        assert not any(detector.add(v) for v in range(50 * MAX_RUNS ** 2 * 2))
+        assert detector.merged_values <= 2 * 50 * MAX_RUNS ** 2 * 2     # 2 levels deep
+        assert detector.spilled_runs < 3 * MAX_RUNS
+    print("✓ Streaming detector passed (early exit, spilled runs, merges)")
+
+    # External merge sort: same answers, input untouched, chunks + runs + pool
+    for _ in range(20):
+        values = rng.sample(range(-10**12, 10**12), 2000)
+        if rng.random() < 0.5:
+            values.append(values[rng.randrange(len(values))])
+            rng.shuffle(values)
+        expected = hasDuplicateHashSet(values)
+        before = list(values)
+        assert hasDuplicateExternalSort(values, chunk_size=300) == expected
+        assert values == before, "external sort mutated the input"
+    spread = list(range(0, 4000, 2)) + [1998]           # duplicate only visible in the merge
+    assert hasDuplicateExternalSort(spread, chunk_size=500) is True
+    assert hasDuplicateExternalSort(spread, chunk_size=500, workers=2) is True
+    assert hasDuplicateExternalSort(spread[:-1], chunk_size=500, workers=2) is False
+    assert hasDuplicateExternalSort([]) is False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ids.bin")
+        ids = array("q", spread)
+        if sys.byteorder != "little":
+            ids.byteswap()
+        with open(path, "wb") as f:
+            ids.tofile(f)
+        assert hasDuplicateExternalSort(path, chunk_size=700) is True
+        assert hasDuplicateExternalSort(path, chunk_size=700, workers=2) is True
+        if np is not None:
+            assert hasDuplicateExternalSort(np.array(spread[:-1]), chunk_size=500) is False
+            for bad in (np.array([1.5, 1.2]), np.array([2**63], dtype=np.uint64)):
+                try:
+                    hasDuplicateExternalSort(bad)
+                    assert False, "lossy dtype should raise"
+                except TypeError:
+                    pass
+    print("✓ External merge sort passed (lists, arrays, files, process pool)")
+
     print("\n🎉 All tests passed!")
\ No newline at end of file
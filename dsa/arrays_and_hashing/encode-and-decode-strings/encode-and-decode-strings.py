@@ -1,13 +1,35 @@
+import codecs
+import io
+from itertools import accumulate
+from typing import Iterable, Iterator, List, Tuple
+import os
+import sys
+
+
+if __package__:
+    from ._lazy import lazy_import
+else:  # run as a script: the helper is one folder up
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from _lazy import lazy_import
+
+# NumPy is optional - the pure Python paths are used instead.
+np = lazy_import("numpy")
+
+
 def encode(strs: list) -> str:
-    result = "" 
+    parts = []
     
     for string in strs:
         # Format: LENGTH + DELIMITER + STRING
         # Example: "hello" becomes "5#hello"
         # The length prefix is the KEY - it tells us exactly how many chars to read
-        result += str(len(string)) + "#" + string
+        parts.append(str(len(string)))
+        parts.append("#")
+        parts.append(string)
     
-    return result
+    # WHY join instead of result += ...? Strings are immutable, so += can copy
+    # the whole result every time -> O(n^2) on big batches. join copies once.
+    return "".join(parts)
 
 
 def decode(encodedString: str) -> list:
@@ -41,4 +63,396 @@ def decode(encodedString: str) -> list:
         i = j  # Now i and j are EQUAL again, both pointing to next length prefix
         # This equality resets at the start of each loop iteration
     
-    return result
\ No newline at end of file
+    return result
+
+
+# ============================================================
+# STREAMING CODEC: constant memory, frames split across chunks
+# ============================================================
+#
+# encode/decode above need the whole batch in memory at once. The functions
+# below work on file-like objects and buffers instead, one chunk at a time:
+#
+#   encode_to(strs, stream)      -> writes "5#hello..." frames as it goes
+#   iter_decode(source)          -> yields each string as soon as its frame is complete
+#
+# The tricky part is that a read chunk can end ANYWHERE:
+#
+#   chunk 1: "5#hel"     chunk 2: "lo11#hello"     chunk 3: " world"
+#                ^ payload split        ^ payload split again
+#
+# So the decoder keeps a tiny bit of state between chunks:
+#   carry -> the start of a length prefix we haven't seen '#' for yet ("1")
+#   need  -> the payload length we're collecting, if we're mid-payload
+#   parts -> payload pieces collected so far (joined once when complete)
+#
+# Lengths count CHARACTERS (like len(str)), so binary sources are decoded with
+# an incremental UTF-8 decoder that also copes with multi-byte characters
+# split between two chunks.
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# a length prefix longer than this can't be valid - stop instead of buffering forever
+MAX_PREFIX_DIGITS = 20
+
+
+def encode_to(strs: Iterable[str], stream, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Write the length-prefixed encoding of strs to stream, buffering about
+    chunk_size characters at a time. strs can be any iterable (e.g. a generator),
+    so the batch never has to exist in memory. Text streams (open(..., "w"),
+    io.StringIO) get str; anything else (binary files, io.BytesIO, mmap) gets
+    UTF-8 bytes. Returns how many strings were written.
+    """
+    is_text = isinstance(stream, io.TextIOBase)
+    parts: List[str] = []
+    buffered = 0
+    count = 0
+
+    for string in strs:
+        frame = f"{len(string)}#{string}"
+        parts.append(frame)
+        buffered += len(frame)
+        count += 1
+
+        if buffered >= chunk_size:
+            block = "".join(parts)
+            stream.write(block if is_text else block.encode("utf-8"))
+            parts = []
+            buffered = 0
+
+    if parts:
+        block = "".join(parts)
+        stream.write(block if is_text else block.encode("utf-8"))
+    return count
+
+
+def _text_chunks(source, chunk_size: int) -> Iterator[str]:
+    # A plain str is already in memory - hand it over whole, the parser slices it
+    if isinstance(source, str):
+        yield source
+        return
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+
+    if hasattr(source, "read"):
+        # file-like: text files give str, binary files give bytes
+        while True:
+            block = source.read(chunk_size)
+            if not block:
+                break
+            yield block if isinstance(block, str) else decoder.decode(block)
+    else:
+        # bytes / bytearray / memoryview / mmap: slicing a memoryview doesn't copy
+        with memoryview(source) as view:
+            for start in range(0, len(view), chunk_size):
+                yield decoder.decode(view[start:start + chunk_size])
+
+    tail = decoder.decode(b"", final=True)   # raises on a truncated UTF-8 sequence
+    if tail:
+        yield tail
+
+
+def iter_decode(source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Generator version of decode(). source can be a str, bytes-like object
+    (bytes, bytearray, memoryview, mmap) or a file-like object with .read().
+    Memory use is O(chunk_size + longest string), not O(whole batch).
+    Raises ValueError on a corrupt or truncated stream.
+    """
+    carry = ""          # partial length prefix left over from the previous chunk
+    need = None         # payload length being collected (None = reading a prefix)
+    parts: List[str] = []
+    have = 0
+
+    for chunk in _text_chunks(source, chunk_size):
+        if carry:
+            chunk = carry + chunk   # carry is at most MAX_PREFIX_DIGITS chars
+            carry = ""
+        i = 0
+        n = len(chunk)
+
+        while i < n:
+            if need is None:
+                # PHASE 1: read the length prefix
+                j = chunk.find("#", i)
+                if j == -1:
+                    carry = chunk[i:]
+                    if not carry.isdigit() or len(carry) > MAX_PREFIX_DIGITS:
+                        raise ValueError(f"corrupt length prefix {carry[:MAX_PREFIX_DIGITS]!r}")
+                    break
+                prefix = chunk[i:j]
+                if not prefix.isdigit():
+                    raise ValueError(f"corrupt length prefix {prefix[:MAX_PREFIX_DIGITS]!r}")
+                need = int(prefix)
+                i = j + 1
+
+            # PHASE 2: collect the payload (possibly across several chunks)
+            take = min(need - have, n - i)
+            if not parts and take == need:
+                # fast path: the whole payload is inside this chunk
+                yield chunk[i:i + need]
+                i += need
+                need = None
+                continue
+
+            parts.append(chunk[i:i + take])
+            have += take
+            i += take
+            if have == need:
+                yield "".join(parts)
+                parts = []
+                have = 0
+                need = None
+
+    if carry or (need is not None and have != need):
+        raise ValueError("truncated stream: last frame is incomplete")
+
+
+
+# ============================================================
+# BINARY MODE: varint length prefixes over UTF-8 bytes
+# ============================================================
+#
+# The text format costs a digit parse + a scan for '#' per string. In binary
+# mode each length is a VARINT: 7 bits per byte, high bit = "more bytes follow".
+#
+#   300 = 0b10_0101100  ->  [1_0101100] [0_0000010]  ->  b"\xac\x02"
+#          low 7 bits first ^              ^ high bit clear = last byte
+#
+# Lengths count UTF-8 BYTES here (not characters like the text format).
+#
+# Every binary blob starts with a 5 byte header so we can change the format
+# later without misreading old data:
+#
+#   b"LPS" | version (1 byte) | layout (1 byte)
+#
+# Two layouts:
+#
+#   ROW      : [len][bytes][len][bytes]...          (can be written one item at a time)
+#   COLUMNAR : [count][lengths_nbytes][len][len]...[len] [one payload blob]
+#
+# Columnar keeps all lengths together, so decode turns them into offsets in
+# ONE pass (a cumulative sum - vectorized with NumPy when it's installed) and
+# then just slices the blob. No searching, and as_views=True slices without
+# copying at all.
+
+BINARY_MAGIC = b"LPS"
+BINARY_VERSION = 1
+LAYOUT_ROW = 0
+LAYOUT_COLUMNAR = 1
+_LAYOUTS = {"row": LAYOUT_ROW, "columnar": LAYOUT_COLUMNAR}
+
+MAX_VARINT_BYTES = 10           # enough for any 64-bit length
+_NUMPY_MIN_ITEMS = 1_000        # below this NumPy's call overhead isn't worth it
+
+
+def _write_varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(view, pos: int) -> Tuple[int, int]:
+    """Return (value, position after the varint)."""
+    value = 0
+    shift = 0
+    for _ in range(MAX_VARINT_BYTES):
+        if pos >= len(view):
+            raise ValueError("truncated varint")
+        byte = view[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+    raise ValueError("varint too long")
+
+
+def encode_binary(strs: Iterable[str], layout: str = "row") -> bytes:
+    if layout not in _LAYOUTS:
+        raise ValueError(f"unknown layout {layout!r}, expected one of {sorted(_LAYOUTS)}")
+
+    out = bytearray(BINARY_MAGIC)
+    out.append(BINARY_VERSION)
+    out.append(_LAYOUTS[layout])
+
+    if layout == "row":
+        for string in strs:
+            payload = string.encode("utf-8")
+            _write_varint(len(payload), out)
+            out += payload
+        return bytes(out)
+
+    payloads = [string.encode("utf-8") for string in strs]
+    lengths = bytearray()
+    for payload in payloads:
+        _write_varint(len(payload), lengths)
+
+    _write_varint(len(payloads), out)
+    _write_varint(len(lengths), out)
+    out += lengths
+    out += b"".join(payloads)
+    return bytes(out)
+
+
+def _columnar_lengths_numpy(region, count: int) -> "np.ndarray":
+    """
+    Decode `count` varints at once:
+      1. a byte < 0x80 ends a varint -> np.flatnonzero gives every end
+      2. each byte's position inside its varint gives its shift (0, 7, 14, ...)
+      3. np.add.reduceat sums the shifted 7-bit groups per varint
+    """
+    b = np.frombuffer(region, dtype=np.uint8)
+    ends = np.flatnonzero(b < 0x80)
+    if len(ends) != count or ends[-1] != len(b) - 1:
+        raise ValueError("corrupt length section")
+
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    if np.any(ends - starts >= MAX_VARINT_BYTES):
+        raise ValueError("varint too long")
+
+    position_in_varint = np.arange(len(b)) - np.repeat(starts, ends - starts + 1)
+    groups = (b & 0x7F).astype(np.uint64) << (7 * position_in_varint).astype(np.uint64)
+    return np.add.reduceat(groups, starts)
+
+
+def _columnar_offsets(view, pos: int, count: int, lengths_nbytes: int) -> list:
+    region = view[pos:pos + lengths_nbytes]
+    if len(region) != lengths_nbytes:
+        raise ValueError("truncated length section")
+
+    if np is not None and count >= _NUMPY_MIN_ITEMS:
+        lengths = _columnar_lengths_numpy(region, count)
+        return [0] + np.cumsum(lengths).tolist()
+
+    lengths = []
+    i = 0
+    for _ in range(count):
+        length, i = _read_varint(region, i)
+        lengths.append(length)
+    if i != lengths_nbytes:
+        raise ValueError("corrupt length section")
+    return [0] + list(accumulate(lengths))
+
+
+def decode_binary(data, as_views: bool = False) -> list:
+    """
+    Decode the output of encode_binary (either layout). data can be any
+    bytes-like object (bytes, bytearray, memoryview, mmap).
+    With as_views=True you get memoryview slices of data instead of str -
+    zero-copy, but they're only valid while data is alive.
+    """
+    view = memoryview(data).cast("B")
+    if len(view) < 5 or view[:3] != BINARY_MAGIC:
+        raise ValueError("not a binary length-prefixed blob (bad magic)")
+    if view[3] != BINARY_VERSION:
+        raise ValueError(f"unsupported format version {view[3]}")
+    layout = view[4]
+    pos = 5
+
+    if layout == LAYOUT_ROW:
+        result = []
+        while pos < len(view):
+            length, pos = _read_varint(view, pos)
+            payload = view[pos:pos + length]
+            if len(payload) != length:
+                raise ValueError("truncated stream: last frame is incomplete")
+            result.append(payload if as_views else str(payload, "utf-8"))
+            pos += length
+        return result
+
+    if layout != LAYOUT_COLUMNAR:
+        raise ValueError(f"unknown layout {layout}")
+
+    count, pos = _read_varint(view, pos)
+    lengths_nbytes, pos = _read_varint(view, pos)
+    if count == 0:
+        return []
+    offsets = _columnar_offsets(view, pos, count, lengths_nbytes)
+
+    blob = view[pos + lengths_nbytes:]
+    if len(blob) != offsets[-1]:
+        raise ValueError("payload blob size doesn't match the lengths")
+    if as_views:
+        return [blob[start:end] for start, end in zip(offsets, offsets[1:])]
+
+    # Pure ASCII blob: byte offsets == character offsets, so decode ONCE and
+    # slice the str instead of decoding every item separately
+    blob_bytes = bytes(blob)
+    if blob_bytes.isascii():
+        text = blob_bytes.decode("ascii")
+        return [text[start:end] for start, end in zip(offsets, offsets[1:])]
+    return [str(blob[start:end], "utf-8") for start, end in zip(offsets, offsets[1:])]
+
+
+if __name__ == "__main__":
+    import mmap
+    import tempfile
+
+    test_cases = [
+        [],
+        [""],
+        ["hello", "world"],
+        ["5#hello", "#", "##", "12#"],      # payloads that look like prefixes
+        ["", "", "a", ""],
+        ["héllo", "日本語", "🎉🎉"],           # multi-byte UTF-8
+        ["x" * 1000, "y" * 3],              # payload much larger than a chunk
+    ]
+
+    for strs in test_cases:
+        encoded = encode(strs)
+        assert decode(encoded) == strs, f"decode failed for {strs}"
+
+        # every chunk size, so frames get split at every possible position
+        for chunk_size in (1, 2, 3, 7, 64):
+            assert list(iter_decode(encoded, chunk_size)) == strs
+            assert list(iter_decode(encoded.encode("utf-8"), chunk_size)) == strs
+            assert list(iter_decode(io.StringIO(encoded), chunk_size)) == strs
+
+            out = io.BytesIO()
+            assert encode_to(iter(strs), out, chunk_size) == len(strs)
+            out.seek(0)
+            assert list(iter_decode(out, chunk_size)) == strs
+
+        print(f"✓ Round trip passed for {strs!r:.60}")
+
+    # mmap'd file: the decoder reads it through a memoryview, no full copy
+    with tempfile.TemporaryFile() as f:
+        strs = [f"item-{i}" for i in range(10_000)]
+        encode_to(strs, f)
+        f.flush()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            assert list(iter_decode(mm, chunk_size=4096)) == strs
+    print("✓ mmap round trip passed")
+
+    for corrupt in ("5#hel", "5", "x#abc", "3#abc12"):
+        try:
+            list(iter_decode(corrupt, 2))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"expected ValueError for {corrupt!r}")
+    print("✓ Corrupt/truncated streams rejected")
+
+    for strs in test_cases:
+        for layout in ("row", "columnar"):
+            blob = encode_binary(strs, layout)
+            assert decode_binary(blob) == strs, f"binary {layout} failed for {strs}"
+            assert [bytes(v).decode() for v in decode_binary(blob, as_views=True)] == strs
+    big = [f"item-{i}" * (i % 5) for i in range(5_000)]     # crosses the NumPy threshold
+    assert decode_binary(encode_binary(big, "columnar")) == big
+    assert decode_binary(encode_binary(["x" * 300], "row")) == ["x" * 300]   # 2-byte varint
+    for corrupt in (b"", b"XYZ\x01\x00", b"LPS\x02\x00", b"LPS\x01\x00\x05ab"):
+        try:
+            decode_binary(corrupt)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"expected ValueError for {corrupt!r}")
+    print("✓ Binary row/columnar round trips passed")
+
+    print("\n🎉 All tests passed!")
@@ -1,5 +1,25 @@
-from typing import List
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional
 from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+import math
+import os
+import pickle
+import string
+import tempfile
+import unicodedata
+import zlib
+import sys
+
+
+if __package__:
+    from ._lazy import lazy_import
+else:  # run as a script: the helper is one folder up
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from _lazy import lazy_import
+
+# NumPy is optional - only the "numpy" key strategy needs it.
+np = lazy_import("numpy")
 
 sample = ["act", "pots", "tops", "cat", "stop", "hat"]
 
@@ -47,3 +67,405 @@ def group_anagrams_by_sorting(strs: List[str]) -> List[List[str]]:
         groups[key].append(word)
 
     return list(groups.values())
+
+
+# ============================================================
+# Cheaper keys: same grouping, less work per word
+# ============================================================
+# The count solutions build a 26-item list AND a 26-tuple per word (~50
+# Python objects touched); sorting builds a list of chars and a new string.
+# Any value that's equal exactly for anagrams works as the dict key:
+#
+#   signature : 26 bytes, byte i = how many times letter i appears
+#               short words: one bytearray, += per char
+#               long words : bytes(map(word.count, "abc...z")) -> 26 C-level
+#               scans beat a Python loop over every char
+#   prime     : give each letter a prime, multiply them
+#               "act" -> 5 * 2 * 71 = 710 = "cat" (unique factorisation)
+#               short words only: 9 letters * prime <= 101 always fit in int64,
+#               longer words fall back to the signature key
+#
+# Both only understand a-z. Anything else (or > 255 copies of one letter)
+# falls back to the sorted-string key. That's safe to mix in one dict: which
+# key a word gets depends only on its letter counts, so every member of an
+# anagram group gets the same kind of key.
+
+_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
+           53, 59, 61, 67, 71, 73, 79, 83, 89, 97, 101]
+_LETTER_PRIME = dict(zip(string.ascii_lowercase, _PRIMES))
+PRIME_MAX_LEN = 9                 # 101 ** 9 < 2 ** 63
+SIGNATURE_COUNT_MIN_LEN = 32      # measured crossover of the two signature builds
+
+
+def _is_lowercase_ascii(word: str) -> bool:
+    return word.isascii() and word.isalpha() and word.islower()
+
+
+def sorted_key(word: str) -> str:
+    return ''.join(sorted(word))
+
+
+def count_key(word: str) -> Hashable:
+    if not _is_lowercase_ascii(word):
+        # ord('A') - ord('a') = -32 would silently wrap around the list
+        return sorted_key(word)
+    char_count = [0] * 26
+    for ch in word:
+        char_count[ord(ch) - ord('a')] += 1
+    return tuple(char_count)
+
+
+def signature_key(word: str) -> Hashable:
+    if not _is_lowercase_ascii(word):
+        return sorted_key(word)
+    if len(word) < SIGNATURE_COUNT_MIN_LEN:
+        signature = bytearray(26)
+        for code in word.encode('ascii'):
+            signature[code - 97] += 1
+        return bytes(signature)
+    try:
+        return bytes(map(word.count, string.ascii_lowercase))
+    except ValueError:            # a letter appears more than 255 times
+        return sorted_key(word)
+
+
+def prime_key(word: str) -> Hashable:
+    if len(word) > PRIME_MAX_LEN:
+        return signature_key(word)
+    if not _is_lowercase_ascii(word):
+        return sorted_key(word)
+    return math.prod(map(_LETTER_PRIME.__getitem__, word))
+
+
+KEY_FUNCTIONS: Dict[str, Callable[[str], Hashable]] = {
+    "count": count_key,
+    "sorted": sorted_key,
+    "signature": signature_key,
+    "prime": prime_key,
+}
+
+
+def _group_anagrams_numpy(strs: List[str], casefold: bool, normalize: bool) -> List[List[str]]:
+    """
+    Count vectors for the WHOLE list at once:
+    
+    strs = ["ab", "ba", "c"]
+    letters  = [0, 1, 1, 0, 2]      every char of every word, as 0..25
+    word_ids = [0, 0, 1, 1, 2]      which word each char belongs to
+    np.add.at(counts, (word_ids, letters), 1)  ->  counts[w, letter] += 1
+    
+    Each row (raw bytes) is the key; np.unique numbers the distinct rows and
+    a stable argsort lines the words up group by group.
+    """
+    if np is None:
+        raise ImportError('key="numpy" needs NumPy installed')
+    joined = ''.join(strs)
+    if joined and not _is_lowercase_ascii(joined):
+        # (for lowercase a-z, casefold and NFC change nothing)
+        return group_anagrams(strs, key="signature", casefold=casefold, normalize=normalize)
+    if not strs:
+        return []
+
+    lengths = np.fromiter(map(len, strs), dtype=np.int64, count=len(strs))
+    letters = np.frombuffer(joined.encode('ascii'), dtype=np.uint8) - ord('a')
+    word_ids = np.repeat(np.arange(len(strs)), lengths)
+    dtype = np.uint8 if lengths.max(initial=0) < 256 else np.int64
+    counts = np.zeros((len(strs), 26), dtype=dtype)
+    np.add.at(counts, (word_ids, letters), 1)
+
+    rows = counts.view(np.dtype((np.void, 26 * counts.itemsize))).ravel()
+    _, first_seen, labels = np.unique(rows, return_index=True, return_inverse=True)
+    # renumber groups by first appearance, so the output order matches the
+    # dict-based versions
+    rank = np.empty_like(first_seen)
+    rank[np.argsort(first_seen, kind='stable')] = np.arange(len(first_seen))
+    labels = rank[labels.ravel()]
+
+    order = np.argsort(labels, kind='stable')
+    bounds = (np.flatnonzero(np.diff(labels[order])) + 1).tolist()
+    ordered_words = [strs[i] for i in order.tolist()]
+    return [ordered_words[start:stop]
+            for start, stop in zip([0] + bounds, bounds + [len(strs)])]
+
+
+# Unicode: the key is computed on a cleaned-up copy of the word, the group
+# still holds the word exactly as given.
+#   casefold=True  : "Tea" ~ "eat"
+#   normalize=True : NFC, so "é" as e + combining accent ~ the single char "é"
+#                    (pure ASCII is already NFC - one isascii() and it's skipped)
+def _prepare_word(word: str, casefold: bool, normalize: bool) -> str:
+    if casefold:
+        word = word.casefold()
+    if normalize and not word.isascii():
+        word = unicodedata.normalize('NFC', word)
+    return word
+
+
+# one entry point, key strategy picked per call
+def group_anagrams(strs: List[str], key: str = "prime", casefold: bool = False,
+                   normalize: bool = True) -> List[List[str]]:
+    if key == "numpy":
+        return _group_anagrams_numpy(strs, casefold, normalize)
+    try:
+        key_func = KEY_FUNCTIONS[key]
+    except KeyError:
+        raise ValueError(f"unknown key strategy {key!r}, expected one of "
+                         f"{sorted(KEY_FUNCTIONS) + ['numpy']}") from None
+    groups = defaultdict(list)
+    # one C-speed isascii() over the batch: ASCII is already NFC, so the
+    # common case skips the per-word _prepare_word call entirely
+    if casefold or (normalize and not ''.join(strs).isascii()):
+        for word in strs:
+            groups[key_func(_prepare_word(word, casefold, normalize))].append(word)
+    else:
+        for word in strs:
+            groups[key_func(word)].append(word)
+    return list(groups.values())
+
+
+# ============================================================
+# Parallel version: hash-partitioned map / reduce over processes
+# ============================================================
+#
+#   map    : each worker groups one chunk of words and splits its partial
+#            groups into P partitions by hash(key) % P, written to disk
+#   reduce : each worker loads ONE partition from every chunk and merges
+#            the partial groups - every anagram key lives in exactly one
+#            partition, so the merged groups are final
+#   stream : groups are yielded partition by partition as reduces finish
+#
+# Nothing ever holds all groups: a map task holds chunk_size words, a reduce
+# task about n / P words. P is chosen so n / P <= memory_cap_words. Inputs
+# without len() map into DEFAULT_PARTITIONS; once the map phase has counted
+# n, each partition is reduced in S key slices (S reads of its files) so
+# n / (P * S) <= memory_cap_words still holds. Groups come out in partition
+# order, words inside a group keep their input order.
+# Python's str/bytes hash() is salted per process, so partitions use crc32.
+
+DEFAULT_CHUNK_WORDS = 100_000
+DEFAULT_MEMORY_CAP_WORDS = 2_000_000
+DEFAULT_PARTITIONS = 64
+
+
+def _stable_hash(key: Hashable) -> int:
+    """Same value in every process: partition = h % P, reduce slice = h // P % S."""
+    if isinstance(key, int):
+        # prime-product keys share small factors, so key % P is badly skewed: mix first
+        key = key.to_bytes((key.bit_length() + 8) // 8, "little", signed=True)
+    elif isinstance(key, str):
+        key = key.encode('utf-8', 'surrogatepass')
+    elif not isinstance(key, bytes):
+        key = repr(key).encode()
+    return zlib.crc32(key)
+
+
+def _partition_path(workdir: str, partition: int, chunk_id: int) -> str:
+    return os.path.join(workdir, f"part-{partition}-chunk-{chunk_id}.pkl")
+
+
+def _map_chunk(words: List[str], chunk_id: int, partitions: int, key: str,
+               casefold: bool, normalize: bool, workdir: str) -> None:
+    local = group_anagrams_partial(words, key, casefold, normalize)
+    buckets = [{} for _ in range(partitions)]
+    for group_key, group in local.items():
+        buckets[_stable_hash(group_key) % partitions][group_key] = group
+    for partition, bucket in enumerate(buckets):
+        if bucket:
+            with open(_partition_path(workdir, partition, chunk_id), "wb") as f:
+                pickle.dump(bucket, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _reduce_partition(workdir: str, partition: int, chunks: int, partitions: int = 1,
+                      slices: int = 1, slice_id: int = 0) -> List[List[str]]:
+    merged = {}
+    for chunk_id in range(chunks):            # chunk order = input order
+        path = _partition_path(workdir, partition, chunk_id)
+        if not os.path.exists(path):
+            continue
+        with open(path, "rb") as f:
+            bucket = pickle.load(f)
+        if slices == 1:
+            os.remove(path)                   # sliced: every slice rereads the file
+        for group_key, group in bucket.items():
+            if slices > 1 and _stable_hash(group_key) // partitions % slices != slice_id:
+                continue
+            if group_key in merged:
+                merged[group_key].extend(group)
+            else:
+                merged[group_key] = group
+    return list(merged.values())
+
+
+def group_anagrams_partial(strs: Iterable[str], key: str = "prime", casefold: bool = False,
+                           normalize: bool = True) -> Dict[Hashable, List[str]]:
+    """key -> words. Two of these merge by extending the lists of shared keys."""
+    try:
+        key_func = KEY_FUNCTIONS[key]
+    except KeyError:
+        raise ValueError(f"unknown key strategy {key!r}, expected one of "
+                         f"{sorted(KEY_FUNCTIONS)}") from None
+    groups = defaultdict(list)
+    for word in strs:
+        groups[key_func(_prepare_word(word, casefold, normalize))].append(word)
+    return dict(groups)
+
+
+def group_anagrams_parallel(strs: Iterable[str], workers: Optional[int] = None,
+                            key: str = "prime", casefold: bool = False,
+                            normalize: bool = True,
+                            chunk_size: int = DEFAULT_CHUNK_WORDS,
+                            memory_cap_words: int = DEFAULT_MEMORY_CAP_WORDS,
+                            tmp_dir: Optional[str] = None) -> Iterator[List[str]]:
+    """
+    Same groups as group_anagrams, produced by a process pool and streamed.
+    strs may be any iterable (e.g. lines of a file) - it's read chunk by chunk.
+    Time:  O(n / workers)
+    Space: O(2 * workers * max(chunk_size, memory_cap_words)) + partial groups on disk
+    """
+    if key not in KEY_FUNCTIONS:
+        raise ValueError(f"unknown key strategy {key!r}, expected one of "
+                         f"{sorted(KEY_FUNCTIONS)}")
+    workers = workers or os.cpu_count() or 1
+    if hasattr(strs, "__len__"):
+        partitions = max(workers, -(-len(strs) // memory_cap_words))
+    else:
+        partitions = max(workers, DEFAULT_PARTITIONS)
+
+    words = iter(strs)
+    chunks = iter(lambda: list(islice(words, chunk_size)), [])
+    word_count = 0
+
+    def reduce_tasks():
+        # known only after the map phase: enough slices to keep each reduce under the cap
+        slices = max(1, -(-word_count // (partitions * memory_cap_words)))
+        for partition in range(partitions):
+            for slice_id in range(slices):
+                yield (workdir, partition, chunk_count, partitions, slices, slice_id)
+
+    with tempfile.TemporaryDirectory(prefix="anagrams-", dir=tmp_dir) as workdir:
+        if workers == 1:
+            # no pool at all - the single-core baseline for scaling comparisons
+            chunk_count = 0
+            for chunk_id, chunk in enumerate(chunks):
+                _map_chunk(chunk, chunk_id, partitions, key, casefold, normalize, workdir)
+                chunk_count += 1
+                word_count += len(chunk)
+            for task in reduce_tasks():
+                yield from _reduce_partition(*task)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = set()
+            chunk_count = 0
+            for chunk_id, chunk in enumerate(chunks):
+                pending.add(pool.submit(_map_chunk, chunk, chunk_id, partitions,
+                                        key, casefold, normalize, workdir))
+                chunk_count += 1
+                word_count += len(chunk)
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+            for future in pending:
+                future.result()
+
+            reduces = reduce_tasks()
+            pending = set()
+            for task in reduces:
+                pending.add(pool.submit(_reduce_partition, *task))
+                if len(pending) >= 2 * workers:
+                    break
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = next(reduces, None)
+                    if task is not None:
+                        pending.add(pool.submit(_reduce_partition, *task))
+                    yield from future.result()
+
+
+if __name__ == "__main__":
+    import random
+
+    def normalize(groups):
+        return sorted(sorted(group) for group in groups)
+
+    expected = [["act", "cat"], ["hat"], ["pots", "stop", "tops"]]
+    strategies = sorted(KEY_FUNCTIONS) + (["numpy"] if np is not None else [])
+
+    assert normalize(group_anagrams_by_count(sample)) == expected
+    assert normalize(group_anagrams_by_count_compact(sample)) == expected
+    assert normalize(group_anagrams_by_sorting(sample)) == expected
+    for strategy in strategies:
+        result = group_anagrams(sample, key=strategy)
+        assert normalize(result) == expected, f"{strategy} failed"
+        # same group order and word order as the original dict versions
+        assert result == group_anagrams_by_count_compact(sample), f"{strategy} reordered"
+    print(f"✓ Sample grouped the same by {', '.join(strategies)}")
+
+    rng = random.Random(16)
+    words = ["".join(rng.choice("abcde") for _ in range(rng.randint(0, 14)))
+             for _ in range(3000)]
+    words += ["a" * 300, "a" * 300, "Cat", "tac", "act", "été", "tée", "x1", "1x"]
+    lowercase_only = words[:3002]          # keeps the NumPy kernel on its fast path
+    for batch in (words, lowercase_only):
+        reference = normalize(group_anagrams_by_sorting(batch))
+        for strategy in strategies:
+            assert normalize(group_anagrams(batch, key=strategy)) == reference, strategy
+    print("✓ All strategies agree on long words, repeats > 255, mixed case and non-ASCII")
+
+    unicode_words = ["Tea", "eat", "ate", "café", "face\u0301", "éfac", "Straße", "strasse", "日本", "本日"]
+    for strategy in strategies:
+        assert normalize(group_anagrams(unicode_words, key=strategy)) == normalize(
+            [["Tea"], ["eat", "ate"], ["café", "face\u0301", "éfac"], ["Straße"], ["strasse"], ["日本", "本日"]]), strategy
+        assert normalize(group_anagrams(unicode_words, key=strategy, casefold=True)) == normalize(
+            [["Tea", "eat", "ate"], ["café", "face\u0301", "éfac"], ["Straße", "strasse"], ["日本", "本日"]]), strategy
+    assert normalize(group_anagrams(["café", "face\u0301"], normalize=False)) == [["café"], ["face\u0301"]]
+    print("✓ Unicode grouping passed (casefold, NFC, CJK) for every strategy")
+
+    # Parallel / streaming: same groups, same word order inside each group
+    reference = normalize(group_anagrams(words))
+    for workers in (1, 2):
+        stream = group_anagrams_parallel(iter(words), workers=workers, chunk_size=700)
+        assert not isinstance(stream, list)
+        assert normalize(stream) == reference, f"parallel workers={workers} failed"
+    result = list(group_anagrams_parallel(unicode_words, workers=2, casefold=True,
+                                          chunk_size=3, memory_cap_words=4))
+    assert sorted(result) == sorted([["Tea", "eat", "ate"], ["café", "face\u0301", "éfac"],
+                                     ["Straße", "strasse"], ["日本", "本日"]])
+    # no len(): the cap still bounds every reduce, via key slices
+    reduced_sizes = []
+    unsliced_reduce = _reduce_partition
+
+    def _measured_reduce(*task):
+        groups = unsliced_reduce(*task)
+        reduced_sizes.append(sum(map(len, groups)))
+        return groups
+
+    _reduce_partition = _measured_reduce
+    try:
+        stream = group_anagrams_parallel(iter(words), workers=1, chunk_size=700, memory_cap_words=10)
+        assert normalize(stream) == reference, "sliced reduce failed"
+    finally:
+        _reduce_partition = unsliced_reduce
+    # 3009 words / (64 partitions * 10) -> 5 slices each; one big anagram group can still top 10
+    assert len(reduced_sizes) == DEFAULT_PARTITIONS * 5 and sum(reduced_sizes) == len(words)
+    stream = group_anagrams_parallel(iter(words), workers=2, chunk_size=700, memory_cap_words=10)
+    assert normalize(stream) == reference, "sliced parallel reduce failed"
+    # partitions (and reduce slices) stay balanced for the default prime keys
+    spread = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(1, 10)))
+              for _ in range(20_000)]
+    for partitions in (4, 8):
+        sizes = [0] * partitions
+        for group_key, group in group_anagrams_partial(spread).items():
+            sizes[_stable_hash(group_key) % partitions] += len(group)
+        assert max(sizes) < 1.2 * len(spread) / partitions, sizes
+    print("✓ Parallel grouping matches (1 and 2 workers, iterables, tiny memory cap)")
+
+    try:
+        group_anagrams(sample, key="md5")
+        raise AssertionError("unknown key accepted")
+    except ValueError:
+        pass
+
+    print("\n🎉 All tests passed!")
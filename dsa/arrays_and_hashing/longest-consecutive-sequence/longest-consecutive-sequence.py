@@ -1,6 +1,20 @@
-from typing import List
+import heapq
+import os
+import sys
+from array import array
+from typing import Iterable, List, Optional, Tuple
 from collections import defaultdict
 
+
+if __package__:
+    from ._lazy import lazy_import
+else:  # run as a script: the helper is one folder up
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from _lazy import lazy_import
+
+# NumPy is optional - longestConsecutive_auto falls back to the set.
+np = lazy_import("numpy")
+
 def longestConsecutive(nums: List[int]) -> int:
     """
     Video explanation: https://www.youtube.com/watch?v=P6RZZMu_maU
@@ -154,6 +168,308 @@ def longestConsecutive_set(nums: List[int]) -> int:
     return longest
 
 
+# ============================================================
+# NumPy approach: sort + diff + run lengths
+# ============================================================
+
+def longestConsecutive_numpy(nums) -> int:
+    """
+    Vectorized version (O(n log n), but every step runs in C).
+    
+    1. np.unique -> sorted DISTINCT values     [1, 2, 3, 4, 100, 200]
+    2. where does a run break?                  next != current + 1
+                                                 breaks after index 3 and 4
+    3. run lengths = gaps between the breaks    [4, 1, 1] -> 4
+    
+    u[1:] == u[:-1] + 1 is used instead of np.diff(u) == 1: the +1 can
+    never overflow (u[:-1] is never the max value), a wide diff could.
+    """
+    if np is None:
+        raise ImportError("longestConsecutive_numpy needs NumPy installed")
+    arr = np.asarray(nums)
+    if arr.size == 0:
+        return 0
+    if arr.dtype.kind not in "iu":
+        # huge ints (object dtype) or floats -> the set version handles them
+        return longestConsecutive_set(list(nums))
+    
+    distinct = np.unique(arr)
+    breaks = np.flatnonzero(distinct[1:] != distinct[:-1] + 1)
+    # run boundaries: before the first element, after every break, after the last
+    boundaries = np.concatenate(([-1], breaks, [len(distinct) - 1]))
+    return int(np.max(np.diff(boundaries)))
+
+
+# below this, list -> array conversion costs more than the set loop
+NUMPY_MIN_SIZE = 1_000
+
+
+def longestConsecutive_auto(nums) -> int:
+    if np is not None and (isinstance(nums, np.ndarray) or len(nums) >= NUMPY_MIN_SIZE):
+        return longestConsecutive_numpy(nums)
+    return longestConsecutive_set(nums)
+
+
+# ============================================================
+# Bitmap approach: dense integer ranges
+# ============================================================
+
+DENSE_MAX_RANGE_PER_ITEM = 32     # bitmap <= 4 bytes per element
+_FULL_WORD = (1 << 64) - 1
+
+
+def _longest_ones_in_word(word: int) -> int:
+    # each `word &= word << 1` shortens every run of 1s by one bit,
+    # so the number of rounds until it's 0 is the longest run
+    rounds = 0
+    while word:
+        word &= word << 1
+        rounds += 1
+    return rounds
+
+
+def longestConsecutive_bitmap(nums: List[int]) -> int:
+    """
+    Same answer as longestConsecutive_set, but the "set" is a bitmap:
+    bit (num - lo) is 1 if num is present. For dense values (IDs, ranks...)
+    that's 1 bit per possible value instead of ~50-100 bytes per element.
+    
+    nums = [5, 3, 4, 9]  ->  lo = 3
+    offset:  0 1 2 3 4 5 6
+    bits:    1 1 1 0 0 0 1      longest run of 1s = 3
+    
+    Runs are found 64 bits at a time:
+    - all-ones word  -> the current run grows by 64, no bit work at all
+    - all-zero word  -> the current run ends
+    - mixed word     -> low end (trailing 1s) continues the current run,
+                        high end (leading 1s) starts the next one, and runs
+                        fully inside the word are measured with shift-and
+    
+    Too sparse (range > DENSE_MAX_RANGE_PER_ITEM * n) -> use the set version.
+    """
+    if not nums:
+        return 0
+    lo, hi = min(nums), max(nums)
+    if hi - lo + 1 > DENSE_MAX_RANGE_PER_ITEM * len(nums):
+        return longestConsecutive_set(nums)
+    
+    # pad to whole 64-bit words
+    bitmap = bytearray((((hi - lo) >> 6) + 1) * 8)
+    for num in nums:
+        offset = num - lo
+        bitmap[offset >> 3] |= 1 << (offset & 7)
+    
+    if sys.byteorder == "little":
+        words = memoryview(bitmap).cast("Q")
+    else:
+        words = [int.from_bytes(bitmap[i:i + 8], "little") for i in range(0, len(bitmap), 8)]
+    
+    longest = current = 0
+    for word in words:
+        if word == _FULL_WORD:
+            current += 64
+            continue
+        if word == 0:
+            longest = max(longest, current)
+            current = 0
+            continue
+        trailing_ones = (~word & (word + 1)).bit_length() - 1
+        longest = max(longest, current + trailing_ones, _longest_ones_in_word(word))
+        leading_ones = 64 - (~word & _FULL_WORD).bit_length()
+        current = leading_ones
+    return max(longest, current)
+
+
+# ============================================================
+# Live version: ConsecutiveRuns (adds AND removes)
+# ============================================================
+
+class ConsecutiveRuns:
+    """
+    Keeps the longest consecutive run up to date while numbers arrive
+    (add / add_many) and leave (discard).
+    
+    UNION-FIND over runs:
+    =====================
+    Every run [lo..hi] is one set. Each number points at a NODE, nodes point
+    at their parent node, and the root node of a set stores the run bounds.
+    
+        add(3) with runs [1,2] and [4]:
+            3's left neighbour 2 is in run [1,2], right neighbour 4 in run [4]
+            -> union all three into one set, root bounds = [1, 4]
+    
+    Union-find can't normally SPLIT a set, which is what discard needs:
+    
+        discard(3) from [1..6]  ->  [1, 2] and [4, 5, 6]
+    
+    Trick: the bigger half keeps the old root (only its bounds change). The
+    smaller half gets ONE brand-new root node and all its numbers are pointed
+    straight at it. Old nodes are never rewired, so any chain in the bigger
+    half still leads to its old root. Cost: O(size of the smaller half).
+    
+    Nodes are never freed one by one (a dead node can still be a link in
+    someone's chain), so once there are more than 2x as many nodes as
+    numbers, _compact() rebuilds the tables: one root per run, every number
+    pointing straight at it. Each rebuild is paid for by the n+ events that
+    created the dead nodes.
+    
+    LONGEST in O(1):
+    ================
+    Run lengths are kept in a count map plus a max-heap. Heap entries whose
+    length no longer exists are dropped lazily when they reach the top.
+    
+    Time:  add O(α(n)) amortized, discard O(smaller half), longest O(1) amortized
+    Worst case for discard: splitting one long run in the middle again and
+    again (discard(mid), add(mid), ...) relabels n/2 numbers EVERY time - on a
+    10M run that's ~5M steps per event. Random churn over many short runs stays
+    cheap. See the "consecutive-runs-churn" rows in benchmark.py; an O(log n)
+    split would need a sorted interval map (start -> end) instead.
+    Space: O(n) for n LIVE numbers: one dict entry each, at most 2n + 64 nodes
+    """
+    
+    def __init__(self, nums: Iterable[int] = ()):
+        self._node_of: dict = {}          # number -> node id
+        self._parent = array("q")         # node id -> parent node id
+        self._lo: List[int] = []          # node id -> run start (valid for roots)
+        self._hi: List[int] = []          # node id -> run end   (valid for roots)
+        self._length_count: dict = defaultdict(int)
+        self._length_heap: List[int] = []   # negated lengths (max-heap)
+        self.add_many(nums)
+    
+    def __len__(self) -> int:
+        return len(self._node_of)
+    
+    def __contains__(self, num: int) -> bool:
+        return num in self._node_of
+    
+    # ---------- union-find plumbing ----------
+    
+    def _new_root(self, lo: int, hi: int) -> int:
+        node = len(self._parent)
+        self._parent.append(node)
+        self._lo.append(lo)
+        self._hi.append(hi)
+        return node
+    
+    def _find(self, node: int) -> int:
+        parent = self._parent
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:       # path compression
+            parent[node], node = root, parent[node]
+        return root
+    
+    def _union(self, a: int, b: int) -> int:
+        # attach the shorter run under the longer one, keep the merged bounds
+        if self._hi[a] - self._lo[a] < self._hi[b] - self._lo[b]:
+            a, b = b, a
+        self._parent[b] = a
+        self._lo[a] = min(self._lo[a], self._lo[b])
+        self._hi[a] = max(self._hi[a], self._hi[b])
+        return a
+    
+    # ---------- run length bookkeeping ----------
+    
+    def _add_length(self, length: int) -> None:
+        self._length_count[length] += 1
+        heapq.heappush(self._length_heap, -length)
+        if len(self._length_heap) > 2 * len(self._length_count) + 64:
+            # too many stale entries: rebuild from the live lengths
+            self._length_heap = [-length for length in self._length_count]
+            heapq.heapify(self._length_heap)
+    
+    def _remove_length(self, length: int) -> None:
+        self._length_count[length] -= 1
+        if not self._length_count[length]:
+            del self._length_count[length]
+    
+    def _run_length(self, root: int) -> int:
+        return self._hi[root] - self._lo[root] + 1
+    
+    def _maybe_compact(self) -> None:
+        if len(self._parent) > 2 * len(self._node_of) + 64:
+            self._compact()
+    
+    def _compact(self) -> None:
+        parent, lo, hi = array("q"), [], []
+        new_id = {}                       # old root -> new root
+        for num, node in self._node_of.items():
+            root = self._find(node)
+            node = new_id.get(root)
+            if node is None:
+                node = new_id[root] = len(parent)
+                parent.append(node)
+                lo.append(self._lo[root])
+                hi.append(self._hi[root])
+            self._node_of[num] = node
+        self._parent, self._lo, self._hi = parent, lo, hi
+    
+    # ---------- public API ----------
+    
+    def add(self, num: int) -> None:
+        if num in self._node_of:
+            return
+        root = self._new_root(num, num)
+        self._node_of[num] = root
+        
+        for neighbour in (num - 1, num + 1):
+            node = self._node_of.get(neighbour)
+            if node is not None:
+                other = self._find(node)
+                self._remove_length(self._run_length(other))
+                root = self._union(root, other)
+        self._add_length(self._run_length(root))
+        self._maybe_compact()
+    
+    def add_many(self, nums: Iterable[int]) -> None:
+        for num in nums:
+            self.add(num)
+    
+    def discard(self, num: int) -> None:
+        node = self._node_of.pop(num, None)
+        if node is None:
+            return
+        root = self._find(node)
+        lo, hi = self._lo[root], self._hi[root]
+        self._remove_length(hi - lo + 1)
+        
+        left = (lo, num - 1) if num > lo else None
+        right = (num + 1, hi) if num < hi else None
+        if left and right:
+            # split: the smaller half moves to a fresh root
+            if left[1] - left[0] < right[1] - right[0]:
+                small, big = left, right
+            else:
+                small, big = right, left
+            new_root = self._new_root(*small)
+            for value in range(small[0], small[1] + 1):
+                self._node_of[value] = new_root
+            self._add_length(small[1] - small[0] + 1)
+            left = big
+            right = None
+        
+        remaining = left or right
+        if remaining:
+            self._lo[root], self._hi[root] = remaining
+            self._add_length(remaining[1] - remaining[0] + 1)
+        self._maybe_compact()
+    
+    def longest(self) -> int:
+        heap = self._length_heap
+        while heap and -heap[0] not in self._length_count:
+            heapq.heappop(heap)       # stale: no run has this length any more
+        return -heap[0] if heap else 0
+    
+    def run_containing(self, num: int) -> Optional[Tuple[int, int]]:
+        """(start, end) of the run num is in, or None if num isn't present."""
+        node = self._node_of.get(num)
+        if node is None:
+            return None
+        root = self._find(node)
+        return self._lo[root], self._hi[root]
+
+
 # ============================================================
 # TEST CASES
 # ============================================================
@@ -166,13 +482,58 @@ if __name__ == "__main__":
         ([], 0),                                # Empty
         ([1], 1),                               # Single element
         ([1, 2, 0, 1], 3),                      # Duplicates [0,1,2]
+        ([2**70, 2**70 + 1, 5], 2),             # Beyond int64 (NumPy falls back)
+        ([-(2**63), 2**63 - 1], 1),             # int64 extremes, no overflow
     ]
     
     for nums, expected in test_cases:
         result_map = longestConsecutive(nums)
         result_set = longestConsecutive_set(nums)
+        result_auto = longestConsecutive_auto(nums)
+        assert longestConsecutive_bitmap(nums) == expected, f"bitmap failed for {nums}"
+        assert result_auto == expected, f"auto failed for {nums}"
+        if np is not None:
+            assert longestConsecutive_numpy(nums) == expected, f"NumPy failed for {nums}"
         print(f"nums: {nums}")
         print(f"  HashMap approach: {result_map} (expected: {expected})")
         print(f"  HashSet approach: {result_set}")
         print(f"  {'✓' if result_map == expected else '✗'}")
-        print()
\ No newline at end of file
+        print()
+
+    # ConsecutiveRuns: random adds/discards checked against a fresh recount
+    import random
+    rng = random.Random(0)
+    runs = ConsecutiveRuns()
+    live = set()
+    for step in range(5_000):
+        num = rng.randrange(200)
+        if rng.random() < 0.35:
+            runs.discard(num)
+            live.discard(num)
+        else:
+            runs.add(num)
+            live.add(num)
+        assert runs.longest() == longestConsecutive_set(list(live)), f"step {step}"
+        probe = rng.randrange(200)
+        if probe in live:
+            lo, hi = runs.run_containing(probe)
+            assert all(v in live for v in range(lo, hi + 1))
+            assert lo - 1 not in live and hi + 1 not in live
+        else:
+            assert runs.run_containing(probe) is None
+        assert len(runs._parent) <= 2 * len(live) + 65, "dead nodes not compacted"
+    # long churn over a few live numbers: node tables track live values, not events
+    churn = ConsecutiveRuns(range(50))
+    for step in range(20_000):
+        churn.discard(25 + step % 3)
+        churn.add(25 + step % 3)
+    assert churn.longest() == 50 and len(churn._parent) <= 2 * 50 + 65
+    for nums, expected in test_cases:
+        assert ConsecutiveRuns(nums).longest() == expected, f"ConsecutiveRuns failed for {nums}"
+    for _ in range(300):
+        size = rng.randrange(1, 400)
+        nums = [rng.randrange(-300, 300) for _ in range(size)]
+        assert longestConsecutive_bitmap(nums) == longestConsecutive_set(nums), nums
+    assert longestConsecutive_bitmap(list(range(1000)) + [5000]) == 1000   # crosses full words
+    print("✓ ConsecutiveRuns matches a recount after every add/discard")
+    print("✓ Bitmap version matches the set version")
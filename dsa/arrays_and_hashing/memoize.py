@@ -0,0 +1,483 @@
+"""
+Opt-in result caching for solution functions that see the same input again.
+
+If a workload keeps asking group_anagrams / topK_FrequentElement_heap /
+isValidSudoku / twoSum* the same question, the second answer can come from a
+dict instead of being recomputed:
+
+    cache = ResultCache(max_bytes=16 * 2**20, policy="lfu")
+    fast_top_k = memoize(topK_FrequentElement_heap, cache=cache)
+
+    solutions = memoized_solutions()          # every cacheable solution, one cache
+    solutions["isValidSudoku"](board)
+    solutions["isValidSudoku"].cache.stats()  # hits, misses, evictions, bytes ...
+
+How the key is built (content, not identity - an equal list is a hit):
+- array-backed inputs (bytes, bytearray, array.array, NumPy arrays) are hashed
+  through a memoryview: xxh3-128 when the xxhash package is installed,
+  blake2b-128 otherwise. The key keeps only the digest, never the data.
+- everything else is frozen into nested tuples; the dict then hashes AND
+  compares them, so two different inputs can never share an answer.
+Building the key is O(n), so a hit only pays off when the function does more
+than one cheap pass - topK_FrequentElement_heap, group_anagrams. For twoSum
+and a single 9x9 board the hit path costs about as much as the answer (see
+the "(memoized, warm)" rows in benchmark.py).
+
+Eviction is by a byte budget (keys + results, measured with sys.getsizeof):
+- "lru": drop the entry used longest ago
+- "lfu": drop the entry used least often (oldest first on ties), O(1) per op
+
+Mutation safety:
+- hasDuplicateSort sorts its argument. Wrap it with mutates_input=True and the
+  function runs on a shallow copy, so the caller's list is left alone on a
+  miss AND on a hit (calling it uncached still sorts in place).
+- results are stored and handed out as fresh copies, so mutating a returned
+  list can't corrupt the next hit.
+"""
+
+import copy
+import functools
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+if __package__:
+    from ._lazy import lazy_import
+else:  # run as a script from this folder
+    from _lazy import lazy_import
+
+# NumPy is optional - without it, arrays just never show up as inputs.
+np = lazy_import("numpy")
+
+try:
+    import xxhash
+except ImportError:  # blake2b is in the standard library and still fast
+    xxhash = None
+
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+# solutions that modify their arguments: memoized_solutions() passes mutates_input=True
+MUTATING_SOLUTIONS = {"hasDuplicateSort"}
+
+# name -> submodule for memoized_solutions(); twoSum* is expanded there
+CACHEABLE_SOLUTIONS = {
+    "group_anagrams": "group_anagrams_module",
+    "group_anagrams_by_count": "group_anagrams_module",
+    "group_anagrams_by_sorting": "group_anagrams_module",
+    "topK_FrequentElement_heap": "top_k_frequent_elements",
+    "topK_FrequentElement": "top_k_frequent_elements",
+    "isValidSudoku": "valid_sudoku",
+    "isValidSudoku_bitmask": "valid_sudoku",
+    "hasDuplicateSort": "contains_any_duplicate",
+}
+
+
+# ============================================================
+# Content keys
+# ============================================================
+
+def _digest(view: memoryview) -> bytes:
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(view)
+    return hashlib.blake2b(view, digest_size=16).digest()
+
+
+def _is_ndarray(value) -> bool:
+    # checking the type's module first keeps a lazy np from importing NumPy
+    # just to learn that a list isn't an array
+    return np is not None and type(value).__module__ == "numpy" and isinstance(value, np.ndarray)
+
+
+def _buffer_key(value) -> Optional[Tuple]:
+    """(format, shape, digest) for array-backed values, None for anything else."""
+    if _is_ndarray(value):
+        if value.dtype.hasobject:
+            return None                     # pointers, not content
+        flat = np.ascontiguousarray(value).reshape(-1)
+        return ("ndarray", value.dtype.str, value.shape, _digest(memoryview(flat.view(np.uint8))))
+    if not isinstance(value, (bytes, bytearray, memoryview)) and not hasattr(value, "buffer_info"):
+        return None                         # buffer_info: array.array
+    view = memoryview(value)
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    return ("buffer", view.format, view.shape, _digest(view.cast("B")))
+
+
+_CONTAINERS = (list, tuple, dict, set, bytearray)
+
+
+def _is_container(value) -> bool:
+    return type(value) in _CONTAINERS
+
+
+def _freeze(value, deep: bool = False) -> Hashable:
+    """A hashable stand-in for `value` that is equal exactly when the content is."""
+    key = _buffer_key(value)
+    if key is not None:
+        return key
+    if isinstance(value, (list, tuple)):
+        if deep:                            # e.g. a sudoku board: rows are lists too
+            return tuple(tuple(item) if type(item) is list and not any(map(_is_container, item))
+                         else _freeze(item, True) for item in value)
+        return tuple(value)                 # flat list of ints / strs: all in C
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    if isinstance(value, dict):
+        return ("dict", tuple((k, _freeze(v, deep)) for k, v in value.items()))
+    return value                            # _Key raises TypeError if it isn't hashable
+
+
+class _Key:
+    """A frozen input with its hash computed once - tuples re-hash on every lookup."""
+
+    __slots__ = ("value", "hash")
+
+    def __init__(self, value: Tuple):
+        self.value = value
+        self.hash = hash(value)             # raises TypeError: can't cache this
+
+    def __hash__(self) -> int:
+        return self.hash
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _Key) and self.hash == other.hash and self.value == other.value
+
+
+def content_key(func: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Hashable:
+    """Cache key for func(*args, **kwargs); raises TypeError for unhashable inputs."""
+    # the function object itself (hashed by identity), not its name: two
+    # lambdas or closures share a __qualname__, and partials have none
+    def build(deep):
+        return _Key((func,
+                     tuple(_freeze(arg, deep) for arg in args),
+                     tuple(sorted((name, _freeze(value, deep)) for name, value in kwargs.items()))))
+    try:
+        return build(False)                 # one C-level tuple + hash per flat argument
+    except TypeError:
+        return build(True)                  # something nested: freeze all the way down
+
+
+# ============================================================
+# Sizes and copies
+# ============================================================
+
+def _sizeof(value) -> int:
+    """Bytes held by `value` and everything it contains (shared objects counted again)."""
+    if isinstance(value, _Key):
+        return sys.getsizeof(value) + _sizeof(value.value)
+    if _is_ndarray(value):
+        return sys.getsizeof(value) + (0 if value.base is None else value.nbytes)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size = sys.getsizeof(value)
+        if all(isinstance(item, (int, float, str, bytes, bool)) for item in value):
+            return size + sum(map(sys.getsizeof, value))    # flat: no recursion
+        return size + sum(_sizeof(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_sizeof(k) + _sizeof(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+def _clone(value):
+    """A copy deep enough that the caller can't reach what the cache holds."""
+    if isinstance(value, list):
+        return [_clone(item) if type(item) in _CONTAINERS else item for item in value]
+    if isinstance(value, dict):
+        return {k: _clone(v) if type(v) in _CONTAINERS else v for k, v in value.items()}
+    if isinstance(value, (set, bytearray)):
+        return value.copy()
+    if _is_ndarray(value):
+        return value.copy()
+    return value                            # ints, strs, bools, tuples of those
+
+
+# ============================================================
+# Cache
+# ============================================================
+
+class ResultCache:
+    """
+    Byte-bounded result store with LRU or LFU eviction and hit/miss counters.
+
+    Safe to share between threads and between functions (keys include the
+    function). Entries bigger than the whole budget are simply not stored.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, policy: str = "lru"):
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"policy must be 'lru' or 'lfu', got {policy!r}")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            # key -> [value, size, frequency]
+            self._entries: "OrderedDict[Hashable, list]" = OrderedDict()
+            # LFU only: frequency -> keys in least-recent-first order
+            self._by_frequency: Dict[int, "OrderedDict[Hashable, None]"] = {}
+            self._min_frequency = 0
+            self.bytes = 0
+            self.hits = self.misses = self.evictions = self.rejected = self.uncacheable = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """(True, value) on a hit, (False, None) on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            if self.policy == "lru":
+                self._entries.move_to_end(key)
+            else:
+                self._bump(key, entry)
+            return True, entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int) -> bool:
+        """Store value (size bytes, key included); returns False if it can't fit at all."""
+        with self._lock:
+            if size > self.max_bytes:
+                self.rejected += 1
+                return False
+            if key in self._entries:
+                self._remove(key)
+            while self.bytes + size > self.max_bytes:
+                self._evict()
+            self._entries[key] = [value, size, 1]
+            self.bytes += size
+            if self.policy == "lfu":
+                self._by_frequency.setdefault(1, OrderedDict())[key] = None
+                self._min_frequency = 1
+            return True
+
+    def _bump(self, key: Hashable, entry: list) -> None:
+        frequency = entry[2]
+        bucket = self._by_frequency[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._by_frequency[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency = frequency + 1
+        entry[2] = frequency + 1
+        self._by_frequency.setdefault(frequency + 1, OrderedDict())[key] = None
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, frequency = self._entries.pop(key)
+        self.bytes -= size
+        if self.policy == "lfu":
+            bucket = self._by_frequency[frequency]
+            del bucket[key]
+            if not bucket:
+                del self._by_frequency[frequency]
+                if self._by_frequency and frequency == self._min_frequency:
+                    self._min_frequency = min(self._by_frequency)
+
+    def _evict(self) -> None:
+        if self.policy == "lru":
+            key = next(iter(self._entries))
+        else:
+            key = next(iter(self._by_frequency[self._min_frequency]))
+        self._remove(key)
+        self.evictions += 1
+
+    def note_uncacheable(self) -> None:
+        with self._lock:
+            self.uncacheable += 1
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "policy": self.policy, "entries": len(self._entries),
+            "bytes": self.bytes, "max_bytes": self.max_bytes,
+            "hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate,
+            "evictions": self.evictions, "rejected": self.rejected,
+            "uncacheable": self.uncacheable,
+        }
+
+
+# ============================================================
+# Wrapping functions
+# ============================================================
+
+def memoize(func: Optional[Callable] = None, *, cache: Optional[ResultCache] = None,
+            max_bytes: int = DEFAULT_MAX_BYTES, policy: str = "lru",
+            mutates_input: bool = False):
+    """
+    Cache func's results by input content. Usable as @memoize or @memoize(...).
+
+    cache: share one ResultCache (and its budget) between several functions;
+    by default each wrapper gets its own with max_bytes / policy.
+    mutates_input: run func on shallow copies of its arguments so neither a
+    hit nor a miss changes what the caller passed in (hasDuplicateSort).
+    Inputs that can't be frozen (objects with __eq__ but no __hash__) go straight
+    through and are counted as `uncacheable`.
+    """
+    if func is None:
+        return functools.partial(memoize, cache=cache, max_bytes=max_bytes,
+                                 policy=policy, mutates_input=mutates_input)
+    store = cache if cache is not None else ResultCache(max_bytes, policy)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            key = content_key(func, args, kwargs)
+        except TypeError:
+            store.note_uncacheable()
+            return func(*args, **kwargs)
+
+        found, value = store.get(key)
+        if found:
+            return _clone(value)
+
+        if mutates_input:
+            args = tuple(copy.copy(arg) for arg in args)
+        result = func(*args, **kwargs)
+        stored = _clone(result)
+        store.put(key, stored, _sizeof(key) + _sizeof(stored))
+        return result
+
+    wrapper.cache = store
+    wrapper.cache_clear = store.clear
+    return wrapper
+
+
+def memoized_solutions(cache: Optional[ResultCache] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                       policy: str = "lru") -> Dict[str, Callable]:
+    """
+    {name: memoized function} for CACHEABLE_SOLUTIONS plus every twoSum*,
+    all sharing one cache. The solution modules themselves are not modified.
+    """
+    import importlib
+
+    import dsa.arrays_and_hashing as solutions
+
+    def module(name):
+        return importlib.import_module(f"{solutions.__name__}.{name}")
+
+    store = cache if cache is not None else ResultCache(max_bytes, policy)
+    names = dict(CACHEABLE_SOLUTIONS)
+    names.update((name, "two_sum") for name in dir(module("two_sum"))
+                 if name.startswith("twoSum"))
+    return {
+        name: memoize(getattr(module(submodule), name), cache=store,
+                      mutates_input=name in MUTATING_SOLUTIONS)
+        for name, submodule in sorted(names.items())
+    }
+
+
+if __name__ == "__main__":
+    import array
+    import os
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+    # --- keys: equal content -> equal key, different content -> different key
+    def f(*args, **kwargs):
+        return None
+
+    assert content_key(f, ([1, 2, 3], 4), {}) == content_key(f, ([1, 2, 3], 4), {})
+    assert content_key(f, ([1, 2, 3], 4), {}) != content_key(f, ([1, 2, 4], 4), {})
+    assert content_key(f, ([["1", "."], [".", "2"]],), {}) == content_key(f, ([["1", "."], [".", "2"]],), {})
+    a, b = array.array("q", [1, 2, 3]), array.array("q", [1, 2, 3])
+    assert content_key(f, (a,), {}) == content_key(f, (b,), {})
+    assert content_key(f, (a,), {}) != content_key(f, (array.array("i", [1, 2, 3]),), {})
+    assert content_key(f, ([1],), {"k": 2}) != content_key(f, ([1],), {"k": 3})
+
+    # --- LRU: touching "a" makes "b" the victim
+    lru = ResultCache(max_bytes=300, policy="lru")
+    for name in "abc":
+        lru.put(name, name, 100)
+    assert lru.get("a") == (True, "a")
+    lru.put("d", "d", 100)
+    assert lru.get("b") == (False, None) and lru.evictions == 1
+    assert lru.get("a")[0] and lru.get("c")[0] and lru.get("d")[0]
+
+    # --- LFU: "a" used 3 times, "b" twice, "c" once -> "c" goes
+    lfu = ResultCache(max_bytes=300, policy="lfu")
+    for name in "abc":
+        lfu.put(name, name, 100)
+    for name in "aab":
+        lfu.get(name)
+    lfu.put("d", "d", 100)
+    assert lfu.get("c") == (False, None)
+    lfu.put("e", "e", 100)                         # "d" (1 use) goes before "b"
+    assert not lfu.get("d")[0] and lfu.get("b")[0]
+    assert lfu.bytes == 300 and len(lfu) == 3
+
+    # --- budget: too big is rejected, the rest fit
+    tiny = ResultCache(max_bytes=50)
+    assert tiny.put("x", "x", 51) is False and tiny.rejected == 1 and len(tiny) == 0
+
+    # --- the solutions, memoized
+    memo = memoized_solutions(max_bytes=2**20)
+    import dsa.arrays_and_hashing as solutions
+
+    nums = [4, 1, 4, 2, 4, 1, 3]
+    assert memo["topK_FrequentElement_heap"](nums, 2) == solutions.topK_FrequentElement_heap(nums, 2)
+    assert memo["topK_FrequentElement_heap"](list(nums), 2) == solutions.topK_FrequentElement_heap(nums, 2)
+    stats = memo["topK_FrequentElement_heap"].cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1, stats
+
+    assert memo["twoSumPopularOnePass"]([2, 7, 11, 15], 9) == [0, 1]
+    assert memo["twoSumPopularOnePass"]([2, 7, 11, 15], 9) == [0, 1]
+    assert memo["twoSumPopularOnePass"]([2, 7, 11, 15], 18) == [1, 2]   # new target = new key
+    assert "twoSumAuto" in memo and "TwoSumIndex" not in memo
+
+    # returned results are copies: mutating one doesn't poison the cache
+    groups = memo["group_anagrams"](["eat", "tea", "tan", "ate", "nat", "bat"])
+    groups[0].append("oops")
+    assert memo["group_anagrams"](["eat", "tea", "tan", "ate", "nat", "bat"]) == \
+        [["eat", "tea", "ate"], ["tan", "nat"], ["bat"]]
+
+    board = [["5", "3", ".", ".", "7", ".", ".", ".", "."]] + [["."] * 9 for _ in range(8)]
+    assert memo["isValidSudoku"](board) is True
+    board[1][1] = "5"                              # same box as board[0][0]: new content, new key
+    assert memo["isValidSudoku"](board) is False
+
+    # hasDuplicateSort no longer sorts the caller's list - miss or hit
+    unsorted = [3, 1, 2, 1]
+    assert memo["hasDuplicateSort"](unsorted) is True
+    assert memo["hasDuplicateSort"](unsorted) is True
+    assert unsorted == [3, 1, 2, 1]
+
+    # one shared budget across every function
+    assert len({id(func.cache) for func in memo.values()}) == 1
+
+    # keys hold the function itself: same-named lambdas and partials can share a cache
+    shared = ResultCache()
+    double = memoize(lambda values: [2 * v for v in values], cache=shared)
+    square = memoize(lambda values: [v * v for v in values], cache=shared)
+    assert double([3]) == [6] and square([3]) == [9] and len(shared) == 2
+    power = memoize(functools.partial(pow, exp=3), cache=shared)
+    assert power(2) == 8 and power(2) == 8 and shared.hits == 1
+
+    # unhashable input: passes through uncached
+    class Unhashable:
+        __hash__ = None
+
+    passthrough = memoize(lambda items: len(items))
+    assert passthrough([Unhashable()]) == 1 and passthrough([Unhashable()]) == 1
+    assert passthrough.cache.uncacheable == 2 and len(passthrough.cache) == 0
+
+    if np is not None:
+        arr = np.arange(10, dtype=np.int64)
+        summed = memoize(lambda values: int(values.sum()))
+        assert summed(arr) == 45 and summed(arr.copy()) == 45
+        assert summed.cache.hits == 1
+        assert summed(arr[::2]) == 20                # strided view: hashed by content
+        assert summed.cache.misses == 2
+
+    print("memoize: all checks passed")
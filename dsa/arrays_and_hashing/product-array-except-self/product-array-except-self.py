@@ -1,4 +1,19 @@
-from typing import List
+import math
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+
+if __package__:
+    from ._lazy import lazy_import
+else:  # run as a script: the helper is one folder up
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from _lazy import lazy_import
+
+# NumPy is optional - productExceptSelf_auto falls back to the loop.
+np = lazy_import("numpy")
 
 def productExceptSelf(nums: List[int]) -> List[int]:
     """
@@ -116,4 +131,474 @@ def productExceptSelf(nums: List[int]) -> List[int]:
 # For index 3 (value=4):
 #   Everything BEFORE: 1*1*2*3 = 6
 #   Everything AFTER:  1
-#   Answer: 6 * 1 = 6
\ No newline at end of file
+#   Answer: 6 * 1 = 6
+
+
+# ============================================================
+# NumPy version: cumprod instead of the two Python loops
+# ============================================================
+#
+# prefix = [1, a0, a0*a1, ...]         (np.cumprod, shifted right by one)
+# suffix = [..., a2*a3, a3, 1]         (np.cumprod of the reversed array)
+# answer = prefix * suffix
+#
+# Two things the Python version gets "for free" need care here:
+#
+# 1. OVERFLOW: Python ints never overflow, int64 does (silently!).
+#    For nonzero integers every prefix/suffix is at most the product of all
+#    |values|, so if sum(log2|a|) < 62 nothing can overflow. Otherwise fall
+#    back to the Python bignum version.
+#
+# 2. ZEROS: products involving a zero are 0 anyway, so count them first:
+#      2+ zeros -> every answer is 0
+#      1 zero   -> only the zero's own slot is nonzero (product of the rest)
+#    This also keeps zeros out of the log2 overflow check.
+
+INT64_SAFE_BITS = 62
+
+
+def productExceptSelf_numpy(nums) -> List:
+    if np is None:
+        raise ImportError("productExceptSelf_numpy needs NumPy installed")
+    arr = np.asarray(nums)
+    if arr.size == 0:
+        return []
+    if arr.dtype.kind not in "iufb":
+        return productExceptSelf(list(nums))
+    if arr.dtype.kind == "b":
+        arr = arr.astype(np.int64)
+
+    zero_positions = np.flatnonzero(arr == 0)
+    if len(zero_positions) >= 2:
+        return np.zeros_like(arr).tolist()
+
+    nonzero = arr if len(zero_positions) == 0 else np.delete(arr, zero_positions[0])
+    if arr.dtype.kind in "iu":
+        bits = float(np.sum(np.log2(np.abs(nonzero.astype(np.float64))))) if nonzero.size else 0.0
+        if bits >= INT64_SAFE_BITS:
+            return productExceptSelf(arr.tolist())      # would overflow int64
+        arr = arr.astype(np.int64)
+        nonzero = nonzero.astype(np.int64)
+
+    if len(zero_positions) == 1:
+        result = np.zeros_like(arr)
+        result[zero_positions[0]] = np.prod(nonzero)
+        return result.tolist()
+
+    prefix = np.ones_like(arr)
+    np.cumprod(arr[:-1], out=prefix[1:])
+    suffix = np.ones_like(arr)
+    np.cumprod(arr[::-1][:-1], out=suffix[:-1][::-1])
+    return (prefix * suffix).tolist()
+
+
+# below this, list -> array conversion costs more than the two loops
+NUMPY_MIN_SIZE = 500
+
+
+def productExceptSelf_auto(nums) -> List:
+    """NumPy for arrays / big inputs when int64 is safe, the loop version otherwise."""
+    if np is not None and (isinstance(nums, np.ndarray) or len(nums) >= NUMPY_MIN_SIZE):
+        return productExceptSelf_numpy(nums)
+    return productExceptSelf(nums)
+
+
+# ============================================================
+# Bounded modes: stop the prefix/suffix from becoming bignums
+# ============================================================
+#
+# Python ints never overflow, they just GROW. With 10^6 values like 7, the
+# running prefix ends up with ~2.8 million bits, and every multiply has to
+# touch all of them -> the "O(n)" loop quietly becomes O(n^2) in bit work.
+#
+# productExceptSelf_bounded keeps every number small instead:
+#
+#   mode="int64" : exact, but raises OverflowError if any product can't fit in
+#                  a signed 64-bit int (checked up front in one pass)
+#   mode="mod"   : every product reduced modulo `mod` (the usual 10^9 + 7 trick)
+#   mode="log"   : floats via logs: |answer_i| = exp(sum(log|a|) - log|a_i|),
+#                  sign from the count of negatives. Approximate, never huge
+#                  (can reach inf / 0.0 where the real answer is astronomic)
+#   mode="exact" : the original bignum answer, plus the zero fast paths below
+#
+# Zero fast path (all modes): count zeros first.
+#   2+ zeros -> every answer is 0, return immediately
+#   1 zero   -> only the zero's slot is nonzero: product of everything else
+
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+PRODUCT_MODES = ("exact", "int64", "mod", "log")
+
+
+def _product_of_rest(nums: List[int], skip: int, mode: str, mod: Optional[int]):
+    if mode == "log":
+        rest = [num for i, num in enumerate(nums) if i != skip]
+        sign = -1.0 if sum(num < 0 for num in rest) % 2 else 1.0
+        exponent = math.fsum(math.log(abs(num)) for num in rest)
+        return sign * math.exp(exponent) if exponent < 709.0 else sign * math.inf
+
+    product = 1
+    for i, num in enumerate(nums):
+        if i == skip:
+            continue
+        product = product * num % mod if mode == "mod" else product * num
+        if mode == "int64" and not INT64_MIN <= product <= INT64_MAX:
+            raise OverflowError(f"product exceeds int64 at index {i}")
+    return product
+
+
+def _product_except_self_log(nums: List[int]) -> List[float]:
+    # no zeros here: the fast path already handled them
+    log_total = math.fsum(math.log(abs(num)) for num in nums)
+    negatives = sum(num < 0 for num in nums)
+    result = []
+    for num in nums:
+        # exclude num itself: its log, and its sign if it's negative
+        sign = -1.0 if (negatives - (num < 0)) % 2 else 1.0
+        exponent = log_total - math.log(abs(num))
+        result.append(sign * math.exp(exponent) if exponent < 709.0 else sign * math.inf)
+    return result
+
+
+def productExceptSelf_bounded(nums: List[int], mode: str = "exact",
+                              mod: Optional[int] = None) -> List:
+    if mode not in PRODUCT_MODES:
+        raise ValueError(f"unknown mode {mode!r}, expected one of {PRODUCT_MODES}")
+    if (mode == "mod") != (mod is not None):
+        raise ValueError("mod=... is required for mode='mod' (and only for it)")
+    if mode == "mod" and mod <= 0:
+        raise ValueError("mod must be positive")
+
+    arrayLength = len(nums)
+    zero = 0.0 if mode == "log" else 0
+
+    # ========== zero fast path ==========
+    zero_count = 0
+    zero_index = -1
+    for i, num in enumerate(nums):
+        if num == 0:
+            zero_count += 1
+            zero_index = i
+            if zero_count == 2:
+                return [zero] * arrayLength
+    if zero_count == 1:
+        resultArray = [zero] * arrayLength
+        resultArray[zero_index] = _product_of_rest(nums, zero_index, mode, mod)
+        return resultArray
+
+    if mode == "log":
+        return _product_except_self_log(nums)
+    if mode == "int64":
+        # every answer divides the total, so once the total fits (checked step
+        # by step) |answer| <= |total| <= 2^63. The one answer that can still
+        # overflow is +2^63 = INT64_MIN / -1, e.g. [-1, 2**62, 2]
+        total = _product_of_rest(nums, -1, mode, mod)
+        if total == INT64_MIN and -1 in nums:
+            raise OverflowError("product exceeds int64: INT64_MIN / -1")
+        return productExceptSelf(nums)
+    if mode == "exact":
+        return productExceptSelf(nums)
+
+    # ========== mod: same two passes, reduced every step ==========
+    resultArray = [1 % mod] * arrayLength
+    prefix = 1
+    for i in range(arrayLength):
+        resultArray[i] = prefix
+        prefix = prefix * nums[i] % mod
+    suffix = 1
+    for i in range(arrayLength - 1, -1, -1):
+        resultArray[i] = resultArray[i] * suffix % mod
+        suffix = suffix * nums[i] % mod
+    return resultArray
+
+
+# ============================================================
+# Out-of-core: arrays bigger than RAM, in fixed-size chunks
+# ============================================================
+#
+# productExceptSelf_file reads raw int64 values from one file and writes the
+# answers to another, keeping only ONE chunk in memory per worker. It uses
+# the bounded modes from above (int64 / mod) - bignums can't live on disk.
+#
+# The prefix/suffix idea still works across chunks, we just carry the
+# products in from the neighbouring chunks:
+#
+#   chunks:      [ 1 2 ] [ 3 4 ] [ 5 6 ]
+#   totals:         2       12      30          <- phase 1, one number per chunk
+#   prefix carry:   1       2       24          <- product of totals BEFORE the chunk
+#   suffix carry:   360     30      1           <- product of totals AFTER the chunk
+#
+#   phase 2, chunk [3 4]:   answer[i] = (2 * prefix inside chunk) * (30 * suffix inside chunk)
+#                           3 -> (2*1) * (30*4) = 240,   4 -> (2*3) * (30*1) = 180
+#
+# Both phases treat every chunk independently, so with workers > 1 they run in
+# a process pool; each worker reads/writes only its own slice of the files.
+# (With one worker this is exactly the forward prefix pass + backward suffix
+# pass, just done chunk by chunk.)
+#
+# File format: little-endian int64, e.g. array("q").tofile / ndarray.tofile.
+# NumPy (np.memmap) is used when installed, array.fromfile/tofile otherwise.
+
+INT64_BYTES = 8
+DEFAULT_CHUNK_SIZE = 1 << 20
+FILE_MODES = ("int64", "mod")
+
+
+def _read_int64(path: str, start: int, stop: int):
+    if np is not None:
+        return np.array(np.memmap(path, dtype="<i8", mode="r",
+                                  offset=start * INT64_BYTES, shape=(stop - start,)))
+    values = array("q")
+    with open(path, "rb") as f:
+        f.seek(start * INT64_BYTES)
+        values.fromfile(f, stop - start)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def _write_int64(path: str, start: int, values) -> None:
+    if np is not None:
+        out = np.memmap(path, dtype="<i8", mode="r+",
+                        offset=start * INT64_BYTES, shape=(len(values),))
+        out[:] = values
+        out.flush()
+        del out
+        return
+    values = array("q", values)
+    if sys.byteorder != "little":
+        values.byteswap()
+    with open(path, "r+b") as f:
+        f.seek(start * INT64_BYTES)
+        values.tofile(f)
+
+
+def _reduce(value: int, mode: str, mod: Optional[int]) -> int:
+    if mode == "mod":
+        return value % mod
+    if not INT64_MIN <= value <= INT64_MAX:
+        raise OverflowError("product exceeds int64")
+    return value
+
+
+def _chunk_summary(src: str, start: int, stop: int, mode: str,
+                   mod: Optional[int]) -> Tuple[int, int, Optional[int]]:
+    """
+    Phase 1: (zero count, index of a zero or -1, product of the nonzero values).
+    In int64 mode the product is None once it leaves int64 - not an error yet:
+    with two zeros elsewhere nobody needs it. |product| never shrinks (no zeros
+    in it), so once out of range it stays out.
+    """
+    zero_count = 0
+    zero_index = -1
+    product = 1
+    for offset, num in enumerate(_read_int64(src, start, stop).tolist()):
+        if num == 0:
+            zero_count += 1
+            zero_index = start + offset
+        elif product is not None:
+            product = product * num % mod if mode == "mod" else product * num
+            if mode == "int64" and not INT64_MIN <= product <= INT64_MAX:
+                product = None
+    return zero_count, zero_index, product
+
+
+def _chunk_finalize(src: str, dst: str, start: int, stop: int, prefix_carry: int,
+                    suffix_carry: int, mode: str, mod: Optional[int]) -> None:
+    """Phase 2 (no zeros anywhere): write answer[start:stop] using the carries."""
+    values = _read_int64(src, start, stop)
+
+    if np is not None and mode == "int64":
+        # phase 1 proved the total fits in int64. The cumprods may still wrap,
+        # but int64 arithmetic is exact mod 2^64, so every answer that fits
+        # comes out right. The one that can't fit is +2^63 (INT64_MIN / -1),
+        # which wraps to -2^63: caught below by its sign, like the loop's raise
+        prefix = np.empty_like(values)
+        prefix[0] = prefix_carry
+        np.cumprod(values[:-1], out=prefix[1:])
+        prefix[1:] *= prefix_carry
+        suffix = np.empty_like(values)
+        suffix[-1] = suffix_carry
+        np.cumprod(values[::-1][:-1], out=suffix[:-1][::-1])
+        suffix[:-1] *= suffix_carry
+        answers = prefix * suffix
+        # answer = total / value, so its sign is sign(total) * sign(value)
+        total_negative = (prefix_carry < 0) ^ (suffix_carry < 0) ^ bool(np.count_nonzero(values < 0) & 1)
+        if np.any((answers < 0) != ((values < 0) ^ total_negative)):
+            raise OverflowError("product exceeds int64")
+        _write_int64(dst, start, answers)
+        return
+
+    values = values.tolist()
+    out = [0] * len(values)
+    running = prefix_carry
+    for i, num in enumerate(values):
+        out[i] = running
+        running = _reduce(running * num, mode, mod)
+    running = suffix_carry
+    for i in range(len(values) - 1, -1, -1):
+        out[i] = _reduce(out[i] * running, mode, mod)
+        running = _reduce(running * values[i], mode, mod)
+    _write_int64(dst, start, out)
+
+
+def _fill_zeros(dst: str, start: int, stop: int) -> None:
+    _write_int64(dst, start, [0] * (stop - start))
+
+
+def _run_chunks(func, tasks: List[tuple], workers: int) -> list:
+    if workers == 1:
+        return [func(*task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, *zip(*tasks)))
+
+
+def productExceptSelf_file(src: str, dst: str, mode: str = "int64", mod: Optional[int] = None,
+                           chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1) -> int:
+    """
+    answers for the int64 values in file src -> int64 file dst.
+    Returns the number of values processed.
+    Time:  O(n / workers), two reads of src and one write of dst
+    Space: O(chunk_size) per worker
+    mode="int64" raises OverflowError if the answers can't fit in int64.
+    """
+    if mode not in FILE_MODES:
+        raise ValueError(f"unknown mode {mode!r}, expected one of {FILE_MODES}")
+    if (mode == "mod") != (mod is not None):
+        raise ValueError("mod=... is required for mode='mod' (and only for it)")
+    if mode == "mod" and not 0 < mod <= INT64_MAX:
+        raise ValueError("mod must be positive and fit in int64")
+
+    src, dst = os.fspath(src), os.fspath(dst)
+    arrayLength = os.path.getsize(src) // INT64_BYTES
+    with open(dst, "wb") as f:
+        f.truncate(arrayLength * INT64_BYTES)
+    if arrayLength == 0:
+        return 0
+    ranges = [(start, min(start + chunk_size, arrayLength))
+              for start in range(0, arrayLength, chunk_size)]
+
+    # ========== PHASE 1: per-chunk zero counts + products ==========
+    summaries = _run_chunks(_chunk_summary,
+                            [(src, start, stop, mode, mod) for start, stop in ranges], workers)
+    zero_count = sum(zeros for zeros, _index, _product in summaries)
+    if zero_count >= 2:
+        # every answer is 0, whatever the products were
+        _run_chunks(_fill_zeros, [(dst, start, stop) for start, stop in ranges], workers)
+        return arrayLength
+    # the product of the nonzero values is needed from here on, so it must fit
+    if any(product is None for _zeros, _index, product in summaries):
+        raise OverflowError("product exceeds int64")
+
+    if zero_count:
+        # one zero: everything is 0 except the zero's own slot, which is the
+        # product of all the other values
+        _run_chunks(_fill_zeros, [(dst, start, stop) for start, stop in ranges], workers)
+        rest = 1
+        for _zeros, _index, product in summaries:
+            rest = _reduce(rest * product, mode, mod)
+        zero_index = next(index for zeros, index, _p in summaries if zeros)
+        _write_int64(dst, zero_index, [rest])
+        return arrayLength
+
+    # ========== stitch the carries ==========
+    totals = [product for _zeros, _index, product in summaries]
+    prefix_carries = [1] * len(totals)
+    for c in range(1, len(totals)):
+        prefix_carries[c] = _reduce(prefix_carries[c - 1] * totals[c - 1], mode, mod)
+    suffix_carries = [1] * len(totals)
+    for c in range(len(totals) - 2, -1, -1):
+        suffix_carries[c] = _reduce(suffix_carries[c + 1] * totals[c + 1], mode, mod)
+    # int64: the total must fit, then every answer fits (each one divides it)
+    _reduce(prefix_carries[-1] * totals[-1], mode, mod)
+
+    # ========== PHASE 2: each chunk writes its own answers ==========
+    _run_chunks(_chunk_finalize, [
+        (src, dst, start, stop, prefix_carries[c], suffix_carries[c], mode, mod)
+        for c, (start, stop) in enumerate(ranges)
+    ], workers)
+    return arrayLength
+
+
+if __name__ == "__main__":
+    test_cases = [
+        ([1, 2, 3, 4], [24, 12, 8, 6]),
+        ([-1, 1, 0, -3, 3], [0, 0, 9, 0, 0]),
+        ([0, 0, 5], [0, 0, 0]),
+        ([5, 0], [0, 5]),
+        ([7], [1]),
+        ([], []),
+        ([2 ** 40, 2 ** 40, 3], [2 ** 40 * 3, 2 ** 40 * 3, 2 ** 80]),   # int64 would overflow
+    ]
+
+    for nums, expected in test_cases:
+        assert productExceptSelf(nums) == expected, f"loop version failed for {nums}"
+        assert productExceptSelf_auto(nums) == expected, f"auto failed for {nums}"
+        if np is not None:
+            assert productExceptSelf_numpy(nums) == expected, f"NumPy failed for {nums}"
+        print(f"✓ All methods passed for {nums}")
+
+    MOD = 1_000_000_007
+    for nums, expected in test_cases:
+        assert productExceptSelf_bounded(nums) == expected
+        assert productExceptSelf_bounded(nums, "mod", mod=MOD) == [x % MOD for x in expected]
+        approx = productExceptSelf_bounded(nums, "log")
+        assert all(math.isclose(a, e, rel_tol=1e-9) for a, e in zip(approx, expected))
+        if all(INT64_MIN <= x <= INT64_MAX for x in expected) and max(map(abs, nums), default=0) < 2 ** 31:
+            assert productExceptSelf_bounded(nums, "int64") == expected
+    for too_big in ([3] * 50, [-1, 2**62, 2]):       # the second: total fits, one answer is 2^63
+        try:
+            productExceptSelf_bounded(too_big, "int64")
+        except OverflowError:
+            pass
+        else:
+            raise AssertionError(f"int64 mode should raise OverflowError for {too_big}")
+    assert productExceptSelf_bounded([1, 2**62, -2], "int64") == [-(2**63), -2, 2**62]
+    assert productExceptSelf_bounded([0, 4, 0] + [9] * 1000, "exact") == [0] * 1003
+    assert productExceptSelf_bounded([0] + [9] * 1000, "log")[0] == math.inf
+    print("✓ Bounded modes (exact / int64 / mod / log) passed")
+
+    # out-of-core: write inputs to int64 files, compare against the in-memory modes
+    import random
+    import tempfile
+    rng = random.Random(1)
+    file_cases = [
+        ([rng.choice((-1, 1, 1, 1, 2)) for _ in range(50)], "int64", None),
+        ([rng.randrange(-10**9, 10**9) for _ in range(1_000)], "mod", MOD),
+        ([rng.randrange(1, 9) for _ in range(300)] + [0], "mod", 97),
+        ([3, 0, 4, 0, 5], "int64", None),
+        ([7], "int64", None),
+        ([1, 2**62, -2], "int64", None),          # an answer of exactly INT64_MIN is fine
+        ([0, 0] + [3] * 100, "int64", None),      # 3**100 is never needed: two zeros
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        src, dst = os.path.join(tmp, "nums.i64"), os.path.join(tmp, "out.i64")
+        for nums, mode, mod in file_cases:
+            values = array("q", nums)
+            if sys.byteorder != "little":
+                values.byteswap()
+            with open(src, "wb") as f:
+                values.tofile(f)
+            expected = productExceptSelf_bounded(nums, mode, mod=mod)
+            for chunk_size, workers in ((7, 1), (64, 1), (7, 2)):
+                productExceptSelf_file(src, dst, mode, mod=mod, chunk_size=chunk_size, workers=workers)
+                assert list(_read_int64(dst, 0, len(nums))) == expected, (mode, chunk_size, workers)
+        for too_big, chunk_size in (([3] * 100, 16), ([0] + [3] * 100, 200),
+                                    ([-1, 2**62, 2], 7), ([-1, 2**62, 2], 1)):
+            try:
+                with open(src, "wb") as f:
+                    array("q", too_big).tofile(f)
+                productExceptSelf_file(src, dst, "int64", chunk_size=chunk_size)
+            except OverflowError:
+                pass
+            else:
+                raise AssertionError(f"int64 file mode should raise OverflowError for {too_big[:3]}")
+    print("✓ Chunked out-of-core version matches in-memory modes")
+
+    if np is not None:
+        rng = random.Random(0)
+        for _ in range(200):
+            nums = [rng.choice((-3, -2, -1, 0, 1, 2, 3)) for _ in range(rng.randrange(1, 60))]
+            assert productExceptSelf_numpy(nums) == productExceptSelf(nums), nums
+        print("✓ NumPy version matches the loop version on random inputs")
+
+    print("\n🎉 All tests passed!")
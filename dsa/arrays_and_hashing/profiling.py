@@ -0,0 +1,411 @@
+"""
+Opt-in profiling for the solution functions in dsa/arrays_and_hashing.
+
+benchmark.py answers "which variant is fastest on this input". This answers
+"what did my workload actually call, how often, how big were the inputs,
+and where did the time go" - per function:
+- call and error counts
+- latency p50 / p99 / max (from the last LATENCY_SAMPLES calls)
+- input size (len of the first argument) total / max
+- peak Python allocation per call via tracemalloc (optional, it's slow)
+
+Nothing is touched until you ask for it:
+- instrument_solutions() swaps the public functions of every solution module
+  for thin wrappers; uninstrument() puts the originals back (zero overhead)
+- while instrumented but disabled, a wrapper costs one flag check
+- @profiled marks your own functions the same way
+Generator functions (find_anagrams, iter_decode, group_anagrams_parallel)
+are timed while they are consumed: latency is the time spent inside the
+generator producing its items, summed over the whole iteration, excluding
+the consumer's own work between items. Their allocations aren't measured.
+
+Usage:
+    python3 dsa/arrays_and_hashing/profiling.py --json profile.json --prom profile.prom
+    python3 dsa/arrays_and_hashing/profiling.py --problem two-sum --sizes 100 10000 --allocations
+
+From code (with the repo root on sys.path):
+    from dsa.arrays_and_hashing import profiling
+    profiling.instrument_solutions()
+    profiling.enable(allocations=True)
+    ...                                   # run the workload
+    profiling.write_prometheus("profile.prom")
+"""
+
+import argparse
+import fnmatch
+import functools
+import importlib
+import inspect
+import json
+import random
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# public solution entry points; helpers (_name) and classes are left alone
+PUBLIC_PATTERNS = [
+    "hasDuplicate*", "firstDuplicateStream",
+    "twoSum*",
+    "valid_anagram*", "find_anagrams*",
+    "group_anagrams*",
+    "topK_*",
+    "longestConsecutive*",
+    "productExceptSelf*",
+    "isValidSudoku*", "validate_boards*", "solve_sudoku", "solve_many",
+    "encode*", "decode*", "iter_decode",
+]
+
+LATENCY_SAMPLES = 10_000          # per function, for the percentiles
+
+
+# ============================================================
+# Stats + registry
+# ============================================================
+
+class FunctionStats:
+    __slots__ = ("name", "calls", "errors", "total_ns", "max_ns", "latencies_ns",
+                 "size_total", "size_max", "sized_calls", "alloc_peak_max", "alloc_calls")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.latencies_ns = deque(maxlen=LATENCY_SAMPLES)
+        self.size_total = 0
+        self.size_max = 0
+        self.sized_calls = 0
+        self.alloc_peak_max = 0
+        self.alloc_calls = 0
+
+    def record(self, elapsed_ns: int, size: Optional[int], failed: bool) -> None:
+        self.calls += 1
+        self.errors += failed
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.latencies_ns.append(elapsed_ns)
+        if size is not None:
+            self.sized_calls += 1
+            self.size_total += size
+            if size > self.size_max:
+                self.size_max = size
+
+    def percentile(self, q: float) -> float:
+        """Latency in seconds at quantile q (0..1) over the retained samples."""
+        if not self.latencies_ns:
+            return 0.0
+        ordered = sorted(self.latencies_ns)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index] / 1e9
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_seconds": self.total_ns / 1e9,
+            "p50_seconds": self.percentile(0.50),
+            "p99_seconds": self.percentile(0.99),
+            "max_seconds": self.max_ns / 1e9,
+            "input_size_total": self.size_total,
+            "input_size_max": self.size_max,
+            "input_size_mean": self.size_total / self.sized_calls if self.sized_calls else None,
+            "alloc_peak_bytes_max": self.alloc_peak_max if self.alloc_calls else None,
+        }
+
+
+class _State:
+    enabled = False
+    allocations = False
+    depth = 0                     # only the outermost call measures allocations
+
+
+_state = _State()
+_registry: Dict[str, FunctionStats] = {}
+_originals: List[Tuple[Any, str, Callable]] = []     # (module, attribute, original)
+
+
+def enable(allocations: bool = False) -> None:
+    """Start recording. allocations=True also runs tracemalloc (several x slower)."""
+    _state.enabled = True
+    _state.allocations = allocations
+    if allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable() -> None:
+    _state.enabled = False
+    if _state.allocations and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _state.allocations = False
+
+
+def reset() -> None:
+    _registry.clear()
+
+
+def stats() -> Dict[str, FunctionStats]:
+    return dict(_registry)
+
+
+def _input_size(args: tuple) -> Optional[int]:
+    if not args:
+        return None
+    try:
+        return len(args[0])
+    except TypeError:
+        return None
+
+
+# ============================================================
+# Wrapping
+# ============================================================
+
+def _wrap(func: Callable, name: str) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _state.enabled:
+            return func(*args, **kwargs)
+
+        entry = _registry.get(name)
+        if entry is None:
+            entry = _registry[name] = FunctionStats(name)
+        measure_alloc = _state.allocations and _state.depth == 0
+        if measure_alloc:
+            tracemalloc.reset_peak()
+            alloc_start = tracemalloc.get_traced_memory()[0]
+        _state.depth += 1
+        failed = True
+        start = time.perf_counter_ns()
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            _state.depth -= 1
+            entry.record(elapsed, _input_size(args), failed)
+            if measure_alloc:
+                peak = tracemalloc.get_traced_memory()[1] - alloc_start
+                entry.alloc_calls += 1
+                entry.alloc_peak_max = max(entry.alloc_peak_max, peak)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+def _wrap_generator(func: Callable, name: str) -> Callable:
+    """_wrap for generator functions: time every step of the iteration, not the call."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _state.enabled:
+            return (yield from func(*args, **kwargs))
+
+        entry = _registry.get(name)
+        if entry is None:
+            entry = _registry[name] = FunctionStats(name)
+        generator = func(*args, **kwargs)
+        elapsed = 0
+        failed = False
+        try:
+            while True:
+                start = time.perf_counter_ns()
+                try:
+                    item = next(generator)
+                except StopIteration as stop:
+                    elapsed += time.perf_counter_ns() - start
+                    return stop.value
+                except BaseException:
+                    elapsed += time.perf_counter_ns() - start
+                    failed = True
+                    raise
+                elapsed += time.perf_counter_ns() - start
+                yield item
+        finally:
+            generator.close()                   # consumer stopped early: not an error
+            entry.record(elapsed, _input_size(args), failed)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+def profiled(func: Optional[Callable] = None, *, name: Optional[str] = None):
+    """Decorator: @profiled or @profiled(name="custom.name")."""
+    def decorate(f: Callable) -> Callable:
+        wrap = _wrap_generator if inspect.isgeneratorfunction(f) else _wrap
+        return wrap(f, name or f"{f.__module__}.{f.__qualname__}")
+    return decorate(func) if func is not None else decorate
+
+
+def instrument_module(module, patterns: List[str] = PUBLIC_PATTERNS,
+                      prefix: Optional[str] = None) -> List[str]:
+    """Replace the module's functions matching patterns with wrappers."""
+    prefix = prefix or module.__name__
+    wrapped = []
+    for attr, value in list(vars(module).items()):
+        if not inspect.isfunction(value) or getattr(value, "__profiled__", False):
+            continue
+        if value.__module__ != module.__name__:
+            continue                        # imported, not defined here
+        if not any(fnmatch.fnmatchcase(attr, pattern) for pattern in patterns):
+            continue
+        _originals.append((module, attr, value))
+        wrap = _wrap_generator if inspect.isgeneratorfunction(value) else _wrap
+        setattr(module, attr, wrap(value, f"{prefix}.{attr}"))
+        wrapped.append(attr)
+    return wrapped
+
+
+def _solutions_package():
+    # `python3 profiling.py` runs this file outside its package (no
+    # __package__); main() has imported benchmark by then, which puts the
+    # repo root on sys.path
+    return importlib.import_module(__package__ or "dsa.arrays_and_hashing")
+
+
+def instrument_solutions(patterns: List[str] = PUBLIC_PATTERNS) -> Dict[str, List[str]]:
+    """Wrap the public functions of every solution file; returns what was wrapped."""
+    solutions = _solutions_package()
+    wrapped = {}
+    for name in solutions.SOLUTION_MODULES:
+        module = importlib.import_module(f"{solutions.__name__}.{name}")
+        wrapped[name] = instrument_module(module, patterns, prefix=name)
+    return wrapped
+
+
+def uninstrument() -> None:
+    """Put every original function back - no wrapper left on any call path."""
+    while _originals:
+        module, attr, original = _originals.pop()
+        setattr(module, attr, original)
+
+
+# ============================================================
+# Export
+# ============================================================
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    return {name: stats.as_dict() for name, stats in sorted(_registry.items())}
+
+
+def write_json(path: str) -> None:
+    with open(path, "w") as f:
+        json.dump({"generated_at": time.time(), "functions": snapshot()}, f, indent=2)
+
+
+def _prom_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text() -> str:
+    """Prometheus text exposition format (a summary per function + gauges)."""
+    functions = sorted(_registry.items())
+    labels = {name: f'function="{_prom_escape(name)}"' for name, _ in functions}
+    lines = []
+
+    def family(metric: str, kind: str, help_text: str, samples) -> None:
+        # HELP, TYPE and every sample of a family must be one contiguous group
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        lines.extend(samples)
+
+    family("dsa_calls_total", "counter", "Calls per solution function.",
+           [f"dsa_calls_total{{{labels[name]}}} {stats.calls}" for name, stats in functions])
+    family("dsa_errors_total", "counter", "Calls that raised.",
+           [f"dsa_errors_total{{{labels[name]}}} {stats.errors}" for name, stats in functions])
+    latency = []
+    for name, stats in functions:
+        for q in (0.5, 0.99):
+            latency.append(f'dsa_latency_seconds{{{labels[name]},quantile="{q}"}} '
+                           f'{stats.percentile(q):.9f}')
+        latency.append(f"dsa_latency_seconds_sum{{{labels[name]}}} {stats.total_ns / 1e9:.9f}")
+        latency.append(f"dsa_latency_seconds_count{{{labels[name]}}} {stats.calls}")
+    family("dsa_latency_seconds", "summary", "Call latency.", latency)
+    family("dsa_input_size_max", "gauge", "Largest len() of the first argument.",
+           [f"dsa_input_size_max{{{labels[name]}}} {stats.size_max}"
+            for name, stats in functions if stats.sized_calls])
+    family("dsa_alloc_peak_bytes", "gauge", "Largest tracemalloc peak of one call.",
+           [f"dsa_alloc_peak_bytes{{{labels[name]}}} {stats.alloc_peak_max}"
+            for name, stats in functions if stats.alloc_calls])
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: str) -> None:
+    with open(path, "w") as f:
+        f.write(prometheus_text())
+
+
+def print_summary() -> None:
+    print(f"{'function':<58} {'calls':>7} {'p50':>10} {'p99':>10} {'size max':>9} {'alloc max':>10}")
+    for name, stats in sorted(_registry.items(), key=lambda item: -item[1].total_ns):
+        alloc = f"{stats.alloc_peak_max / 1024:.1f} KB" if stats.alloc_calls else "-"
+        print(f"{name:<58} {stats.calls:>7} {stats.percentile(0.5) * 1e6:>8.1f}us "
+              f"{stats.percentile(0.99) * 1e6:>8.1f}us {stats.size_max:>9} {alloc:>10}")
+
+
+# ============================================================
+# CLI: drive the benchmark inputs through instrumented functions
+# ============================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    # benchmark.py owns the inputs; only the CLI needs it
+    if __package__:
+        from .benchmark import DEFAULT_SIZES, _copy_args, build_problems
+    else:
+        from benchmark import DEFAULT_SIZES, _copy_args, build_problems
+
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--problem", action="append",
+                        help="benchmark problem to drive (repeatable); default: all")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES[:3])
+    parser.add_argument("--calls", type=int, default=5, help="calls per variant and input")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--allocations", action="store_true", help="also record tracemalloc peaks")
+    parser.add_argument("--json", help="write the stats as JSON here")
+    parser.add_argument("--prom", help="write the stats in Prometheus text format here")
+    args = parser.parse_args(argv)
+
+    # wrap BEFORE building the problems, so the variants pick up the wrappers
+    instrument_solutions()
+    problems = build_problems()
+    if args.problem:
+        unknown = set(args.problem) - set(problems)
+        if unknown:
+            parser.error(f"unknown problem(s): {', '.join(sorted(unknown))}")
+        problems = {name: problems[name] for name in args.problem}
+
+    enable(allocations=args.allocations)
+    try:
+        for problem in problems.values():
+            for distribution in problem.distributions:
+                for n in args.sizes:
+                    rng = random.Random(f"{args.seed}:{problem.name}:{distribution}:{n}")
+                    inputs = problem.make_input(n, distribution, rng)
+                    for variant in problem.variants:
+                        if variant.max_size is not None and n > variant.max_size:
+                            continue
+                        if variant.min_size is not None and n < variant.min_size:
+                            continue
+                        for _ in range(args.calls):
+                            call_args = _copy_args(inputs) if variant.copy_input else inputs
+                            try:
+                                variant.func(*call_args)
+                            except OverflowError:
+                                pass        # bounded modes refusing big inputs - counted as errors
+    finally:
+        disable()
+        uninstrument()
+
+    print_summary()
+    if args.json:
+        write_json(args.json)
+    if args.prom:
+        write_prometheus(args.prom)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,21 @@
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Optional
 import heapq
+import math
+import os
+import sys
+
+
+if __package__:
+    from ._lazy import lazy_import
+else:  # run as a script: the helper is one folder up
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from _lazy import lazy_import
+
+# NumPy is optional - the pure Python backends still work.
+np = lazy_import("numpy")
 
 def topK_FrequentElement_sort(nums: list[int], k: int) -> list[int]:
     """
@@ -30,6 +46,11 @@ def topK_FrequentElement_heap(nums: list[int], k: int) -> list[int]:
     for number in nums:
         frequency_counter[number] += 1
 
+    return _top_k_from_counts_heap(frequency_counter, k)
+
+
+def _top_k_from_counts_heap(frequency_counter: dict, k: int) -> list[int]:
+    """Selection half of Approach 2, shared with the other counting backends."""
     heap: list[tuple[int, int]] = []  # (count, num)
 
     for num, count in frequency_counter.items():
@@ -38,3 +59,625 @@ def topK_FrequentElement_heap(nums: list[int], k: int) -> list[int]:
             heapq.heappop(heap)  # removes smallest count
 
     return [num for _count, num in heap]
+
+
+# ============================================================
+# Approach 3: Incremental tracker for live streams
+# ============================================================
+#
+# Approaches 1 and 2 recount the whole list on every call. If we query the
+# top-k after every batch of a live stream, we want to keep the counts as we
+# go and answer each query WITHOUT touching every distinct key.
+#
+# Trick: counts only ever change by +1 / -1. So keep a doubly linked list of
+# "buckets", one per count that currently exists, sorted by count:
+#
+#   head                                      tail
+#   [count=1: {7, 9}] <-> [count=2: {5}] <-> [count=4: {3}]
+#
+#   add(5):   5 moves from bucket 2 to bucket 3 (created right after bucket 2)
+#   topk(2):  walk from the tail -> 3, then 5 -> done
+#
+# Every update is O(1) (only the neighbouring bucket is ever needed) and
+# topk(k) is O(k): every bucket we visit holds at least one key.
+
+class _Bucket:
+    __slots__ = ("count", "keys", "prev", "next")
+
+    def __init__(self, count: int):
+        self.count = count
+        self.keys: dict = {}      # dict used as an insertion-ordered set
+        self.prev: "_Bucket | None" = None
+        self.next: "_Bucket | None" = None
+
+
+class _FrequencyBuckets:
+    """Keys grouped by count in a linked list of buckets (head = lowest count)."""
+
+    def __init__(self):
+        self.head: "_Bucket | None" = None
+        self.tail: "_Bucket | None" = None
+        self.bucket_of: dict = {}     # key -> its bucket
+
+    def __len__(self) -> int:
+        return len(self.bucket_of)
+
+    def count(self, key) -> int:
+        bucket = self.bucket_of.get(key)
+        return bucket.count if bucket else 0
+
+    def _insert_after(self, bucket: "_Bucket | None", count: int) -> _Bucket:
+        # bucket=None means "insert at the head"
+        new = _Bucket(count)
+        new.prev = bucket
+        new.next = bucket.next if bucket else self.head
+        if new.next:
+            new.next.prev = new
+        else:
+            self.tail = new
+        if bucket:
+            bucket.next = new
+        else:
+            self.head = new
+        return new
+
+    def _unlink_if_empty(self, bucket: _Bucket) -> None:
+        if bucket.keys:
+            return
+        if bucket.prev:
+            bucket.prev.next = bucket.next
+        else:
+            self.head = bucket.next
+        if bucket.next:
+            bucket.next.prev = bucket.prev
+        else:
+            self.tail = bucket.prev
+
+    def _move(self, key, source: "_Bucket | None", target: _Bucket) -> None:
+        target.keys[key] = None
+        self.bucket_of[key] = target
+        if source:
+            del source.keys[key]
+            self._unlink_if_empty(source)
+
+    def increment(self, key) -> None:
+        bucket = self.bucket_of.get(key)
+        if bucket is None:
+            target = self.head if self.head and self.head.count == 1 else self._insert_after(None, 1)
+        else:
+            target = bucket.next
+            if target is None or target.count != bucket.count + 1:
+                target = self._insert_after(bucket, bucket.count + 1)
+        self._move(key, bucket, target)
+
+    def decrement(self, key) -> None:
+        bucket = self.bucket_of[key]
+        if bucket.count == 1:
+            del self.bucket_of[key]
+            del bucket.keys[key]
+            self._unlink_if_empty(bucket)
+            return
+        target = bucket.prev
+        if target is None or target.count != bucket.count - 1:
+            target = self._insert_after(bucket.prev, bucket.count - 1)
+        self._move(key, bucket, target)
+
+    def replace(self, old_key, new_key) -> None:
+        """new_key takes old_key's place (and count) in the same bucket."""
+        bucket = self.bucket_of.pop(old_key)
+        del bucket.keys[old_key]
+        bucket.keys[new_key] = None
+        self.bucket_of[new_key] = bucket
+
+    def iter_descending(self):
+        """Yield (key, count) from the highest count down."""
+        bucket = self.tail
+        while bucket:
+            for key in bucket.keys:
+                yield key, bucket.count
+            bucket = bucket.prev
+
+
+class TopKTracker:
+    """
+    Stateful top-k over a stream.
+    Time:  add / remove O(1), add_many O(batch), topk(k) O(k)
+    Space: O(d) for d distinct live keys (+ O(window) events when windowed)
+
+    window=W keeps only the last W events: each add beyond W expires the
+    oldest event, so counts always describe the most recent W events.
+    """
+
+    def __init__(self, window: Optional[int] = None):
+        if window is not None and window <= 0:
+            raise ValueError("window must be a positive number of events")
+        self._buckets = _FrequencyBuckets()
+        self._window = window
+        self._events: deque = deque()
+        # remove() inside a window retracts the OLDEST live occurrence; we remember
+        # it here so that occurrence isn't decremented a second time on expiry
+        self._retracted: dict = defaultdict(int)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def count(self, num: int) -> int:
+        return self._buckets.count(num)
+
+    def add(self, num: int) -> None:
+        self._buckets.increment(num)
+        if self._window is None:
+            return
+
+        self._events.append(num)
+        if len(self._events) > self._window:
+            expired = self._events.popleft()
+            if self._retracted.get(expired):
+                self._retracted[expired] -= 1
+                if not self._retracted[expired]:
+                    del self._retracted[expired]
+            else:
+                self._buckets.decrement(expired)
+
+    def add_many(self, nums: Iterable[int]) -> None:
+        for num in nums:
+            self.add(num)
+
+    def remove(self, num: int) -> None:
+        if not self._buckets.count(num):
+            raise KeyError(num)
+        self._buckets.decrement(num)
+        if self._window is not None:
+            self._retracted[num] += 1
+
+    def topk(self, k: int) -> list[int]:
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        result = []
+        for num, _count in self._buckets.iter_descending():
+            if len(result) == k:
+                break
+            result.append(num)
+        return result
+
+
+
+# ============================================================
+# Approach 4: Approximate heavy hitters (Space-Saving)
+# ============================================================
+#
+# Every exact approach keeps one counter per DISTINCT key, so memory grows
+# with d. On a high-cardinality stream that's the thing that blows up.
+#
+# Space-Saving (Metwally et al.) keeps at most m counters, no matter how
+# many distinct keys arrive:
+#   - key already counted, or a free counter left -> count it as usual
+#   - otherwise evict a key with the MINIMUM count, and give the newcomer
+#     that counter as min + 1 (it "inherits" the evicted count)
+#
+# The inherited part is remembered as the key's `error`, which gives bounds:
+#
+#   count - error  <=  true count  <=  count,     and  error <= n / m
+#
+# So with m = 1 / epsilon counters every estimate is within epsilon * n.
+# The minimum counter is always the head bucket of the same _FrequencyBuckets
+# list the tracker uses, so eviction is O(1) too.
+
+class SpaceSaving:
+    """
+    Fixed-memory top-k over a stream.
+    Time:  add O(1), topk(k) O(k)
+    Space: O(capacity), independent of the number of distinct keys
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.total = 0                  # n: number of events seen
+        self._buckets = _FrequencyBuckets()
+        self._error: dict = {}          # key -> count inherited on eviction
+
+    @classmethod
+    def from_error(cls, epsilon: float) -> "SpaceSaving":
+        """Pick capacity so every count is overestimated by at most epsilon * n."""
+        if not 0 < epsilon < 1:
+            raise ValueError("epsilon must be between 0 and 1")
+        return cls(math.ceil(1 / epsilon))
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def add(self, num: int) -> None:
+        self.total += 1
+        buckets = self._buckets
+        if num in buckets.bucket_of or len(buckets) < self.capacity:
+            buckets.increment(num)
+            self._error.setdefault(num, 0)
+            return
+
+        # evict one of the keys with the minimum count
+        victim_bucket = buckets.head
+        victim = next(iter(victim_bucket.keys))
+        buckets.replace(victim, num)
+        buckets.increment(num)
+        del self._error[victim]
+        self._error[num] = victim_bucket.count
+
+    def add_many(self, nums: Iterable[int]) -> None:
+        for num in nums:
+            self.add(num)
+
+    @property
+    def max_error(self) -> float:
+        """Guaranteed upper bound on how much any count is overestimated."""
+        return self.total / self.capacity
+
+    def topk(self, k: int) -> list[int]:
+        return [num for num, _count, _error, _guaranteed in self.topk_with_bounds(k)]
+
+    def topk_with_bounds(self, k: int) -> list[tuple[int, int, int, bool]]:
+        """
+        [(num, estimated_count, error, guaranteed), ...] highest count first.
+        true count is in [estimated_count - error, estimated_count].
+        guaranteed=True means num is DEFINITELY in the true top-k: its lower
+        bound beats the estimate of everything ranked below the k-th slot.
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        ranked = []
+        for num, count in self._buckets.iter_descending():
+            ranked.append((num, count))
+            if len(ranked) > k:
+                break
+        top, rest = ranked[:k], ranked[k:]
+
+        # an untracked key has true count <= the smallest counter (if the table is full)
+        full = len(self._buckets) == self.capacity
+        unseen = self._buckets.head.count if full and self._buckets.head else 0
+        threshold = max(rest[0][1] if rest else 0, unseen)
+
+        return [
+            (num, count, self._error[num], count - self._error[num] >= threshold)
+            for num, count in top
+        ]
+
+
+def topK_FrequentElement_spaceSaving(nums: list[int], k: int, epsilon: float = 0.001) -> list[int]:
+    """
+    Approach 4 (approximate): Space-Saving with m = max(k, 1/epsilon) counters.
+    Same call shape as the exact functions; every count used for ranking is
+    within epsilon * n of the truth.
+    Time:  O(n + k)
+    Space: O(1/epsilon), NOT O(d)
+    """
+    summary = SpaceSaving(max(k, math.ceil(1 / epsilon)))
+    summary.add_many(nums)
+    return summary.topk(k)
+
+
+
+# ============================================================
+# Approach 5: Bucket sort (linear time)
+# ============================================================
+#
+# A count can never be bigger than n, so instead of sorting counts we drop
+# every number into a bucket indexed BY its count, then read buckets from
+# the highest count down until we have k numbers:
+#
+#   nums = [1,1,1,2,2,3], counts = {1: 3, 2: 2, 3: 1}
+#   buckets[1] = [3], buckets[2] = [2], buckets[3] = [1]
+#   walk 3 -> 2 -> ...  => [1, 2]
+#
+# (Only max_count + 1 buckets are needed, not n + 1.)
+
+def topK_FrequentElement_bucket(nums: list[int], k: int) -> list[int]:
+    """
+    Approach 5: Count + bucket by frequency.
+    Time:  O(n) worst case
+    Space: O(n)
+    """
+    frequency_counter = defaultdict(int)
+    for number in nums:
+        frequency_counter[number] += 1
+
+    return _top_k_from_counts_bucket(frequency_counter, k)
+
+
+def _top_k_from_counts_bucket(frequency_counter: dict, k: int) -> list[int]:
+    # k <= 0 must return [] like the heap backend - the length check below
+    # only runs after an append
+    if not frequency_counter or k <= 0:
+        return []
+    buckets: list[list[int]] = [[] for _ in range(max(frequency_counter.values()) + 1)]
+    for num, count in frequency_counter.items():
+        buckets[count].append(num)
+
+    result: list[int] = []
+    for count in range(len(buckets) - 1, 0, -1):
+        for num in buckets[count]:
+            result.append(num)
+            if len(result) == k:
+                return result
+    return result
+
+
+# ============================================================
+# Approach 6: NumPy (integer arrays)
+# ============================================================
+#
+# For multi-million element integer arrays the Python-level loop IS the cost.
+# NumPy does both halves in C:
+#   count : np.bincount when values are dense (O(n)), np.unique otherwise
+#   select: np.argpartition finds the k biggest counts in O(d), then only
+#           those k get sorted
+
+def topK_FrequentElement_numpy(nums, k: int) -> list[int]:
+    """
+    Approach 6: NumPy count + argpartition. nums is a list or array of integers.
+    Time:  O(n + range) when dense, O(n log n) (in C) otherwise
+    Space: O(d)
+    """
+    if np is None:
+        raise ImportError("topK_FrequentElement_numpy needs NumPy installed")
+    arr = np.asarray(nums)
+    if arr.dtype.kind not in "iub":
+        raise TypeError(f"expected an integer array, got dtype {arr.dtype}")
+    arr = arr.ravel()
+    if arr.size == 0 or k <= 0:
+        return []
+
+    low, high = int(arr.min()), int(arr.max())
+    if high - low <= 2 * arr.size:
+        # dense range: counts[v - low] in one pass, no sort
+        counts = np.bincount((arr - low).astype(np.intp, copy=False))
+        values = np.flatnonzero(counts)
+        counts = counts[values]
+        values = values + low
+    else:
+        values, counts = np.unique(arr, return_counts=True)
+
+    if k < len(counts):
+        top = np.argpartition(counts, -k)[-k:]
+    else:
+        top = np.arange(len(counts))
+    top = top[np.argsort(-counts[top], kind="stable")]
+    return values[top].tolist()
+
+
+# ============================================================
+# Auto-dispatch
+# ============================================================
+#
+# Which backend wins depends on the input:
+#   - integer NumPy array, or a big list of ints -> NumPy (C loops)
+#   - otherwise count once with Counter (C-accelerated), then select:
+#       k much smaller than d -> heap, O(d log k) with a tiny k
+#       k close to d          -> buckets, O(d) no matter what k is
+
+NUMPY_MIN_SIZE = 50_000     # list -> array conversion isn't worth it below this
+HEAP_MAX_K_RATIO = 0.125    # heap while k <= d / 8
+
+
+def topK_FrequentElement(nums, k: int) -> list[int]:
+    """Top k frequent elements using whichever backend suits n, d, k and dtype."""
+    if np is not None:
+        if isinstance(nums, np.ndarray):
+            if nums.dtype.kind in "iub":
+                return topK_FrequentElement_numpy(nums, k)
+            nums = nums.tolist()
+        elif len(nums) >= NUMPY_MIN_SIZE and type(nums[0]) is int:
+            arr = np.asarray(nums)
+            # a mix of ints and other types turns into float/object - not for us
+            if arr.dtype.kind in "iu":
+                return topK_FrequentElement_numpy(arr, k)
+
+    frequency_counter = Counter(nums)
+    if k <= len(frequency_counter) * HEAP_MAX_K_RATIO:
+        return _top_k_from_counts_heap(frequency_counter, k)
+    return _top_k_from_counts_bucket(frequency_counter, k)
+
+
+
+# ============================================================
+# Approach 7: Parallel sharded counting (map-reduce)
+# ============================================================
+#
+# Counting is the O(n) part and it's embarrassingly parallel:
+#
+#   map    : split nums into shards, count each shard in its own process
+#   reduce : add the partial counters together (only d keys, not n items)
+#   select : the usual heap selection over the merged counts
+#
+# Input can be a list, a NumPy array, or a PATH to a file of raw int64
+# values (little-endian, e.g. written by array("q").tofile / ndarray.tofile).
+# For files each worker reads only its own shard from disk, and at most
+# 2 * workers shards are in flight at once, so peak memory is bounded by the
+# shard size - not by the file size.
+
+DEFAULT_SHARD_SIZE = 1_000_000
+INT64_BYTES = 8
+
+
+def _count_shard(shard) -> dict:
+    if np is not None and isinstance(shard, np.ndarray):
+        values, counts = np.unique(shard, return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist()))
+    return Counter(shard)
+
+
+def _count_file_shard(path: str, start: int, stop: int) -> dict:
+    """Count values [start, stop) of an int64 file without loading the rest."""
+    if np is not None:
+        shard = np.memmap(path, dtype="<i8", mode="r",
+                          offset=start * INT64_BYTES, shape=(stop - start,))
+        return _count_shard(shard)
+
+    shard = array("q")
+    with open(path, "rb") as f:
+        f.seek(start * INT64_BYTES)
+        shard.fromfile(f, stop - start)
+    if sys.byteorder != "little":
+        shard.byteswap()
+    return Counter(shard)
+
+
+def _shard_tasks(source, shard_size: int):
+    """Yield (function, *args) for every shard of source."""
+    if isinstance(source, (str, os.PathLike)):
+        total = os.path.getsize(source) // INT64_BYTES
+        for start in range(0, total, shard_size):
+            yield _count_file_shard, os.fspath(source), start, min(start + shard_size, total)
+    else:
+        for start in range(0, len(source), shard_size):
+            yield _count_shard, source[start:start + shard_size]
+
+
+def topK_FrequentElement_parallel(source, k: int, workers: Optional[int] = None,
+                                  shard_size: int = DEFAULT_SHARD_SIZE) -> list[int]:
+    """
+    Approach 7: count shards in a process pool, merge, then heap-select.
+    source is a list, NumPy array, or path to a file of int64 values.
+    Time:  O(n / workers + shards * d + d log k)
+    Space: O(2 * workers * shard_size + d)
+    """
+    workers = workers or os.cpu_count() or 1
+    frequency_counter: Counter = Counter()
+
+    if workers == 1:
+        # no pool at all - the single-core baseline for scaling comparisons
+        for func, *args in _shard_tasks(source, shard_size):
+            frequency_counter.update(func(*args))
+        return _top_k_from_counts_heap(frequency_counter, k)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for func, *args in _shard_tasks(source, shard_size):
+            pending.add(pool.submit(func, *args))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    frequency_counter.update(future.result())
+        for future in pending:
+            frequency_counter.update(future.result())
+
+    return _top_k_from_counts_heap(frequency_counter, k)
+
+
+if __name__ == "__main__":
+    import random
+
+    test_cases = [
+        ([1, 2, 2, 3, 3, 3], 2, [3, 2]),
+        ([7], 1, [7]),
+        ([4, 4, 1, 1, 1, 2], 1, [1]),
+    ]
+    for nums, k, expected in test_cases:
+        assert sorted(topK_FrequentElement_sort(nums, k)) == sorted(expected)
+        assert sorted(topK_FrequentElement_heap(nums, k)) == sorted(expected)
+        assert sorted(topK_FrequentElement_bucket(nums, k)) == sorted(expected)
+        assert sorted(topK_FrequentElement(nums, k)) == sorted(expected)
+        if np is not None:
+            assert sorted(topK_FrequentElement_numpy(nums, k)) == sorted(expected)
+            assert sorted(topK_FrequentElement(np.array(nums), k)) == sorted(expected)
+        tracker = TopKTracker()
+        tracker.add_many(nums)
+        assert sorted(tracker.topk(k)) == sorted(expected), f"tracker failed for {nums}"
+        print(f"✓ All methods passed for {nums}, k={k} → {expected}")
+
+    # k = 0 is an empty answer everywhere; a negative k is a caller bug
+    nums = [1, 1, 2]
+    assert topK_FrequentElement_bucket(nums, 0) == topK_FrequentElement_heap(nums, 0) == []
+    assert topK_FrequentElement(list(range(10)) * 2, 0) == []
+    tracker = TopKTracker()
+    tracker.add_many(nums)
+    assert tracker.topk(0) == [] and SpaceSaving(4).topk(0) == []
+    for bad in (tracker.topk, SpaceSaving(4).topk):
+        try:
+            bad(-1)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("topk(-1) should raise ValueError")
+
+    # random stream with removes: tracker counts must match a plain recount
+    rng = random.Random(0)
+    tracker = TopKTracker()
+    live: list[int] = []
+    for _ in range(5_000):
+        if live and rng.random() < 0.3:
+            num = live.pop(rng.randrange(len(live)))
+            tracker.remove(num)
+        else:
+            num = rng.randrange(50)
+            live.append(num)
+            tracker.add(num)
+        counts = defaultdict(int)
+        for num in live:
+            counts[num] += 1
+        top = tracker.topk(5)
+        assert [tracker.count(num) for num in top] == sorted(counts.values(), reverse=True)[:5]
+    print("✓ Tracker matches recount under adds/removes")
+
+    # sliding window: only the last `window` events count
+    stream = [rng.randrange(20) for _ in range(3_000)]
+    tracker = TopKTracker(window=100)
+    for i, num in enumerate(stream):
+        tracker.add(num)
+        recent = stream[max(0, i - 99): i + 1]
+        top = tracker.topk(3)
+        assert [tracker.count(n) for n in top] == sorted(
+            (recent.count(n) for n in set(recent)), reverse=True)[:3]
+    print("✓ Sliding window expiry matches recount")
+
+    # every backend must agree on the counts of what it returns (ties can differ)
+    for trial in range(200):
+        nums = [rng.randrange(-5, rng.choice((3, 30, 10_000))) for _ in range(rng.randrange(1, 300))]
+        k = rng.randrange(1, len(set(nums)) + 1)
+        expected = sorted(Counter(nums)[n] for n in topK_FrequentElement_sort(nums, k))
+        backends = [topK_FrequentElement_heap, topK_FrequentElement_bucket, topK_FrequentElement]
+        if np is not None:
+            backends.append(topK_FrequentElement_numpy)
+        for backend in backends:
+            assert sorted(Counter(nums)[n] for n in backend(nums, k)) == expected, backend.__name__
+    print("✓ Bucket / NumPy / dispatcher backends agree")
+
+    # parallel map-reduce: list, NumPy array and int64 file inputs
+    import tempfile
+    nums = [int(rng.paretovariate(1.3)) for _ in range(20_000)]
+    expected = sorted(Counter(nums)[n] for n in topK_FrequentElement_sort(nums, 5))
+    sources = [nums]
+    if np is not None:
+        sources.append(np.array(nums, dtype=np.int64))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "nums.i64")
+        values = array("q", nums)
+        if sys.byteorder != "little":
+            values.byteswap()
+        with open(path, "wb") as f:
+            values.tofile(f)
+        sources.append(path)
+        for source in sources:
+            for workers in (1, 2):
+                result = topK_FrequentElement_parallel(source, 5, workers=workers, shard_size=3_000)
+                assert sorted(Counter(nums)[n] for n in result) == expected
+    print("✓ Parallel sharded top-k matches single-core counts")
+
+    # Space-Saving: exact when capacity >= distinct keys, bounded error otherwise
+    for nums, k, expected in test_cases:
+        assert sorted(topK_FrequentElement_spaceSaving(nums, k)) == sorted(expected)
+    stream = [int(rng.paretovariate(1.1)) for _ in range(50_000)]
+    true_counts = defaultdict(int)
+    for num in stream:
+        true_counts[num] += 1
+    summary = SpaceSaving.from_error(0.01)
+    summary.add_many(stream)
+    assert len(summary) <= 100
+    for num, count, error, guaranteed in summary.topk_with_bounds(10):
+        assert count - error <= true_counts[num] <= count
+        assert error <= summary.max_error
+    exact_top = sorted(true_counts.values(), reverse=True)[:10]
+    assert sorted(true_counts[num] for num in summary.topk(10)) == sorted(exact_top)
+    print("✓ Space-Saving stays within its error bounds")
+
+    print("\n🎉 All tests passed!")
@@ -1,4 +1,20 @@
-from typing import List, Dict
+from itertools import combinations, product
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import os
+import sys
+
+
+if __package__:
+    from ._lazy import lazy_import
+else:  # run as a script: the helper is one folder up
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from _lazy import lazy_import
+
+# NumPy is optional - query_many falls back to a loop.
+np = lazy_import("numpy")
+
+# values this big could overflow int64 when subtracted - use the plain loop instead
+_INT64_SAFE = 1 << 62
 
 
 def twoSumMyOnePass(nums: List[int], target: int) -> List[int]:
@@ -63,6 +79,46 @@ def twoSumSorting(nums: List[int], target: int) -> List[int]:
 
     raise ValueError("No two sum solution found")
 
+# NumPy version of twoSumSorting
+# Same idea (sort values, remember original indices) but instead of walking two
+# pointers one step at a time, ask for EVERY element at once where its
+# complement would sit in the sorted array: np.searchsorted(sorted, target - sorted)
+def twoSumNumpy(nums, target: int) -> List[int]:
+    if np is None:
+        raise ImportError("twoSumNumpy needs NumPy installed")
+    arr = np.asarray(nums)
+    if (arr.dtype.kind not in "iu" or abs(target) >= _INT64_SAFE
+            or (arr.size and max(abs(int(arr.min())), abs(int(arr.max()))) >= _INT64_SAFE)):
+        return twoSumSorting(list(nums), target)     # target - value could overflow int64
+    if arr.size < 2:
+        raise ValueError("No two sum solution found")
+
+    order = np.argsort(arr, kind="stable")
+    values = arr[order].astype(np.int64)
+    complement = target - values
+    partner = np.searchsorted(values, complement)
+    # an element can't pair with itself: skip to the next equal value
+    partner = np.where(partner == np.arange(len(values)), partner + 1, partner)
+    partner_clipped = np.minimum(partner, len(values) - 1)
+    found = np.flatnonzero((partner < len(values)) & (values[partner_clipped] == complement))
+    if not found.size:
+        raise ValueError("No two sum solution found")
+
+    i = int(order[found[0]])
+    j = int(order[partner_clipped[found[0]]])
+    return [min(i, j), max(i, j)]
+
+
+# Dispatcher. Benchmarks say the one-pass dict beats twoSumNumpy on Python lists
+# at every size: it usually exits early, while the NumPy version always pays for
+# conversion + a full sort. So NumPy is only used when the input is ALREADY an
+# array (iterating an ndarray element by element in Python is very slow).
+def twoSumAuto(nums, target: int) -> List[int]:
+    if np is not None and isinstance(nums, np.ndarray):
+        return twoSumNumpy(nums, target)
+    return twoSumPopularOnePass(nums, target)
+
+
 # brute force method (learning / baseline)
 def twoSumBruteForce(nums: List[int], target: int) -> List[int]:
     for i in range(len(nums)):
@@ -71,3 +127,197 @@ def twoSumBruteForce(nums: List[int], target: int) -> List[int]:
                 return [i, j]
 
     raise ValueError("No two sum solution found")
+
+
+# ============================================================
+# Many targets, same array: build the index ONCE
+# ============================================================
+#
+# Every function above rebuilds its dict (or sorted pair list) for a single
+# target. When thousands of targets are asked against the same array, that
+# rebuild is the whole cost. TwoSumIndex keeps:
+#
+#   positions : value -> {index, ...}    (hash map, updated in O(1))
+#   sorted    : values sorted + their indices (NumPy, built lazily)
+#
+# query(target)          : walk the distinct values, O(d) lookups, no rebuild
+# query_many(targets)    : for a block of targets at once,
+#                          complement = target - every value, then ONE
+#                          np.searchsorted finds where each complement would sit
+# all_pairs(target)      : every (i, j) pair, not just the first
+# insert / delete        : keep the index in sync with a changing dataset;
+#                          the sorted arrays are patched with np.insert /
+#                          np.delete (a memmove) instead of being re-sorted
+
+# query_many processes targets in blocks of about this many (target, value) cells
+QUERY_BLOCK_CELLS = 1 << 20
+
+
+class TwoSumIndex:
+    def __init__(self, nums: Iterable[int] = ()):
+        self._value_at: Dict[int, int] = {}            # index -> value
+        self._positions: Dict[int, Dict[int, None]] = {}  # value -> ordered set of indices
+        self._next_index = 0
+        self._sorted: Optional[Tuple["np.ndarray", "np.ndarray"]] = None
+        for num in nums:
+            self._add(num)
+
+    def __len__(self) -> int:
+        return len(self._value_at)
+
+    def _add(self, value: int) -> int:
+        index = self._next_index
+        self._next_index += 1
+        self._value_at[index] = value
+        self._positions.setdefault(value, {})[index] = None
+        return index
+
+    def insert(self, value: int) -> int:
+        """Append value to the dataset and return its index."""
+        index = self._add(value)
+        if self._sorted is not None:
+            values, indices = self._sorted
+            if abs(value) < _INT64_SAFE:
+                at = int(np.searchsorted(values, value, side="right"))
+                self._sorted = (np.insert(values, at, value), np.insert(indices, at, index))
+            else:
+                self._sorted = None
+        return index
+
+    def delete(self, index: int) -> None:
+        """Remove the element at index (other indices don't shift)."""
+        value = self._value_at.pop(index)       # KeyError if it isn't there
+        same_value = self._positions[value]
+        del same_value[index]
+        if not same_value:
+            del self._positions[value]
+
+        if self._sorted is not None:
+            values, indices = self._sorted
+            lo = int(np.searchsorted(values, value, side="left"))
+            hi = int(np.searchsorted(values, value, side="right"))
+            at = lo + int(np.flatnonzero(indices[lo:hi] == index)[0])
+            self._sorted = (np.delete(values, at), np.delete(indices, at))
+
+    def _find(self, target: int) -> Optional[List[int]]:
+        positions = self._positions
+        for value, indices in positions.items():
+            needed = target - value
+            if needed == value:
+                if len(indices) >= 2:
+                    first, second = list(indices)[:2]
+                    return [first, second]
+            elif needed in positions:
+                return sorted((next(iter(indices)), next(iter(positions[needed]))))
+        return None
+
+    def query(self, target: int) -> List[int]:
+        pair = self._find(target)
+        if pair is None:
+            raise ValueError("No two sum solution found")
+        return pair
+
+    def all_pairs(self, target: int) -> Iterator[Tuple[int, int]]:
+        """Yield every index pair (i, j), i < j, with nums[i] + nums[j] == target."""
+        positions = self._positions
+        for value, indices in positions.items():
+            needed = target - value
+            if needed == value:
+                yield from combinations(sorted(indices), 2)
+            elif value < needed and needed in positions:
+                for i, j in product(indices, positions[needed]):
+                    yield (i, j) if i < j else (j, i)
+
+    def _sorted_arrays(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        if self._sorted is None:
+            indices = np.fromiter(self._value_at.keys(), dtype=np.int64, count=len(self._value_at))
+            values = np.fromiter(self._value_at.values(), dtype=np.int64, count=len(self._value_at))
+            order = np.argsort(values, kind="stable")
+            self._sorted = (values[order], indices[order])
+        return self._sorted
+
+    def query_many(self, targets: Iterable[int]) -> List[Optional[List[int]]]:
+        """
+        Answer many targets at once. Returns one [i, j] per target, or None
+        where a target has no solution (no exception, so one miss doesn't
+        throw away the whole batch).
+        """
+        targets = list(targets)
+        values_ok = all(abs(v) < _INT64_SAFE for v in self._positions)
+        if (np is None or len(self) < 2 or not values_ok
+                or any(abs(t) >= _INT64_SAFE for t in targets)):
+            return [self._find(target) for target in targets]
+
+        values, indices = self._sorted_arrays()
+        n = len(values)
+        own_position = np.arange(n)
+        block = max(1, QUERY_BLOCK_CELLS // n)
+        target_array = np.asarray(targets, dtype=np.int64)
+        results: List[Optional[List[int]]] = []
+
+        for start in range(0, len(target_array), block):
+            complement = target_array[start:start + block, None] - values[None, :]   # (B, n)
+            partner = np.searchsorted(values, complement)           # first slot >= complement
+            # an element can't pair with itself: skip to the next equal value
+            partner = np.where(partner == own_position, partner + 1, partner)
+            partner_clipped = np.minimum(partner, n - 1)
+            found = (partner < n) & (values[partner_clipped] == complement)
+
+            has_pair = found.any(axis=1)
+            first = found.argmax(axis=1)
+            for row in range(len(complement)):
+                if not has_pair[row]:
+                    results.append(None)
+                    continue
+                i = int(indices[first[row]])
+                j = int(indices[partner_clipped[row, first[row]]])
+                results.append([min(i, j), max(i, j)])
+        return results
+
+
+if __name__ == "__main__":
+    import random
+
+    test_cases = [
+        ([2, 7, 11, 15], 9),
+        ([3, 2, 4], 6),
+        ([3, 3], 6),
+        ([-1, -2, -3, -4, -5], -8),
+        ([2**70, 5, 2**70], 2**71),             # beyond int64 -> NumPy falls back
+    ]
+    functions = [twoSumMyOnePass, twoSumPopularOnePass, twoSumTwoPass,
+                 twoSumSorting, twoSumBruteForce, twoSumAuto]
+    if np is not None:
+        functions.append(twoSumNumpy)
+    for nums, target in test_cases:
+        for func in functions:
+            i, j = func(nums, target)
+            assert i != j and nums[i] + nums[j] == target, f"{func.__name__} failed for {nums}"
+        i, j = TwoSumIndex(nums).query(target)
+        assert i != j and nums[i] + nums[j] == target, f"TwoSumIndex failed for {nums}"
+        print(f"✓ All methods passed for {nums}, target={target}")
+
+    # query_many / all_pairs against brute force, with inserts and deletes
+    rng = random.Random(0)
+    nums = [rng.randrange(-50, 50) for _ in range(200)]
+    index = TwoSumIndex(nums)
+    live = dict(enumerate(nums))
+    for step in range(50):
+        if step % 2:
+            index.delete(victim := rng.choice(list(live)))
+            del live[victim]
+        else:
+            value = rng.randrange(-50, 50)
+            live[index.insert(value)] = value
+
+        targets = [rng.randrange(-120, 120) for _ in range(40)]
+        for target, pair in zip(targets, index.query_many(targets)):
+            expected = {(i, j) for i in live for j in live if i < j and live[i] + live[j] == target}
+            assert set(index.all_pairs(target)) == expected
+            if pair is None:
+                assert not expected
+            else:
+                assert tuple(pair) in expected
+    print("✓ TwoSumIndex query_many / all_pairs / insert / delete agree with brute force")
+
+    print("\n🎉 All tests passed!")
@@ -1,4 +1,13 @@
-from typing import List
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+from collections import Counter, defaultdict
+import codecs
+import heapq
+import mmap
+import random
+import string
+import unicodedata
+
+
 def valid_anagram_bruteForce(s: str, t: str) -> bool:
     if len(s) != len(t):
         return False
@@ -49,4 +58,333 @@ def valid_anagram_frequencyMap_array(s:str, t:str)->bool:
 
 
     
-    
\ No newline at end of file
+    
+
+
+# ============================================================
+# Unicode-aware version: any alphabet, picks the cheapest path
+# ============================================================
+# valid_anagram_frequencyMap_array assumes 'a'..'z': "Abc" gives a negative
+# index (Python quietly wraps it!), "é" is out of range. Real text isn't a-z,
+# so pick the path per input:
+#
+#   both lowercase a-z (str.isascii + isalpha + islower, all C-level scans)
+#       -> 26-slot count array, same as frequencyMap_array
+#   every char fits in one byte (latin-1: ASCII, accents like é/ü/ß...)
+#       -> 256-slot count array indexed by the byte
+#   anything else (Greek, CJK, emoji...)
+#       -> Counter of code points
+#
+# casefold=True   : "Listen" ~ "Silent", and "ß" ~ "ss" (casefold can change length!)
+# normalize=True  : NFC, so "é" typed as e + combining accent equals the single
+#                   char "é". Pure ASCII is already NFC, so it skips this.
+
+COUNT_SCAN_MIN_LEN = 128          # measured: from here 26 str.count scans win
+
+
+def _anagram_counts_26(s: str, t: str) -> bool:
+    if len(s) >= COUNT_SCAN_MIN_LEN:
+        # same 26 counters, but each one filled by a C-level scan
+        letters = string.ascii_lowercase
+        return list(map(s.count, letters)) == list(map(t.count, letters))
+    count = [0] * 26
+    for code in s.encode('ascii'):
+        count[code - 97] += 1
+    for code in t.encode('ascii'):
+        count[code - 97] -= 1
+    return not any(count)
+
+
+def _anagram_counts_256(s_bytes: bytes, t_bytes: bytes) -> bool:
+    count = [0] * 256
+    for code in s_bytes:
+        count[code] += 1
+    for code in t_bytes:
+        count[code] -= 1
+    return not any(count)
+
+
+def _prepare_text(text: str, casefold: bool, normalize: bool) -> str:
+    if casefold:
+        text = text.casefold()
+    if normalize and not text.isascii():
+        text = unicodedata.normalize('NFC', text)
+    return text
+
+
+def _is_lowercase_ascii(text: str) -> bool:
+    return text.isascii() and text.isalpha() and text.islower()
+
+
+def valid_anagram_unicode(s: str, t: str, casefold: bool = False,
+                          normalize: bool = True) -> bool:
+    s = _prepare_text(s, casefold, normalize)
+    t = _prepare_text(t, casefold, normalize)
+    if len(s) != len(t):
+        return False
+    if _is_lowercase_ascii(s) and _is_lowercase_ascii(t):
+        return _anagram_counts_26(s, t)
+    try:
+        s_bytes, t_bytes = s.encode('latin-1'), t.encode('latin-1')
+    except UnicodeEncodeError:
+        return Counter(s) == Counter(t)
+    return _anagram_counts_256(s_bytes, t_bytes)
+
+
+# ============================================================
+# Sliding-window search: every anagram of a pattern inside a text
+# ============================================================
+# Calling valid_anagram_* on every window is O(n * m). The count array can
+# ROLL instead: moving the window one step adds one char and removes one.
+#
+#   diff[c] = (count of c in window) - (count of c in pattern)
+#   mismatches = how many slots of diff are non-zero
+#   window is an anagram  <=>  mismatches == 0
+#
+# Each step changes two slots, and each change moves `mismatches` by at
+# most 1, so a step is O(1) and the whole search O(n).
+#
+# text "cbaebabacd", pattern "abc":
+#   window "cba" -> diff all 0 -> match at 0
+#   "bae": +e -c -> 2 mismatches
+#   ...                         -> match at 6 ("bac")
+#
+# Slots: 256 (one per byte) for bytes / mmap / ASCII str, a dict for other
+# str. Offsets are in the units of the text: chars for str, bytes otherwise.
+#
+# Searching BYTES for a non-ASCII str pattern compares UTF-8 byte multisets,
+# which can also match a window that starts or stops inside a character:
+# b"\xc3\xa9a\xc3\xa9" ("éaé") holds the bytes of "éa" at offsets 0, 1, 2,
+# but offset 1 starts on a continuation byte (0b10xxxxxx). Such windows are
+# skipped; ASCII patterns can't straddle a character, so they skip nothing.
+
+Text = Union[str, bytes, bytearray, memoryview, mmap.mmap]
+
+
+def _symbols(text: Text, *patterns):
+    """Turn text and patterns into sequences whose items index the slots."""
+    if isinstance(text, str):
+        if text.isascii() and all(p.isascii() for p in patterns):
+            return text.encode('ascii'), [p.encode('ascii') for p in patterns], [0] * 256
+        return text, list(patterns), defaultdict(int)
+    if isinstance(text, mmap.mmap):
+        text = memoryview(text)       # iterating an mmap gives 1-byte bytes, not ints
+    encoded = [p.encode('utf-8') if isinstance(p, str) else bytes(p) for p in patterns]
+    return text, encoded, [0] * 256
+
+
+def _needs_char_boundaries(text: Text, patterns) -> bool:
+    return not isinstance(text, str) and any(isinstance(p, str) and not p.isascii() for p in patterns)
+
+
+def _on_char_boundaries(data, start: int, stop: int) -> bool:
+    """data[start:stop] begins and ends between UTF-8 characters."""
+    return data[start] & 0xC0 != 0x80 and (stop == len(data) or data[stop] & 0xC0 != 0x80)
+
+
+def _bump(diff, symbol, delta: int) -> int:
+    """diff[symbol] += delta; return the change in the mismatch count."""
+    before = diff[symbol]
+    diff[symbol] = before + delta
+    if before == 0:
+        return 1
+    if before + delta == 0:
+        return -1
+    return 0
+
+
+def find_anagrams(text: Text, pattern: Union[str, bytes]) -> Iterator[int]:
+    """Offsets of every window of text that is an anagram of pattern, in order."""
+    char_boundaries = _needs_char_boundaries(text, [pattern])
+    data, (pattern,), diff = _symbols(text, pattern)
+    m = len(pattern)
+    if m == 0 or m > len(data):
+        return
+    mismatches = 0
+    for symbol in pattern:
+        mismatches += _bump(diff, symbol, -1)
+    for end, symbol in enumerate(data):
+        mismatches += _bump(diff, symbol, 1)
+        start = end - m + 1
+        if start > 0:
+            mismatches += _bump(diff, data[start - 1], -1)
+        if start >= 0 and mismatches == 0:
+            if not char_boundaries or _on_char_boundaries(data, start, end + 1):
+                yield start
+
+
+# Many patterns: one rolling count per pattern would make each step O(P).
+# Instead give every symbol a random 64-bit weight; a window's fingerprint
+# is the SUM of its weights. Sums don't care about order, so anagrams have
+# equal fingerprints, and with prefix sums any window is one subtraction:
+#
+#   fingerprint(text[i:j]) = prefix[j] - prefix[i]
+#
+# Per step that's one lookup per distinct pattern LENGTH (not per pattern).
+# A fingerprint hit is confirmed exactly (sorted compare), so a 1-in-2^64
+# collision can't produce a wrong offset.
+
+_MASK64 = (1 << 64) - 1
+
+
+class _Weights(dict):
+    def __init__(self, seed: int = 0x5EED):
+        super().__init__()
+        self._rng = random.Random(seed)
+
+    def __missing__(self, symbol):
+        weight = self[symbol] = self._rng.getrandbits(64)
+        return weight
+
+
+def find_anagrams_many(text: Text, patterns: Iterable[Union[str, bytes]],
+                       char_boundaries: Optional[bool] = None) -> Iterator[Tuple[int, Union[str, bytes]]]:
+    """
+    (offset, pattern) for every window that is an anagram of any pattern,
+    in offset order. Time: O(n * distinct pattern lengths + matches * m log m)
+
+    char_boundaries: only report byte windows that start and end between
+    UTF-8 characters. Default: on when bytes text meets a non-ASCII str pattern.
+    """
+    originals = [p for p in patterns if len(p) > 0]
+    if not originals:
+        return
+    if char_boundaries is None:
+        char_boundaries = _needs_char_boundaries(text, originals)
+    data, encoded, _ = _symbols(text, *originals)
+    weights = _Weights()
+
+    # length -> fingerprint -> [(sorted pattern, original pattern)]
+    by_length: Dict[int, Dict[int, list]] = defaultdict(lambda: defaultdict(list))
+    for pattern, original in zip(encoded, originals):
+        fingerprint = sum(weights[symbol] for symbol in pattern) & _MASK64
+        by_length[len(pattern)][fingerprint].append((sorted(pattern), original))
+    lengths = sorted(by_length)
+    longest = lengths[-1]
+
+    # ring buffer of the last longest + 1 prefix sums: prefix[i % size] = sum of data[:i]
+    size = longest + 1
+    prefix = [0] * size
+    running = 0
+    # a window starting at s is found by end s + longest at the latest, so a
+    # hit is only released once no longer window can still start before it
+    pending = []                              # heap of (offset, order found, pattern)
+    found = 0
+    for end, symbol in enumerate(data, start=1):
+        running = (running + weights[symbol]) & _MASK64
+        prefix[end % size] = running
+        for length in lengths:
+            if length > end:
+                break
+            candidates = by_length[length].get((running - prefix[(end - length) % size]) & _MASK64)
+            if candidates:
+                window = sorted(data[end - length:end])
+                for sorted_pattern, original in candidates:
+                    if sorted_pattern == window and (
+                            not char_boundaries or _on_char_boundaries(data, end - length, end)):
+                        heapq.heappush(pending, (end - length, found, original))
+                        found += 1
+        while pending and pending[0][0] <= end - longest:
+            offset, _, original = heapq.heappop(pending)
+            yield offset, original
+    while pending:
+        offset, _, original = heapq.heappop(pending)
+        yield offset, original
+
+
+def find_anagrams_in_file(path: str, patterns: Iterable[Union[str, bytes]],
+                          encoding: str = 'utf-8') -> Iterator[Tuple[int, Union[str, bytes]]]:
+    """
+    find_anagrams_many over a memory-mapped file; offsets are byte offsets.
+    With a UTF-8 file, hits never start or end inside a character.
+    """
+    patterns = list(patterns)
+    encoded = [p.encode(encoding) if isinstance(p, str) else p for p in patterns]
+    char_boundaries = (codecs.lookup(encoding).name == "utf-8"
+                       and _needs_char_boundaries(b"", patterns))
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:                 # mmap can't map an empty file
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            originals = dict(zip(encoded, patterns))
+            for offset, pattern in find_anagrams_many(mm, encoded, char_boundaries):
+                yield offset, originals[pattern]
+
+
+if __name__ == "__main__":
+    test_cases = [
+        ("anagram", "nagaram", True),
+        ("rat", "car", False),
+        ("", "", True),
+        ("a", "ab", False),
+    ]
+    for s, t, expected in test_cases:
+        assert valid_anagram_bruteForce(s, t) == expected
+        assert valid_anagram_sort(s, t) == expected
+        assert valid_anagram_frequencyMap(s, t) == expected
+        assert valid_anagram_frequencyMap_array(s, t) == expected
+        assert valid_anagram_unicode(s, t) == expected
+        print(f"✓ All methods passed for {s!r}, {t!r} → {expected}")
+
+    unicode_cases = [
+        # (s, t, casefold, expected)
+        ("Listen", "Silent", False, False),          # 'L' != 'l' by default
+        ("Listen", "Silent", True, True),
+        ("a1b2!", "2!b1a", False, True),              # ASCII, not just letters
+        ("crème", "mèrce", False, True),              # 256-slot path
+        ("cre\u0300me", "m\u00e8rce", False, True),   # decomposed vs composed è
+        ("αβγ", "γβα", False, True),
+        ("Straße", "STRASSE", True, True),            # casefold: ß -> ss
+        ("日本語", "語日本", False, True),                # Counter path
+        ("日本語", "語日日", False, False),
+        ("👍🏽x", "x👍🏽", False, True),
+    ]
+    for s, t, casefold, expected in unicode_cases:
+        assert valid_anagram_unicode(s, t, casefold=casefold) == expected, (s, t, casefold)
+    assert valid_anagram_unicode("cre\u0300me", "m\u00e8rce", normalize=False) is False
+    long_s = "thequickbrownfoxjumpsoverthelazydog" * 10
+    assert valid_anagram_unicode(long_s, long_s[::-1]) is True
+    assert valid_anagram_unicode(long_s, long_s[:-1] + "q") is False
+    print("✓ Unicode paths passed (case folding, NFC, latin-1, CJK, emoji)")
+
+    # Sliding-window search vs. checking every window directly
+    def every_window(text, pattern):
+        m = len(pattern)
+        return [i for i in range(len(text) - m + 1) if valid_anagram_sort(text[i:i + m], pattern)]
+
+    assert list(find_anagrams("cbaebabacd", "abc")) == [0, 6]
+    assert list(find_anagrams("abab", "ab")) == [0, 1, 2]
+    assert list(find_anagrams("ab", "abc")) == []
+    assert list(find_anagrams("παράδειγμα", "αρπ")) == [0]
+    assert list(find_anagrams(b"xxcabx", b"abc")) == [2]
+    # bytes text, non-ASCII pattern: offset 1 would start inside the first é
+    assert list(find_anagrams("éaé".encode(), "éa")) == [0, 2]
+    assert list(find_anagrams_many("éaé".encode(), ["éa"])) == [(0, "éa"), (2, "éa")]
+    assert list(find_anagrams(b"\xc3\xa9a\xc3\xa9", b"\xc3\xa9a")) == [0, 1, 2]   # raw bytes: no filter
+
+    rng = random.Random(19)
+    for _ in range(200):
+        text = "".join(rng.choice("abcé") for _ in range(rng.randint(0, 60)))
+        patterns = ["".join(rng.choice("abcé") for _ in range(rng.randint(1, 5))) for _ in range(4)]
+        for pattern in patterns:
+            assert list(find_anagrams(text, pattern)) == every_window(text, pattern), (text, pattern)
+        expected = sorted((i, p) for p in set(patterns) for i in every_window(text, p))
+        found = list(find_anagrams_many(text, set(patterns)))
+        assert sorted(found) == expected and found == sorted(found, key=lambda hit: hit[0]), (text, patterns)
+
+    import os
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "doc.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("the cat acted tac-tic, é-caté")
+        hits = list(find_anagrams_in_file(path, ["act", "été"]))
+        assert hits == [(4, "act"), (8, "act"), (14, "act"), (26, "act")], hits   # byte offsets: é is 2 bytes
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("éaé")
+        assert list(find_anagrams_in_file(path, ["éa"])) == [(0, "éa"), (2, "éa")]
+        open(path, "w").close()
+        assert list(find_anagrams_in_file(path, ["act"])) == []
+    print("✓ Sliding-window search passed (single, many patterns, bytes, mmap'd file)")
+
+    print("\n🎉 All tests passed!")
@@ -1,4 +1,17 @@
-from typing import List
+from typing import Iterable, List, Optional, Tuple, Union
+from itertools import islice
+import os
+import sys
+
+
+if __package__:
+    from ._lazy import lazy_import
+else:  # run as a script: the helper is one folder up
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from _lazy import lazy_import
+
+# NumPy is optional - only validate_boards needs it.
+np = lazy_import("numpy")
 
 def isValidSudoku(board: List[List[str]]) -> bool:
     """
@@ -151,4 +164,575 @@ def isValidSudoku_alternative(board: List[List[str]]) -> bool:
             seen.add(col_key)
             seen.add(box_key)
     
-    return True
\ No newline at end of file
+    return True
+
+
+# ============================================================
+# Bitmask approach: 27 ints instead of 27 sets
+# ============================================================
+#
+# A unit (row / col / box) holds at most the digits 1-9, so "which digits
+# have I seen" fits in 9 bits:
+#
+#   digit 5  ->  bit = 1 << (5 - 1) = 0b000010000
+#   seen 3, 5 ->  mask = 0b000010100
+#
+#   already seen?  mask & bit != 0
+#   mark as seen   mask |= bit
+#
+# Same scan as isValidSudoku, no set objects and no hashing. In CPython
+# that's only about as fast as the sets (the interpreter loop dominates) -
+# the real win is validate_boards below, the same masks for ALL boards at once.
+
+_DIGIT_BIT = {str(digit): 1 << (digit - 1) for digit in range(1, 10)}
+
+
+def isValidSudoku_bitmask(board: List[List[str]]) -> bool:
+    rows = [0] * 9
+    cols = [0] * 9
+    boxes = [0] * 9
+    for r in range(9):
+        row = board[r]
+        for c in range(9):
+            cell = row[c]
+            if cell == '.':
+                continue
+            bit = _DIGIT_BIT[cell]
+            box_index = (r // 3) * 3 + (c // 3)
+            if (rows[r] | cols[c] | boxes[box_index]) & bit:
+                return False
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[box_index] |= bit
+    return True
+
+
+def _first_conflict(cells) -> Optional[Tuple[int, int]]:
+    """(row, col) where the row-major bitmask scan first hits a repeat, else None."""
+    rows = [0] * 9
+    cols = [0] * 9
+    boxes = [0] * 9
+    for i, digit in enumerate(cells):
+        if digit == 0:
+            continue
+        r, c = divmod(i, 9)
+        bit = 1 << (digit - 1)
+        box_index = (r // 3) * 3 + (c // 3)
+        if (rows[r] | cols[c] | boxes[box_index]) & bit:
+            return r, c
+        rows[r] |= bit
+        cols[c] |= bit
+        boxes[box_index] |= bit
+    return None
+
+
+# ============================================================
+# Batch validation: many boards at once with NumPy
+# ============================================================
+#
+# Boards as one uint8 array of shape (N, 9, 9), 0 = empty. Then every step
+# runs over ALL boards at once instead of one Python loop per cell:
+#
+#   bits   = 1 << (digit - 1)                       (N, 9, 9) uint16, 0 for empty
+#   masks  = OR of the 9 bits in each unit          (N, 9) per unit type
+#   filled = how many non-empty cells in the unit   (N, 9)
+#
+#   a unit has a repeat  <=>  popcount(mask) < filled
+#   (two equal digits set the same bit, so the OR "loses" one)
+#
+# Boxes are rows after a reshape:  (N, 3, 3, 3, 3) -> swap the middle axes
+# -> (N, 9, 9) where row b is box b.
+
+BATCH_SIZE = 1 << 16              # boards converted per step for iterable input
+_POPCOUNT_8 = None
+
+
+def _popcount(masks: "np.ndarray") -> "np.ndarray":
+    # any unsigned width: look up every byte in a 256-entry table and add
+    global _POPCOUNT_8
+    if _POPCOUNT_8 is None:
+        _POPCOUNT_8 = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+    per_byte = _POPCOUNT_8[np.ascontiguousarray(masks).view(np.uint8)]
+    return per_byte.reshape(masks.shape + (masks.itemsize,)).sum(axis=-1)
+
+
+def boards_to_array(boards: Iterable[Union[str, List[List[str]]]]) -> "np.ndarray":
+    """
+    81-char strings ('.' or '0' = empty) or list-of-list boards -> uint8 (N, 9, 9).
+    """
+    if np is None:
+        raise ImportError("boards_to_array needs NumPy installed")
+    flat = ''.join(b if isinstance(b, str) else ''.join(map(''.join, b)) for b in boards)
+    raw = np.frombuffer(flat.encode('ascii'), dtype=np.uint8)
+    if raw.size % 81:
+        raise ValueError("every board needs exactly 81 cells")
+    digits = raw - ord('0')
+    digits[raw == ord('.')] = 0
+    if digits.size and digits.max() > 9:
+        raise ValueError("cells must be '1'-'9', '.' or '0'")
+    return digits.reshape(-1, 9, 9)
+
+
+def _boxes_as_rows(grid: "np.ndarray", n: int = 3) -> "np.ndarray":
+    side = n * n
+    return grid.reshape(-1, n, n, n, n).swapaxes(2, 3).reshape(-1, side, side)
+
+
+def _mask_dtype(side: int):
+    for dtype in (np.uint16, np.uint32, np.uint64):
+        if side <= np.iinfo(dtype).bits:
+            return dtype
+    raise ValueError(f"{side}x{side} boards don't fit 64-bit masks - use isValidSudokuN")
+
+
+def _validate_array(cells: "np.ndarray", n: int = 3) -> "np.ndarray":
+    side = n * n
+    if cells.ndim != 3 or cells.shape[1:] != (side, side):
+        raise ValueError(f"expected shape (N, {side}, {side}), got {cells.shape}")
+    if cells.size and cells.max() > side:
+        raise ValueError(f"cells must be 0 (empty) or 1-{side}")
+    dtype = _mask_dtype(side)
+    filled = cells > 0
+    shifts = np.where(filled, cells.astype(np.int64) - 1, 0).astype(dtype)
+    bits = np.where(filled, np.left_shift(dtype(1), shifts), dtype(0))
+
+    valid = np.ones(len(cells), dtype=bool)
+    for unit_bits, unit_filled in ((bits, filled),                                # rows
+                                   (bits.swapaxes(1, 2), filled.swapaxes(1, 2)),  # cols
+                                   (_boxes_as_rows(bits, n), _boxes_as_rows(filled, n))):
+        masks = np.bitwise_or.reduce(unit_bits, axis=2)
+        valid &= (_popcount(masks) == unit_filled.sum(axis=2)).all(axis=1)
+    return valid
+
+
+def validate_boards(boards, report_conflicts: bool = False):
+    """
+    Validate many boards. boards is a uint8 array (N, 9, 9) with 0 = empty,
+    or any iterable (e.g. a generator) of 81-char strings / list-of-list boards.
+    
+    Returns a bool array of length N, or with report_conflicts=True a pair
+    (valid, conflicts) where conflicts[i] is the (row, col) at which
+    isValidSudoku would have stopped, and (-1, -1) for valid boards.
+    """
+    if np is None:
+        raise ImportError("validate_boards needs NumPy installed")
+    if isinstance(boards, np.ndarray):
+        cells = boards.reshape(-1, 9, 9)
+        valid = _validate_array(cells)
+        invalid_cells = cells[~valid]
+    else:
+        # iterable input: convert and check in batches, so a generator of
+        # millions of boards never becomes one giant list of strings.
+        # Only the invalid boards are kept, for the conflict scan.
+        boards = iter(boards)
+        parts, invalid_parts = [], []
+        while True:
+            batch = list(islice(boards, BATCH_SIZE))
+            if not batch:
+                break
+            cells = boards_to_array(batch)
+            parts.append(_validate_array(cells))
+            if report_conflicts:
+                invalid_parts.append(cells[~parts[-1]])
+        valid = np.concatenate(parts) if parts else np.zeros(0, dtype=bool)
+        invalid_cells = np.concatenate(invalid_parts) if invalid_parts else None
+
+    if not report_conflicts:
+        return valid
+    conflicts = np.full((len(valid), 2), -1, dtype=np.int8)
+    invalid = np.flatnonzero(~valid)
+    if len(invalid):
+        # the row-major rescan is slow, but it only runs on invalid boards
+        for index, board in zip(invalid, invalid_cells.reshape(-1, 81).tolist()):
+            conflicts[index] = _first_conflict(board)
+    return valid, conflicts
+
+
+# ============================================================
+# Any size: n x n boxes, n^2 x n^2 board (9x9, 16x16, 25x25, ...)
+# ============================================================
+#
+# Nothing above really needs 9 - it's all derived from the box size n:
+#   side = n * n digits per unit, cells = side * side
+#   box of (r, c) = (r // n) * n + (c // n)
+#   one mask per unit with `side` bits (Python int: no size limit)
+#
+# Boards are FLAT sequences of ints, 0 = empty: a list, array('B'), bytes,
+# or a NumPy row - no list-of-lists, no one-char strings.
+# The unit of every cell only depends on n, so it's computed once per n.
+
+_unit_table_cache = {}
+
+
+def _unit_table(n: int) -> List[Tuple[int, int, int]]:
+    table = _unit_table_cache.get(n)
+    if table is None:
+        side = n * n
+        table = [(r, side + c, 2 * side + (r // n) * n + (c // n))
+                 for r in range(side) for c in range(side)]
+        _unit_table_cache[n] = table
+    return table
+
+
+def isValidSudokuN(cells, n: int = 3) -> bool:
+    side = n * n
+    if len(cells) != side * side:
+        raise ValueError(f"a box size {n} board needs {side * side} cells, got {len(cells)}")
+    masks = [0] * (3 * side)
+    for (row, col, box), digit in zip(_unit_table(n), cells):
+        if not digit:
+            continue
+        if not 1 <= digit <= side:
+            raise ValueError(f"cells must be 0 (empty) or 1-{side}")
+        bit = 1 << (digit - 1)
+        if (masks[row] | masks[col] | masks[box]) & bit:
+            return False
+        masks[row] |= bit
+        masks[col] |= bit
+        masks[box] |= bit
+    return True
+
+
+def validate_boards_n(cells, n: int) -> "np.ndarray":
+    """
+    Batch version of isValidSudokuN: cells has shape (N, side * side) or
+    (N, side, side). Vectorized up to side 64 (n <= 8, uint64 masks).
+    """
+    if np is None:
+        raise ImportError("validate_boards_n needs NumPy installed")
+    side = n * n
+    cells = np.asarray(cells)
+    return _validate_array(cells.reshape(-1, side, side), n)
+
+
+# ============================================================
+# Incremental board: O(1) edits instead of rescanning 81 cells
+# ============================================================
+#
+# An editor changes ONE cell at a time, so keep the per-unit state around:
+#   counts[unit][digit] : how often digit appears in that unit
+#                         (units 0-8 rows, 9-17 cols, 18-26 boxes)
+#   masks[unit]         : bit d-1 set <=> counts[unit][d] > 0
+#   duplicates          : sum over units/digits of (count - 1) when count > 1
+#
+# set / clear touch 3 units -> O(1). Valid <=> duplicates == 0, also O(1).
+# Conflicting cells are found among the 20 peers of the edited cell.
+
+ALL_DIGITS = 0x1FF
+Board = Union[str, List[List[str]]]
+
+_ROW = [i // 9 for i in range(81)]
+_COL = [i % 9 for i in range(81)]
+_BOX = [(r // 3) * 3 + (c // 3) for r in range(9) for c in range(9)]
+_UNITS = [(_ROW[i], 9 + _COL[i], 18 + _BOX[i]) for i in range(81)]
+_PEERS = [sorted({j for j in range(81) if j != i and
+                  (_ROW[j] == _ROW[i] or _COL[j] == _COL[i] or _BOX[j] == _BOX[i])})
+          for i in range(81)]
+_POPCOUNT = [bin(mask).count('1') for mask in range(1 << 9)]
+
+
+def _parse_board(board: Board) -> List[int]:
+    """81-char string ('.' / '0' empty) or list-of-list board -> 81 digits."""
+    flat = board if isinstance(board, str) else ''.join(map(''.join, board))
+    if len(flat) != 81:
+        raise ValueError("a board needs exactly 81 cells")
+    return [0 if ch in '.0' else int(ch) for ch in flat]
+
+
+class SudokuBoard:
+    def __init__(self, board: Optional[Board] = None):
+        self.cells = [0] * 81
+        self._counts = [[0] * 10 for _ in range(27)]
+        self._masks = [0] * 27
+        self._duplicates = 0
+        if board is not None:
+            for i, digit in enumerate(_parse_board(board)):
+                if digit:
+                    self.set_cell(i // 9, i % 9, digit)
+
+    def _add(self, i: int, digit: int) -> None:
+        for unit in _UNITS[i]:
+            count = self._counts[unit][digit]
+            if count:
+                self._duplicates += 1
+            else:
+                self._masks[unit] |= 1 << (digit - 1)
+            self._counts[unit][digit] = count + 1
+
+    def _remove(self, i: int, digit: int) -> None:
+        for unit in _UNITS[i]:
+            count = self._counts[unit][digit] - 1
+            if count:
+                self._duplicates -= 1
+            else:
+                self._masks[unit] &= ~(1 << (digit - 1))
+            self._counts[unit][digit] = count
+
+    def set_cell(self, r: int, c: int, digit: int) -> List[Tuple[int, int]]:
+        """Put digit at (r, c); return the peers it now clashes with (empty = fine)."""
+        if not 1 <= digit <= 9:
+            raise ValueError("digit must be 1-9 (use clear_cell to empty a cell)")
+        i = r * 9 + c
+        if self.cells[i]:
+            self._remove(i, self.cells[i])
+        self.cells[i] = digit
+        self._add(i, digit)
+        return [divmod(j, 9) for j in _PEERS[i] if self.cells[j] == digit]
+
+    def clear_cell(self, r: int, c: int) -> None:
+        i = r * 9 + c
+        if self.cells[i]:
+            self._remove(i, self.cells[i])
+            self.cells[i] = 0
+
+    def is_valid(self) -> bool:
+        return self._duplicates == 0
+
+    def candidates(self, r: int, c: int) -> List[int]:
+        """Digits that wouldn't clash at (r, c)."""
+        row, col, box = _UNITS[r * 9 + c]
+        free = ~(self._masks[row] | self._masks[col] | self._masks[box]) & ALL_DIGITS
+        return [d for d in range(1, 10) if free >> (d - 1) & 1]
+
+    def to_string(self) -> str:
+        return ''.join(str(d) if d else '.' for d in self.cells)
+
+    def solve(self) -> Optional["SudokuBoard"]:
+        solution = solve_sudoku(self.to_string())
+        return SudokuBoard(solution) if solution else None
+
+
+# ============================================================
+# Solver: same masks + naked singles + MRV backtracking
+# ============================================================
+#
+# candidates(cell) = ~(row mask | col mask | box mask) & 0b111111111
+#
+# 1. Naked singles: a cell with exactly ONE candidate (mask & (mask - 1) == 0)
+#    must take it. Placing it shrinks its peers' candidates -> repeat until
+#    nothing changes. Zero candidates anywhere -> dead end.
+# 2. MRV (minimum remaining values): guess in the cell with the FEWEST
+#    candidates - a 2-way guess is wrong half the time, a 9-way one 8/9.
+#    Try each candidate bit (lowest bit = mask & -mask) on a copy of the state.
+#
+# Cells are stored as bits while solving (digit d -> 1 << (d - 1)).
+
+def _propagate(cells: List[int], masks: List[int]) -> bool:
+    progress = True
+    while progress:
+        progress = False
+        for i in range(81):
+            if cells[i]:
+                continue
+            row, col, box = _UNITS[i]
+            free = ~(masks[row] | masks[col] | masks[box]) & ALL_DIGITS
+            if not free:
+                return False
+            if not free & (free - 1):
+                cells[i] = free
+                masks[row] |= free
+                masks[col] |= free
+                masks[box] |= free
+                progress = True
+    return True
+
+
+def _search(cells: List[int], masks: List[int]) -> Optional[List[int]]:
+    if not _propagate(cells, masks):
+        return None
+    best, best_free, best_count = -1, 0, 10
+    for i in range(81):
+        if cells[i]:
+            continue
+        row, col, box = _UNITS[i]
+        free = ~(masks[row] | masks[col] | masks[box]) & ALL_DIGITS
+        count = _POPCOUNT[free]
+        if count < best_count:
+            best, best_free, best_count = i, free, count
+            if count == 2:
+                break               # singles are gone, 2 is the minimum
+    if best < 0:
+        return cells                # no empty cell left: solved
+    row, col, box = _UNITS[best]
+    while best_free:
+        bit = best_free & -best_free
+        best_free ^= bit
+        child_cells, child_masks = cells[:], masks[:]
+        child_cells[best] = bit
+        child_masks[row] |= bit
+        child_masks[col] |= bit
+        child_masks[box] |= bit
+        solved = _search(child_cells, child_masks)
+        if solved:
+            return solved
+    return None
+
+
+def solve_sudoku(puzzle: Board) -> Optional[str]:
+    """Solved board as an 81-char string, or None (clashing givens / no solution)."""
+    cells = [0] * 81
+    masks = [0] * 27
+    for i, digit in enumerate(_parse_board(puzzle)):
+        if not digit:
+            continue
+        bit = 1 << (digit - 1)
+        row, col, box = _UNITS[i]
+        if (masks[row] | masks[col] | masks[box]) & bit:
+            return None
+        cells[i] = bit
+        masks[row] |= bit
+        masks[col] |= bit
+        masks[box] |= bit
+    solved = _search(cells, masks)
+    if solved is None:
+        return None
+    return ''.join(str(bit.bit_length()) for bit in solved)
+
+
+def solve_many(puzzles: Iterable[Board], workers: int = 1,
+               chunksize: int = 64) -> List[Optional[str]]:
+    """solve_sudoku for every puzzle, in order; workers > 1 uses a process pool."""
+    if workers == 1:
+        return [solve_sudoku(puzzle) for puzzle in puzzles]
+    # imported here: multiprocessing costs ~20 ms, too much for every isValidSudoku user
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        return list(pool.map(solve_sudoku, puzzles, chunksize=chunksize))
+
+
+if __name__ == "__main__":
+    solved = [[str((r * 3 + r // 3 + c) % 9 + 1) for c in range(9)] for r in range(9)]
+    example = [
+        ["5","3",".",".","7",".",".",".","."],
+        ["6",".",".","1","9","5",".",".","."],
+        [".","9","8",".",".",".",".","6","."],
+        ["8",".",".",".","6",".",".",".","3"],
+        ["4",".",".","8",".","3",".",".","1"],
+        ["7",".",".",".","2",".",".",".","6"],
+        [".","6",".",".",".",".","2","8","."],
+        [".",".",".","4","1","9",".",".","5"],
+        [".",".",".",".","8",".",".","7","9"]
+    ]
+    row_dup = [row[:] for row in example]
+    row_dup[0][2] = "5"                        # repeats the 5 at (0, 0)
+    box_dup = [row[:] for row in example]
+    box_dup[1][1] = "8"                        # box 0 meets the 8 at (2, 2) later
+    col_dup = [row[:] for row in solved]
+    col_dup[8][8] = col_dup[0][8]              # column 8 repeats at the last cell
+
+    test_cases = [
+        (solved, True, None),
+        (example, True, None),
+        (row_dup, False, (0, 2)),
+        (box_dup, False, (2, 2)),
+        (col_dup, False, (8, 8)),
+    ]
+    for board, expected, _ in test_cases:
+        assert isValidSudoku(board) == expected
+        assert isValidSudoku_alternative(board) == expected
+        assert isValidSudoku_bitmask(board) == expected
+    print("✓ Set, tuple-set and bitmask versions agree")
+
+    if np is not None:
+        boards = [board for board, _, _ in test_cases]
+        expected_valid = [valid for _, valid, _ in test_cases]
+        expected_conflicts = [conflict or (-1, -1) for _, _, conflict in test_cases]
+
+        as_strings = (''.join(map(''.join, board)) for board in boards)     # a generator
+        assert validate_boards(as_strings).tolist() == expected_valid
+        valid, conflicts = validate_boards(boards_to_array(boards), report_conflicts=True)
+        assert valid.tolist() == expected_valid
+        assert [tuple(c) for c in conflicts.tolist()] == expected_conflicts
+        valid, conflicts = validate_boards(iter(boards), report_conflicts=True)
+        assert [tuple(c) for c in conflicts.tolist()] == expected_conflicts
+        assert validate_boards([]).tolist() == []
+
+        import random
+        rng = random.Random(20)
+        many = []
+        for _ in range(500):
+            board = [row[:] for row in solved]
+            for _ in range(rng.randint(0, 3)):
+                board[rng.randrange(9)][rng.randrange(9)] = rng.choice("123456789.")
+            many.append(board)
+        assert validate_boards(many).tolist() == [isValidSudoku(b) for b in many]
+        print("✓ Batch validator matches isValidSudoku (arrays, strings, generators)")
+
+    # Incremental board: O(1) edits, conflicts, agrees with isValidSudoku
+    live = SudokuBoard(example)
+    assert live.is_valid()
+    assert live.set_cell(0, 2, 5) == [(0, 0)]
+    assert not live.is_valid()
+    live.clear_cell(0, 2)
+    assert live.is_valid()
+    assert live.candidates(0, 2) == [1, 2, 4]
+    assert live.set_cell(0, 2, 9) == [(2, 1)]             # the 9 in box 0
+
+    import random
+    rng = random.Random(21)
+    live = SudokuBoard()
+    grid = [["."] * 9 for _ in range(9)]
+    for _ in range(2000):
+        r, c = rng.randrange(9), rng.randrange(9)
+        if rng.random() < 0.3:
+            live.clear_cell(r, c)
+            grid[r][c] = "."
+        else:
+            digit = rng.randint(1, 9)
+            live.set_cell(r, c, digit)
+            grid[r][c] = str(digit)
+        assert live.is_valid() == isValidSudoku(grid)
+        assert live.to_string() == ''.join(map(''.join, grid))
+    print("✓ SudokuBoard edits stay in sync with isValidSudoku")
+
+    hard = [
+        "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..",
+        "..53.....8......2..7..1.5..4....53...1..7...6..32...8..6.5....9..4....3......97..",
+        "..............3.85..1.2.......5.7.....4...1...9.......5......73..2.1........4...9",
+    ]
+    solutions = solve_many(hard + [example])
+    for puzzle, solution in zip(hard + [''.join(map(''.join, example))], solutions):
+        assert solution is not None and isValidSudoku([list(solution[r * 9:r * 9 + 9]) for r in range(9)])
+        assert all(p in '.0' or p == s for p, s in zip(puzzle, solution)), "a given was changed"
+    assert solve_sudoku(''.join(map(''.join, row_dup))) is None             # clashing givens
+    assert solve_sudoku("12345678." + "." * 63 + "........9") is None       # (0, 8) has no digit left
+    assert solve_many(hard, workers=2) == solutions[:3]
+    assert SudokuBoard(hard[0]).solve().to_string() == solutions[0]
+    print("✓ Solver cracks hard puzzles (serial and process pool), rejects bad ones")
+
+    # Any box size: pattern-filled valid boards, then one clash each
+    def pattern_board(n):
+        side = n * n
+        return [(n * (r % n) + r // n + c) % side + 1 for r in range(side) for c in range(side)]
+
+    for n in (1, 2, 3, 4, 5, 9):
+        board = pattern_board(n)
+        assert isValidSudokuN(board, n), n
+        if n > 1:
+            broken = board[:]
+            broken[-1] = broken[-2]                # row clash in the last row
+            assert not isValidSudokuN(broken, n), n
+            broken = board[:]
+            broken[n * n] = broken[1]              # (1, 0) copies (0, 1): box clash
+            assert not isValidSudokuN(broken, n), n
+    flat_example = [int(ch) if ch != '.' else 0 for row in example for ch in row]
+    assert isValidSudokuN(flat_example) and isValidSudokuN(bytes(flat_example))
+    assert not isValidSudokuN([int(ch) if ch != '.' else 0 for row in row_dup for ch in row])
+
+    if np is not None:
+        for n in (2, 3, 4, 5, 8):
+            side = n * n
+            good = pattern_board(n)
+            batch = [good]
+            for _ in range(50):
+                board = good[:]
+                for _ in range(rng.randint(0, 2)):
+                    board[rng.randrange(side * side)] = rng.randint(0, side)
+                batch.append(board)
+            expected = [isValidSudokuN(board, n) for board in batch]
+            assert validate_boards_n(np.array(batch, dtype=np.uint8), n).tolist() == expected, n
+        print("✓ N²xN² validation (Python ints and NumPy up to 64x64)")
+    else:
+        print("✓ N²xN² validation (Python ints)")
+
+    print("\n🎉 All tests passed!")